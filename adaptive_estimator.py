@@ -0,0 +1,380 @@
+"""
+Adaptive Monte Carlo estimation of sprint outcomes.
+
+Instead of a fixed number of runs, ``estimate`` simulates in batches and
+stops as soon as the confidence interval of every requested metric is as
+narrow as asked. Two variance reduction designs can be combined:
+
+- Antithetic sampling pairs each backlog with its mirror image, generated
+  from the same stream with every uniform ``u`` replaced by ``1 - u`` (see
+  ``AntitheticRandom``). Urgent-heavy backlogs are paired with calm ones, and
+  the pair average varies less than two independent runs.
+- Stratified sampling splits backlogs by the number of urgent (Critical or
+  High) tickets and the number of dependencies. The probability of each
+  stratum follows from the generator's binomial draws, and runs are
+  allocated to strata in proportion to it. Candidate backlogs are drawn in
+  sequence and queued in their stratum until it needs a run.
+
+With logging off the simulator uses no randomness of its own, so a run is
+fully determined by its backlog stream and results do not depend on how
+runs are spread over worker processes. The report compares the runs used
+with the number a plain Monte Carlo would need for the same precision.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from sprint_simulator import SprintSimulator
+from team_members import clone_team
+
+
+METRICS = ("completion_rate", "velocity", "escalations")
+URGENT = frozenset(("Critical", "High"))
+
+
+class AntitheticRandom(random.Random):
+    """
+    ``random.Random`` whose draws can be mirrored.
+
+    Every draw, integers included, uses exactly one uniform ``u`` by
+    inverse transform, so a ``mirrored`` stream with the same seed replaces
+    each ``u`` with ``1 - u`` in lockstep: ``choices``, ``choice`` and
+    ``randint`` pick from the opposite end of their range.
+    """
+
+    def __init__(self, seed=None, mirrored=False):
+        self.mirrored = mirrored
+        super().__init__(seed)
+
+    def random(self):
+        u = super().random()
+        return 1.0 - u if self.mirrored else u
+
+    def _randbelow(self, n):
+        return min(int(self.random() * n), n - 1)
+
+
+class _Moments:
+    """Running count, mean and variance (Welford)."""
+
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+
+def _binomial_bins(n, p, bins):
+    """
+    Split Binomial(``n``, ``p``) into up to ``bins`` count ranges of roughly
+    equal probability.
+
+    :return: List of ``(upper_count, probability)``; a count ``k`` falls in
+        the first bin whose upper count is at least ``k``.
+    """
+    ranges = []
+    cdf = 0.0
+    mass = 0.0
+    for k in range(n + 1):
+        pk = math.comb(n, k) * p ** k * (1 - p) ** (n - k)
+        cdf += pk
+        mass += pk
+        if cdf >= (len(ranges) + 1) / bins - 1e-12 or k == n:
+            ranges.append((k, mass))
+            mass = 0.0
+    # Fold a dust bin left by rounding at the top into its neighbour
+    if len(ranges) > 1 and ranges[-1][1] < 1e-9:
+        (_, last), (upper, prev) = ranges.pop(), ranges.pop()
+        ranges.append((n, prev + last))
+    return ranges
+
+
+class BacklogStrata:
+    """
+    Strata of generated backlogs by urgent-ticket and dependency counts.
+
+    Priorities are drawn independently per ticket with the generator's
+    weights and each ticket gets a dependency with probability 0.1 (unless
+    it draws itself), so both counts are binomial and independent.
+    """
+
+    def __init__(self, num_tickets, bins=3):
+        from ticket_system import TicketGenerator
+
+        weights = dict(zip(TicketGenerator.PRIORITY_LEVELS, TicketGenerator.PRIORITY_WEIGHTS))
+        p_urgent = sum(weights[p] for p in URGENT) / sum(weights.values())
+        p_dependency = 0.1 * (num_tickets - 1) / num_tickets if num_tickets else 0.0
+        self.urgent = _binomial_bins(num_tickets, p_urgent, bins)
+        self.dependencies = _binomial_bins(num_tickets, p_dependency, bins)
+        self.weights = [pu * pd for _, pu in self.urgent for _, pd in self.dependencies]
+
+    def __len__(self):
+        return len(self.weights)
+
+    @staticmethod
+    def _bin(ranges, count):
+        return next(i for i, (upper, _) in enumerate(ranges) if count <= upper)
+
+    def classify(self, tickets):
+        """Return the stratum index of a backlog."""
+        urgent = sum(t.priority in URGENT for t in tickets)
+        dependencies = sum(len(t.dependencies) for t in tickets)
+        return self._bin(self.urgent, urgent) * len(self.dependencies) + self._bin(self.dependencies, dependencies)
+
+
+def _backlog(num_tickets, seed, candidate, mirrored):
+    from ticket_system import TicketGenerator
+
+    rng = AntitheticRandom(f"{seed}:{candidate}", mirrored=mirrored)
+    return TicketGenerator(rng=rng).generate_ticket_store(num_tickets).views()
+
+
+def _run_units(team, num_tickets, sprint_length, seed, engine, units):
+    """
+    Simulate ``units`` (lists of ``(candidate, mirrored)`` runs) and return
+    per-run metric tuples for each unit.
+    """
+    results = []
+    for unit in units:
+        runs = []
+        for candidate, mirrored in unit:
+            sim = SprintSimulator(clone_team(team), sprint_length_days=sprint_length, engine=engine, verbosity="off")
+            sim.sprint_backlog = _backlog(num_tickets, seed, candidate, mirrored)
+            sim.run_complete_simulation()
+            metrics = sim.metrics
+            total = metrics["total_tickets"]
+            runs.append((
+                metrics["completed_tickets"] / total if total else 0.0,
+                metrics["velocity"],
+                metrics["escalations"],
+            ))
+        results.append(runs)
+    return results
+
+
+def estimate(
+    team,
+    num_tickets=20,
+    sprint_length=10,
+    seed=0,
+    metrics=METRICS,
+    relative_precision=0.01,
+    precision=None,
+    confidence=0.95,
+    antithetic=False,
+    stratify=False,
+    strata_bins=3,
+    batch_size=200,
+    min_runs=100,
+    max_runs=100_000,
+    processes=None,
+    engine="object",
+):
+    """
+    Estimate mean sprint outcomes to a target precision.
+
+    :param team: List of TeamMember instances; every run uses a fresh clone.
+    :param num_tickets: Backlog size generated for each run.
+    :param sprint_length: Sprint length in business days.
+    :param seed: Base seed; candidate backlog ``c`` is generated from
+        ``AntitheticRandom(f"{seed}:{c}")``.
+    :param metrics: Subset of ``METRICS`` to estimate and stop on.
+    :param relative_precision: Target confidence interval half-width as a
+        fraction of the mean.
+    :param precision: Optional dict of absolute half-widths per metric,
+        overriding ``relative_precision`` (useful for means near zero).
+    :param confidence: Confidence level of the intervals.
+    :param antithetic: Run every backlog together with its mirrored twin.
+    :param stratify: Allocate runs over ``BacklogStrata`` proportionally.
+    :param strata_bins: Bins per stratification variable.
+    :param batch_size: Simulations between convergence checks.
+    :param min_runs: Simulations before stopping is considered.
+    :param max_runs: Upper bound on simulations.
+    :param processes: Worker processes (defaults to the CPU count). ``1``
+        runs everything in the calling process.
+    :param engine: SprintSimulator engine.
+    :return: Dict with per-metric ``mean``, ``ci_low``, ``ci_high``,
+        ``half_width`` and ``target``, the ``runs`` used, whether the run
+        ``converged``, and ``naive_runs``: the plain Monte Carlo runs needed
+        for the same precision, estimated from the per-run variance.
+    """
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metrics {sorted(unknown)}; expected a subset of {METRICS}")
+    columns = [METRICS.index(m) for m in metrics]
+    precision = precision or {}
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    processes = processes or os.cpu_count() or 1
+    team = clone_team(team)
+    per_unit = 2 if antithetic else 1
+
+    strata = BacklogStrata(num_tickets, strata_bins) if stratify else None
+    weights = strata.weights if strata else [1.0]
+    pools = [deque() for _ in weights]
+    next_candidate = 0
+    unit_stats = [[_Moments() for _ in metrics] for _ in weights]
+    run_stats = [_Moments() for _ in metrics]
+    allocated = [0] * len(weights)
+
+    def take(stratum):
+        """Return the next unused candidate backlog of ``stratum``."""
+        nonlocal next_candidate
+        if strata is None:
+            next_candidate += 1
+            return next_candidate - 1
+        while not pools[stratum]:
+            tickets = _backlog(num_tickets, seed, next_candidate, False)
+            pools[strata.classify(tickets)].append(next_candidate)
+            next_candidate += 1
+        return pools[stratum].popleft()
+
+    def allocate(count):
+        """Assign ``count`` units to strata, keeping counts proportional to weights."""
+        plan = []
+        total = sum(allocated) + count
+        for _ in range(count):
+            # Every stratum needs two units for a variance estimate
+            needy = [s for s, n in enumerate(allocated) if n < 2 and weights[s] > 0]
+            if needy:
+                stratum = needy[0]
+            else:
+                stratum = max(range(len(weights)), key=lambda s: weights[s] * total - allocated[s])
+            allocated[stratum] += 1
+            plan.append(stratum)
+        return plan
+
+    def summary():
+        report = {}
+        for j, name in enumerate(metrics):
+            mean = sum(w * stats[j].mean for w, stats in zip(weights, unit_stats))
+            variance = sum(
+                w * w * stats[j].variance / stats[j].n for w, stats in zip(weights, unit_stats) if stats[j].n
+            )
+            half = z * math.sqrt(variance)
+            target = precision.get(name, relative_precision * abs(mean))
+            report[name] = {
+                "mean": mean,
+                "ci_low": mean - half,
+                "ci_high": mean + half,
+                "half_width": half,
+                "target": target,
+            }
+        return report
+
+    pool = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+    batches = 0
+    try:
+        while True:
+            units = max(1, min(batch_size, max_runs - run_stats[0].n) // per_unit)
+            plan = allocate(units)
+            work = [[(c, False), (c, True)] if antithetic else [(c, False)] for c in map(take, plan)]
+            args = (team, num_tickets, sprint_length, seed, engine)
+            if pool is None:
+                results = _run_units(*args, work)
+            else:
+                chunk = math.ceil(len(work) / processes)
+                futures = [
+                    pool.submit(_run_units, *args, work[i:i + chunk]) for i in range(0, len(work), chunk)
+                ]
+                results = [runs for f in futures for runs in f.result()]
+            batches += 1
+
+            # An antithetic twin counts in its original's stratum; the pair
+            # average is still unbiased for the stratum's share of the mean.
+            for stratum, runs in zip(plan, results):
+                for j, col in enumerate(columns):
+                    values = [run[col] for run in runs]
+                    unit_stats[stratum][j].add(sum(values) / len(values))
+                    for value in values:
+                        run_stats[j].add(value)
+
+            report = summary()
+            runs_done = run_stats[0].n
+            converged = (
+                runs_done >= min_runs
+                and all(stats[0].n >= 2 for stats in unit_stats)
+                and all(m["half_width"] <= m["target"] for m in report.values())
+            )
+            if converged or runs_done + per_unit > max_runs:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    naive = 0
+    for j, name in enumerate(metrics):
+        target = report[name]["target"]
+        spread = z * math.sqrt(run_stats[j].variance)
+        needed = math.ceil((spread / target) ** 2) if target > 0 else (0 if spread == 0 else math.inf)
+        naive = max(naive, needed)
+    return {
+        "metrics": report,
+        "runs": runs_done,
+        "batches": batches,
+        "converged": converged,
+        "naive_runs": naive,
+        "savings": naive / runs_done if runs_done and naive != math.inf else None,
+        "design": {
+            "antithetic": antithetic,
+            "strata": len(weights) if strata else None,
+            "confidence": confidence,
+            "seed": seed,
+        },
+    }
+
+
+def main():
+    from generate_pre_sprint_analysis import build_team
+
+    parser = argparse.ArgumentParser(
+        description="Estimate sprint outcomes with adaptive Monte Carlo and variance reduction."
+    )
+    parser.add_argument("-n", "--num-tickets", type=int, default=20, help="Tickets generated per run.")
+    parser.add_argument("-d", "--days", type=int, default=10, help="Sprint length in business days.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Base random seed.")
+    parser.add_argument("--precision", type=float, default=0.01, help="Relative CI half-width target.")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level.")
+    parser.add_argument("--antithetic", action="store_true", help="Use antithetic backlog pairs.")
+    parser.add_argument("--stratify", action="store_true", help="Stratify over priority mix and dependencies.")
+    parser.add_argument("--batch-size", type=int, default=200, help="Simulations per batch.")
+    parser.add_argument("--max-runs", type=int, default=100_000, help="Simulation budget.")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="Worker processes.")
+    parser.add_argument("-o", "--output", default="estimate.json", help="Output JSON file name.")
+    args = parser.parse_args()
+
+    report = estimate(
+        build_team(),
+        num_tickets=args.num_tickets,
+        sprint_length=args.days,
+        seed=args.seed,
+        relative_precision=args.precision,
+        confidence=args.confidence,
+        antithetic=args.antithetic,
+        stratify=args.stratify,
+        batch_size=args.batch_size,
+        max_runs=args.max_runs,
+        processes=args.processes,
+    )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
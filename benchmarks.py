@@ -0,0 +1,247 @@
+"""
+Performance benchmarks for ticket generation, triage, simulation and metrics.
+
+Every case runs with fixed seeds on a synthetic team and backlog. Each case
+is timed on its own (best of ``repeat`` runs) and then run once more under
+``tracemalloc`` to record peak traced memory and the number of memory blocks
+allocated. Results go to a JSON file and can be compared against a stored
+baseline; the command exits non-zero when a case is slower or uses more
+memory than its baseline allows.
+
+    python benchmarks.py --suite quick --baseline benchmark_baseline.json
+    python benchmarks.py --suite full --output bench_full.json
+    python benchmarks.py --suite quick --update-baseline benchmark_baseline.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+from sprint_planning import simulate_triage_meeting
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import TicketGenerator
+
+
+SEED = 2024
+EPOCH = date(2024, 1, 1)
+
+# (benchmark, tickets, team size)
+SUITES = {
+    "quick": [
+        ("generate_tickets", 100, 5),
+        ("generate_tickets", 10_000, 5),
+        ("triage", 100, 5),
+        ("triage", 5_000, 50),
+        ("simulation", 100, 5),
+        ("simulation", 5_000, 50),
+        ("simulation_quiet", 5_000, 50),
+        ("metrics_report", 5_000, 50),
+    ],
+    "full": [
+        ("generate_tickets", 100, 5),
+        ("generate_tickets", 10_000, 5),
+        ("generate_tickets", 1_000_000, 5),
+        ("triage", 100, 5),
+        ("triage", 10_000, 50),
+        ("triage", 100_000, 5_000),
+        ("simulation", 100, 5),
+        ("simulation", 10_000, 50),
+        ("simulation", 100_000, 500),
+        ("simulation", 100_000, 5_000),
+        ("simulation_quiet", 10_000, 50),
+        ("simulation_quiet", 100_000, 500),
+        ("metrics_report", 10_000, 50),
+        ("metrics_report", 100_000, 5_000),
+    ],
+}
+
+_ROLES = (
+    ("Senior Developer/DevOps Engineer", 9, ["Python", "Java", "Infrastructure Automation"]),
+    ("Senior Information Systems Engineer", 8, ["Google Workspace", "Email Architecture"]),
+    ("Junior Information Systems Engineer", 5, ["Slack Administration", "Email Support"]),
+    ("Junior Information Systems Engineer", 4, ["User Provisioning", "Permissions Management"]),
+    ("Project Manager", 7, ["Sprint Planning", "Backlog Management"]),
+)
+
+
+def build_team(size):
+    """Return a deterministic roster of ``size`` members cycling through roles."""
+    return [
+        TeamMember(
+            name=f"member_{i}",
+            role=_ROLES[i % len(_ROLES)][0],
+            skill_level=_ROLES[i % len(_ROLES)][1],
+            specialties=list(_ROLES[i % len(_ROLES)][2]),
+            availability=1.0 if i % 7 else 0.8,
+        )
+        for i in range(size)
+    ]
+
+
+def _backlog(tickets):
+    if tickets > 100_000:
+        return TicketGenerator().generate_bulk(tickets, seed=SEED).views()
+    return TicketGenerator(rng=random.Random(SEED)).generate_realistic_tickets(tickets)
+
+
+def _simulator(tickets, team_size, verbosity="full"):
+    sim = SprintSimulator(build_team(team_size), rng=random.Random(SEED), epoch=EPOCH, verbosity=verbosity)
+    sim.sprint_backlog = _backlog(tickets)
+    return sim
+
+
+def prepare(benchmark, tickets, team_size):
+    """
+    Build the untimed inputs of one case and return the callable to measure.
+
+    Called again before every measured run so runs never share mutated state.
+    """
+    if benchmark == "generate_tickets":
+        generator = TicketGenerator(rng=random.Random(SEED))
+        return lambda: generator.generate_realistic_tickets(tickets)
+    if benchmark == "triage":
+        backlog = _backlog(tickets)
+        team = build_team(team_size)
+        return lambda: simulate_triage_meeting(backlog, team)
+    if benchmark == "simulation":
+        return _simulator(tickets, team_size).run_complete_simulation
+    if benchmark == "simulation_quiet":
+        # Same run as "simulation" with logging off, for Monte Carlo-style use
+        return _simulator(tickets, team_size, verbosity="off").run_complete_simulation
+    if benchmark == "metrics_report":
+        sim = _simulator(tickets, team_size)
+        sim.run_complete_simulation()
+        return sim.generate_metrics_report
+    raise ValueError(f"Unknown benchmark {benchmark!r}")
+
+
+def case_name(benchmark, tickets, team_size):
+    return f"{benchmark}[tickets={tickets},team={team_size}]"
+
+
+def measure(benchmark, tickets, team_size, repeat=3):
+    """
+    Measure one case.
+
+    :return: Dict with best and mean wall time in seconds, peak traced memory
+        in bytes and the number of blocks allocated during the run.
+    """
+    times = []
+    for _ in range(repeat):
+        func = prepare(benchmark, tickets, team_size)
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        del func
+
+    func = prepare(benchmark, tickets, team_size)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    allocations = sum(
+        max(0, stat.count_diff) for stat in after.compare_to(before, "lineno")
+    )
+    return {
+        "benchmark": benchmark,
+        "tickets": tickets,
+        "team_size": team_size,
+        "wall_seconds": min(times),
+        "mean_seconds": sum(times) / len(times),
+        "peak_memory_bytes": peak - base,
+        "allocated_blocks": allocations,
+    }
+
+
+def run_suite(cases, repeat=3, progress=None):
+    """Run ``cases`` (``(benchmark, tickets, team_size)`` tuples) and return results."""
+    results = {}
+    for case in cases:
+        name = case_name(*case)
+        results[name] = measure(*case, repeat=repeat)
+        if progress is not None:
+            r = results[name]
+            progress(f"{name}: {r['wall_seconds']:.4f}s, peak {r['peak_memory_bytes'] / 1e6:.1f} MB")
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+# Absolute slack so timer noise on millisecond-sized cases never fails a run
+SLACK = {"wall_seconds": 0.01, "peak_memory_bytes": 64 * 1024}
+
+
+def compare_to_baseline(report, baseline, time_threshold=2.0, memory_threshold=1.5):
+    """
+    Compare a report against a baseline report.
+
+    :param time_threshold: Allowed ratio of best wall time to baseline.
+    :param memory_threshold: Allowed ratio of peak memory to baseline.
+    :return: List of human-readable regression messages (empty when passing).
+    """
+    failures = []
+    for name, result in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        for field, threshold in (
+            ("wall_seconds", time_threshold),
+            ("peak_memory_bytes", memory_threshold),
+        ):
+            allowed = max(reference[field] * threshold, reference[field] + SLACK[field])
+            if result[field] > allowed:
+                failures.append(
+                    f"{name}: {field} {result[field]:.6g} exceeds {threshold}x baseline "
+                    f"{reference[field]:.6g}"
+                )
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run sprint simulator performance benchmarks.")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="quick", help="Case matrix to run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is kept.")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="Results JSON file.")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against.")
+    parser.add_argument("--update-baseline", metavar="PATH", help="Also write the results as a new baseline.")
+    parser.add_argument("--time-threshold", type=float, default=2.0, help="Allowed slowdown ratio.")
+    parser.add_argument("--memory-threshold", type=float, default=1.5, help="Allowed peak memory ratio.")
+    args = parser.parse_args(argv)
+
+    report = run_suite(SUITES[args.suite], repeat=args.repeat, progress=print)
+    for path in filter(None, (args.output, args.update_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        failures = compare_to_baseline(
+            report, baseline, args.time_threshold, args.memory_threshold
+        )
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
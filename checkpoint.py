@@ -0,0 +1,322 @@
+"""
+Binary checkpoints of SprintSimulator state.
+
+A checkpoint captures everything needed to continue a sprint exactly where it
+stopped: configuration, current day, backlog and completed work, team
+workloads and completed tickets, the random stream state, the dependency
+schedule, the retained event log with its global cursor and per-kind
+counts, and the running metrics with each open ticket's arrival day. Continuing from a checkpoint produces the same tickets, events and
+metrics as an uninterrupted run.
+
+File layout::
+
+    b"SPCK1\\n" | header length (u64) | JSON header | padding | sections
+
+Ticket fields and events are stored as the raw bytes of their typed columns
+(see ``TicketStore`` and ``EventLog``) and string tables as length-prefixed
+UTF-8 (see ``serialization``), each section aligned to 8 bytes. Loading
+memory-maps the file and copies each column in one step, so restoring a large
+backlog never parses tickets one by one; restored tickets are ``TicketView``
+rows of one store.
+
+``fork`` serializes a simulator once and restores any number of independent
+branches from the same bytes, so what-if branches continue from the shared
+day instead of replaying it.
+
+Event sinks and profilers are not part of a checkpoint; pass new ones when
+loading. Simulators drawing from the global ``random`` module (``rng=None``)
+cannot have their stream restored.
+"""
+
+import json
+import mmap
+import random
+import struct
+from array import array
+from datetime import date
+
+from dependency_index import DependencyIndex
+from events import EventLog
+from running_metrics import RunningMetrics
+from serialization import decode_strings, encode_strings, tuples_from_json
+from ticket_scheduler import TicketSchedule
+from ticket_store import TicketStore, TicketView
+
+
+MAGIC = b"SPCK1\n"
+VERSION = 2
+_LENGTH = struct.Struct("<Q")
+_ALIGN = 8
+
+
+def _store_for(sim):
+    """Return a TicketStore holding every ticket and the rows of each list."""
+    tickets = list(sim.completed_work) + list(sim.sprint_backlog)
+    stores = {id(t.store) for t in tickets if isinstance(t, TicketView)}
+    if len(stores) == 1 and all(isinstance(t, TicketView) for t in tickets):
+        # Views of one store: dump its columns as they are
+        store = tickets[0].store
+        rows = lambda items: array("i", (t.row for t in items))
+    else:
+        store = TicketStore.from_tickets(tickets)
+        positions = {t.ticket_id: row for row, t in enumerate(tickets)}
+        rows = lambda items: array("i", (positions[t.ticket_id] for t in items))
+    return store, rows
+
+
+def dumps(sim):
+    """
+    Serialize ``sim`` to checkpoint bytes.
+
+    :param sim: SprintSimulator, typically between days.
+    :return: bytes
+    """
+    if sim.engine == "event":
+        raise ValueError("The event engine keeps in-flight work between days and cannot be checkpointed")
+    store, rows = _store_for(sim)
+    sections = {}
+    ids, tables, columns = store.state()
+    sections["ticket_ids"] = encode_strings(ids)
+    for name, values in tables.items():
+        sections[f"table{name}"] = encode_strings(values)
+    for name, column in columns.items():
+        sections[f"column_{name}"] = column
+    sections["backlog_rows"] = rows(sim.sprint_backlog)
+    sections["completed_rows"] = rows(sim.completed_work)
+    sections["backlog_arrivals"] = array(
+        "i", (sim._arrivals.get(t.ticket_id, -1) for t in sim.sprint_backlog)
+    )
+
+    first, counts, event_tables, event_columns = sim.events.state()
+    for name, column in event_columns.items():
+        sections[f"event_{name}"] = column
+    sections["event_members"] = encode_strings(event_tables["members"])
+    sections["event_tickets"] = encode_strings(event_tables["tickets"])
+
+    sections["member_completed"] = encode_strings(
+        [tid for m in sim.team for tid in m.completed_tickets]
+    )
+
+    schedule = None
+    if sim.schedule is not None:
+        try:
+            sections["schedule_rows"] = rows(sim.schedule.order)
+            schedule = {"levels": sim.schedule.levels, "cycles": sim.schedule.cycles}
+        except (KeyError, AttributeError):
+            schedule = None
+
+    rng_state = sim.rng.getstate() if isinstance(sim.rng, random.Random) else None
+    header = {
+        "version": VERSION,
+        "engine": sim.engine,
+        "verbosity": sim.verbosity,
+        "escalation_threshold": sim.escalation_threshold,
+        "sprint_length": sim.sprint_length,
+        "current_day": sim.current_day,
+        "epoch": sim.epoch.toordinal(),
+        "log_retention": sim.events.retain,
+        "rng_state": rng_state,
+        "team": [
+            {
+                "name": m.name,
+                "role": m.role,
+                "skill_level": m.skill_level,
+                "specialties": list(m.specialties),
+                "availability": m.availability,
+                "current_workload": m.current_workload,
+                "completed": len(m.completed_tickets),
+            }
+            for m in sim.team
+        ],
+        "events": {"first": first, "counts": counts, "details": event_tables["details"]},
+        "schedule": schedule,
+        "external_open": sorted(sim.external_open),
+        "running": sim.running.state(),
+        "synced": not sim._backlog_replaced(),
+        "sections": {},
+    }
+
+    offset = 0
+    for name, data in sections.items():
+        size = len(data) * (data.itemsize if isinstance(data, array) else 1)
+        header["sections"][name] = [offset, size]
+        offset += size + (-size % _ALIGN)
+
+    encoded = json.dumps(header, separators=(",", ":")).encode()
+    start = len(MAGIC) + _LENGTH.size + len(encoded)
+    parts = [MAGIC, _LENGTH.pack(len(encoded)), encoded, b"\0" * (-start % _ALIGN)]
+    for data in sections.values():
+        raw = data.tobytes() if isinstance(data, array) else data
+        parts.append(raw)
+        parts.append(b"\0" * (-len(raw) % _ALIGN))
+    return b"".join(parts)
+
+
+def save(sim, path):
+    """Write a checkpoint of ``sim`` to ``path`` and return its size in bytes."""
+    data = dumps(sim)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def loads(data, rng=None, sink=None, **kwargs):
+    """
+    Restore a SprintSimulator from checkpoint bytes (or any buffer).
+
+    :param rng: Random stream for the restored simulator; by default a new
+        ``random.Random`` continuing the saved stream.
+    :param sink: Optional event sink for events emitted after the restore.
+    :param kwargs: Extra SprintSimulator options such as ``profile``.
+    """
+    from sprint_simulator import SprintSimulator
+
+    view = memoryview(data)
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a sprint simulator checkpoint")
+    (length,) = _LENGTH.unpack(view[len(MAGIC):len(MAGIC) + _LENGTH.size])
+    start = len(MAGIC) + _LENGTH.size
+    header = json.loads(bytes(view[start:start + length]))
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {header['version']}")
+    base = start + length + (-(start + length) % _ALIGN)
+
+    def section(name):
+        offset, size = header["sections"][name]
+        return view[base + offset:base + offset + size]
+
+    def ints(name):
+        values = array("i")
+        values.frombytes(section(name))
+        return values
+
+    store = TicketStore.from_state(
+        decode_strings(section("ticket_ids")),
+        {name: decode_strings(section(f"table{name}")) for name in TicketStore.TABLES},
+        {name: section(f"column_{name}") for name in TicketStore.COLUMNS},
+    )
+
+    from models import TeamMember
+
+    completed_ids = iter(decode_strings(section("member_completed")))
+    team = []
+    for spec in header["team"]:
+        done = spec.pop("completed")
+        member = TeamMember(**spec)
+        member.completed_tickets = [next(completed_ids) for _ in range(done)]
+        team.append(member)
+
+    if rng is None and header["rng_state"] is not None:
+        rng = random.Random()
+        state = header["rng_state"]
+        rng.setstate((state[0], tuple(state[1]), state[2]))
+
+    sim = SprintSimulator(
+        team,
+        sprint_length_days=header["sprint_length"],
+        rng=rng,
+        engine=header["engine"],
+        sink=sink,
+        log_retention=header["log_retention"],
+        epoch=date.fromordinal(header["epoch"]),
+        verbosity=header["verbosity"],
+        escalation_threshold=header["escalation_threshold"],
+        **kwargs,
+    )
+    sim.current_day = header["current_day"]
+    sim.sprint_backlog = [TicketView(store, row) for row in ints("backlog_rows")]
+    sim.completed_work = [TicketView(store, row) for row in ints("completed_rows")]
+    sim.running = RunningMetrics.from_state(header["running"])
+    sim._arrivals = {
+        t.ticket_id: day for t, day in zip(sim.sprint_backlog, ints("backlog_arrivals")) if day >= 0
+    }
+
+    events = header["events"]
+    sim.events = EventLog.from_state(
+        events["first"],
+        events["counts"],
+        {
+            "members": decode_strings(section("event_members")),
+            "tickets": decode_strings(section("event_tickets")),
+            "details": [tuples_from_json(d) for d in events["details"]],
+        },
+        {name: section(f"event_{name}") for name in ("day", "timestamp", "member", "ticket", "kind", "effort", "detail")},
+        sink=sink,
+        retain=header["log_retention"],
+        record_events=header["verbosity"] != "off",
+    )
+
+    if header["schedule"] is not None:
+        sim.schedule = TicketSchedule(
+            [TicketView(store, row) for row in ints("schedule_rows")],
+            header["schedule"]["levels"],
+            header["schedule"]["cycles"],
+        )
+    sim.external_open = set(header["external_open"])
+    if header["synced"]:
+        _resume_engine(sim)
+    return sim
+
+
+def _resume_engine(sim):
+    """
+    Rebuild the day engine's derived state without re-emitting the
+    "blocked" notices the original run already logged.
+    """
+    if sim.engine == "vector":
+        from vector_engine import VectorSprintEngine
+
+        engine = VectorSprintEngine(
+            sim._capability_index(),
+            sim.sprint_backlog,
+            sim.completed_work,
+            events=sim.events,
+            escalation_threshold=sim.escalation_threshold,
+            external=sim.external_open,
+        )
+        engine._initially_blocked = []
+        sim._vector_engine = engine
+    else:
+        sim._dependency_index = DependencyIndex(
+            sim.sprint_backlog, sim.completed_work, external=sim.external_open
+        )
+    sim._synced_backlog = sim.sprint_backlog
+    sim._synced_len = len(sim.sprint_backlog)
+
+
+def load(path, rng=None, sink=None, **kwargs):
+    """
+    Restore a SprintSimulator from a checkpoint file.
+
+    The file is memory-mapped and each column is copied out in one step.
+    Accepts the same options as ``loads``.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            return loads(view, rng=rng, sink=sink, **kwargs)
+        finally:
+            view.release()
+
+
+def fork(source, count, rngs=None, **kwargs):
+    """
+    Create ``count`` independent simulators continuing from one state.
+
+    :param source: A SprintSimulator, checkpoint bytes or a checkpoint path.
+    :param count: Number of branches.
+    :param rngs: Optional random streams, one per branch, so branches can
+        explore different outcomes; by default every branch continues the
+        saved stream.
+    :param kwargs: Extra options passed to ``loads``.
+    :return: List of SprintSimulator.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = source
+    elif hasattr(source, "sprint_backlog"):
+        data = dumps(source)
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+    rngs = list(rngs) if rngs is not None else [None] * count
+    return [loads(data, rng=rngs[i], **kwargs) for i in range(count)]
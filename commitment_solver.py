@@ -0,0 +1,384 @@
+"""
+Capacity-constrained sprint commitment.
+
+Choosing which tickets to commit is a knapsack problem with precedence
+constraints: every ticket is worth a priority-weighted value, costs its
+estimated effort, and may only be committed together with the backlog tickets
+it depends on. ``solve_commitment`` maximizes the committed value within the
+team's capacity:
+
+* Backlogs up to ``exact_limit`` eligible tickets are solved exactly. Each
+  connected group of dependent tickets becomes a choice between its
+  dependency-closed subsets and a grouped knapsack dynamic program over
+  capacity picks at most one per group. When that table would be too large
+  (huge capacity or tangled dependency groups) a depth-first branch and bound
+  over a topological order is used instead, pruned with the fractional
+  knapsack (LP relaxation) bound and seeded with the greedy solution.
+* Larger backlogs use a greedy pass over tickets ranked by the value density
+  of their dependency closure, followed by a fill pass. Its optimality gap is
+  certified against the same LP bound.
+
+Tickets nobody on the team can handle, tickets in dependency cycles and
+tickets depending on either are never committed. Dependencies on tickets that
+are not in the backlog, or already closed, count as satisfied.
+"""
+
+import heapq
+import time
+
+from team_members import CapabilityIndex
+
+
+PRIORITY_VALUES = {
+    "Critical": 8,
+    "High": 4,
+    "Medium": 2,
+    "Low": 1,
+}
+
+
+class CommitmentResult:
+    """Selected tickets plus solver statistics."""
+
+    def __init__(self, selected, value, effort, bound, method, optimal, nodes, elapsed, excluded):
+        self.selected = selected
+        self.value = value
+        self.effort = effort
+        self.bound = bound
+        self.method = method
+        self.optimal = optimal
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.excluded = excluded
+
+    @property
+    def gap(self):
+        """Relative distance to the upper bound; 0.0 when proven optimal."""
+        if self.optimal or self.bound <= 0:
+            return 0.0
+        return max(0.0, (self.bound - self.value) / self.bound)
+
+    def stats(self):
+        """Return solver statistics as a plain dict."""
+        return {
+            "method": self.method,
+            "optimal": self.optimal,
+            "value": self.value,
+            "bound": round(self.bound, 3),
+            "gap": round(self.gap, 6),
+            "effort": self.effort,
+            "nodes": self.nodes,
+            "excluded": self.excluded,
+            "elapsed_seconds": round(self.elapsed, 6),
+        }
+
+
+def ticket_value(ticket):
+    """Priority-weighted value of committing ``ticket``."""
+    return PRIORITY_VALUES.get(ticket.priority, 1)
+
+
+def ticket_effort(ticket):
+    """Capacity consumed by ``ticket``, as used by triage."""
+    return ticket.estimated_effort or 1
+
+
+DP_BUDGET = 5_000_000
+MAX_GROUP_OPTIONS = 1024
+
+# Branch-and-bound stack actions
+_VISIT, _EXCLUDE, _RESET = range(3)
+
+
+def solve_commitment(tickets, capacity, team=None, capabilities=None, exact_limit=2000, node_limit=200000):
+    """
+    Choose the most valuable dependency-closed set of tickets within capacity.
+
+    :param tickets: Backlog tickets; the result keeps their relative order.
+    :param capacity: Story points available.
+    :param team: Roster used to drop tickets nobody can handle.
+    :param capabilities: Prebuilt CapabilityIndex for ``team``.
+    :param exact_limit: Largest number of candidate tickets solved exactly.
+    :param node_limit: Branch-and-bound node budget; when exhausted the best
+        solution found is returned with its gap against the LP bound.
+    :return: CommitmentResult.
+    """
+    start = time.perf_counter()
+    if capabilities is None and team is not None:
+        capabilities = CapabilityIndex(team)
+
+    values = [ticket_value(t) for t in tickets]
+    efforts = [ticket_effort(t) for t in tickets]
+    order, deps = _candidates(tickets, capabilities, [v / e for v, e in zip(values, efforts)])
+    values = [values[i] for i in order]
+    efforts = [efforts[i] for i in order]
+    bound = _fractional_bound(range(len(order)), values, efforts, capacity)
+
+    chosen = _greedy(values, efforts, deps, capacity)
+    method, optimal, nodes = "greedy", False, 0
+    if len(order) <= exact_limit:
+        groups = _closed_subsets(efforts, values, deps, capacity)
+        if groups is not None:
+            chosen, optimal, method = _dynamic_program(groups, capacity), True, "dp"
+        else:
+            chosen, optimal, nodes = _branch_and_bound(values, efforts, deps, capacity, chosen, node_limit)
+            method = "branch-and-bound"
+    value = sum(values[i] for i in chosen)
+    if value >= bound:
+        optimal = True
+
+    picked = sorted(order[i] for i in chosen)
+    return CommitmentResult(
+        selected=[tickets[i] for i in picked],
+        value=value,
+        effort=sum(efforts[i] for i in chosen),
+        bound=bound,
+        method=method,
+        optimal=optimal,
+        nodes=nodes,
+        elapsed=time.perf_counter() - start,
+        excluded=len(tickets) - len(order),
+    )
+
+
+def _candidates(tickets, capabilities, density):
+    """
+    Return committable tickets in topological order and their dependencies.
+
+    Among tickets whose dependencies are already placed, denser ones (value
+    per point) come first, which lets branch and bound find good solutions
+    early.
+
+    :return: ``(order, deps)`` where ``order`` holds indices into ``tickets``
+        and ``deps[k]`` lists positions in ``order`` that item ``k`` needs.
+    """
+    positions = {t.ticket_id: i for i, t in enumerate(tickets)}
+    n = len(tickets)
+    feasible = [
+        t.status != "Closed"
+        and (capabilities is None or capabilities.first_capable(t.category) is not None)
+        for t in tickets
+    ]
+    needs = [
+        [positions[d] for d in t.dependencies if d in positions and tickets[positions[d]].status != "Closed"]
+        for t in tickets
+    ]
+
+    # Kahn's algorithm over feasible tickets; anything never released is in,
+    # or behind, a cycle or an infeasible dependency.
+    pending = [len(needs[i]) for i in range(n)]
+    dependents = [[] for _ in range(n)]
+    for i in range(n):
+        for d in needs[i]:
+            dependents[d].append(i)
+    ready = [(-density[i], i) for i in range(n) if feasible[i] and not pending[i]]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        i = heapq.heappop(ready)[1]
+        order.append(i)
+        for j in dependents[i]:
+            pending[j] -= 1
+            if not pending[j] and feasible[j]:
+                heapq.heappush(ready, (-density[j], j))
+
+    slot = {i: k for k, i in enumerate(order)}
+    return order, [[slot[d] for d in needs[i]] for i in order]
+
+
+def _fractional_bound(items, values, efforts, capacity):
+    """LP upper bound: fractional knapsack ignoring dependencies."""
+    total = 0.0
+    room = capacity
+    for i in sorted(items, key=lambda i: values[i] / efforts[i], reverse=True):
+        if efforts[i] <= room:
+            room -= efforts[i]
+            total += values[i]
+        else:
+            total += values[i] * room / efforts[i]
+            break
+    return total
+
+
+def _greedy(values, efforts, deps, capacity):
+    """
+    Closure-density greedy heuristic.
+
+    Items are ranked by the value density of themselves plus their ancestors
+    (shared ancestors are counted once per path, a cheap overestimate of
+    closure effort), and each is committed with its missing ancestors when
+    the whole closure fits. A final pass in topological order fills any
+    remaining room.
+    """
+    n = len(values)
+    closure_value = list(values)
+    closure_effort = list(efforts)
+    for k in range(n):  # topological order: dependencies come first
+        for d in deps[k]:
+            closure_value[k] += closure_value[d]
+            closure_effort[k] += closure_effort[d]
+
+    chosen = [False] * n
+    room = capacity
+    for k in sorted(range(n), key=lambda k: closure_value[k] / closure_effort[k], reverse=True):
+        if chosen[k]:
+            continue
+        missing = []
+        stack = [k]
+        seen = {k}
+        while stack:
+            i = stack.pop()
+            missing.append(i)
+            for d in deps[i]:
+                if not chosen[d] and d not in seen:
+                    seen.add(d)
+                    stack.append(d)
+        cost = sum(efforts[i] for i in missing)
+        if cost <= room:
+            room -= cost
+            for i in missing:
+                chosen[i] = True
+
+    for k in range(n):
+        if not chosen[k] and efforts[k] <= room and all(chosen[d] for d in deps[k]):
+            chosen[k] = True
+            room -= efforts[k]
+    return [k for k in range(n) if chosen[k]]
+
+
+def _closed_subsets(efforts, values, deps, capacity):
+    """
+    Enumerate each dependency group's committable subsets.
+
+    Tickets linked by dependencies (in either direction) form a group; a
+    subset of a group is committable when it contains the dependencies of
+    each of its tickets. Returns a list of groups, each a list of
+    ``(effort, value, items)`` options excluding the empty one, or ``None``
+    if some group has more than ``MAX_GROUP_OPTIONS`` options or the
+    dynamic program would exceed ``DP_BUDGET`` cells.
+    """
+    n = len(efforts)
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for k in range(n):
+        for d in deps[k]:
+            parent[find(k)] = find(d)
+    members = {}
+    for k in range(n):  # topological order is kept within each group
+        members.setdefault(find(k), []).append(k)
+
+    groups = []
+    cells = 0
+    for items in members.values():
+        options = [(0, 0, ())]
+        for k in items:
+            # Extend every subset that already holds k's dependencies
+            options += [
+                (effort + efforts[k], value + values[k], subset + (k,))
+                for effort, value, subset in options
+                if effort + efforts[k] <= capacity and all(d in subset for d in deps[k])
+            ]
+            if len(options) > MAX_GROUP_OPTIONS:
+                return None
+        groups.append(options[1:])
+        cells += len(options) * (capacity + 1)
+        if cells > DP_BUDGET:
+            return None
+    return groups
+
+
+def _dynamic_program(groups, capacity):
+    """Grouped 0/1 knapsack over capacity; returns the chosen items."""
+    best = [0] * (capacity + 1)
+    picks = []
+    for options in groups:
+        new = best[:]
+        pick = [-1] * (capacity + 1)
+        for o, (effort, value, _) in enumerate(options):
+            for c in range(effort, capacity + 1):
+                candidate = best[c - effort] + value
+                if candidate > new[c]:
+                    new[c] = candidate
+                    pick[c] = o
+        picks.append(pick)
+        best = new
+
+    chosen = []
+    c = capacity
+    for options, pick in zip(reversed(groups), reversed(picks)):
+        o = pick[c]
+        if o >= 0:
+            effort, _, items = options[o]
+            chosen.extend(items)
+            c -= effort
+    return sorted(chosen)
+
+
+def _branch_and_bound(values, efforts, deps, capacity, incumbent, node_limit):
+    """
+    Exact search over include/exclude decisions in topological order.
+
+    An item can only be included when all its dependencies were, so every
+    leaf is dependency-closed. Nodes are pruned when the current value plus
+    the fractional bound of the undecided items cannot beat the incumbent.
+
+    :return: ``(chosen, optimal, nodes)``.
+    """
+    n = len(values)
+    by_density = sorted(range(n), key=lambda i: values[i] / efforts[i], reverse=True)
+    state = [-1] * n  # -1 undecided, 0 excluded, 1 included
+    best = [sum(values[i] for i in incumbent), list(incumbent)]
+    nodes = 0
+    exhausted = False
+
+    def upper(room):
+        total = 0.0
+        for i in by_density:
+            if state[i] != -1 or any(state[d] == 0 for d in deps[i]):
+                continue
+            if efforts[i] <= room:
+                room -= efforts[i]
+                total += values[i]
+            else:
+                return total + values[i] * room / efforts[i]
+        return total
+
+    # Depth-first with an explicit stack, since candidates may far outnumber
+    # the recursion limit. A node is expanded into "exclude k" (run once the
+    # include subtree is done) and then "include k"; _RESET undoes the
+    # exclusion when its subtree is finished.
+    stack = [(_VISIT, 0, 0, capacity)]
+    while stack:
+        action, k, value, room = stack.pop()
+        if action == _RESET:
+            state[k] = -1
+            continue
+        if action == _EXCLUDE:
+            state[k] = 0
+            stack.append((_RESET, k, 0, 0))
+            stack.append((_VISIT, k + 1, value, room))
+            continue
+        nodes += 1
+        if nodes > node_limit:
+            exhausted = True
+            break
+        if k == n:
+            if value > best[0]:
+                best[0] = value
+                best[1] = [i for i in range(n) if state[i] == 1]
+            continue
+        # Values are integers, so only a bound above best + 1 can improve it
+        if value + int(upper(room) + 1e-9) <= best[0]:
+            continue
+        stack.append((_EXCLUDE, k, value, room))
+        if efforts[k] <= room and all(state[d] == 1 for d in deps[k]):
+            state[k] = 1
+            stack.append((_VISIT, k + 1, value + values[k], room - efforts[k]))
+
+    return best[1], not exhausted, nodes
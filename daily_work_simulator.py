@@ -2,67 +2,98 @@
 Module simulating individual team member work days and collaboration patterns.
 """
 
-from log_utils import generate_realistic_timestamp_logs
-from datetime import time
+from functools import partial
+
+from events import EventKind, EventLog
+from log_utils import WorkdayClock
 
 
 class DailyWorkSimulator:
     """Simulate work for individual team members."""
 
     ESCALATION_THRESHOLD = 5
+    # Events kept without timestamps: the ones metrics and summaries count
+    OUTCOMES = frozenset((EventKind.COMPLETED, EventKind.ESCALATED, EventKind.BLOCKED, EventKind.UNABLE))
 
-    def simulate_work_day(self, team_member, assigned_tickets, day, ticket_lookup=None):
+    def __init__(self, rng=None, epoch=None, timestamps=True, escalation_threshold=None):
+        """
+        :param rng: Optional ``random.Random`` instance used for timestamps.
+        :param epoch: Optional date of day 1; defaults to today.
+        :param timestamps: Log the full timed day (planning, starts, wrap-up).
+            When False only outcome events are emitted, without timestamps,
+            and ``rng`` is never drawn from; ticket outcomes are the same.
+        :param escalation_threshold: Effort above which members with skill
+            below 6 escalate; defaults to ``ESCALATION_THRESHOLD``.
+        """
+        if escalation_threshold is not None:
+            self.ESCALATION_THRESHOLD = escalation_threshold
+        self.rng = rng
+        self.epoch = epoch
+        self.timestamps = timestamps
+
+    def simulate_work_day(
+        self, team_member, assigned_tickets, day, ticket_lookup=None, capabilities=None, events=None
+    ):
         """
         Model realistic daily work for a team member.
 
         :param team_member: TeamMember instance.
         :param assigned_tickets: List of Ticket instances.
         :param day: Day index or date.
-        :return: List of log strings for the day.
+        :param ticket_lookup: Optional ticket id -> Ticket map used to check
+            dependencies before starting work.
+        :param capabilities: Optional CapabilityIndex for the member's team,
+            replacing per-ticket eligibility and effort calculations.
+        :param events: Optional EventLog to append to; a private one is
+            used when omitted.
+        :return: Tuple of (lazily rendered log lines for the day, escalated
+            tickets).
         """
+        if capabilities is not None:
+            can_handle = partial(capabilities.can_handle, team_member)
+            estimate_effort = partial(capabilities.estimate_effort, team_member)
+        else:
+            can_handle = team_member.can_handle_ticket
+            estimate_effort = team_member.estimate_effort
+        if events is None:
+            events = EventLog()
+        first_event = len(events)
 
         after_hours = any(t.priority == "Critical" for t in assigned_tickets)
-        ts_gen = generate_realistic_timestamp_logs(day_index=day, after_hours=after_hours)
+        name = team_member.name
 
-        logs = []
+        # Decide the day's outcomes first, then stamp them with one batch of
+        # clock ticks.
+        planned = [(EventKind.PLANNING, None, 0, None)]
         escalated = []
-        logs.append(f"{ts_gen()} | {team_member.name} | Planning and standup")
 
         for ticket in assigned_tickets:
-            if not team_member.can_handle_ticket(ticket):
-                logs.append(
-                    f"{ts_gen()} | {team_member.name} | Unable to work on {ticket.ticket_id}"
-                )
+            if not can_handle(ticket):
+                planned.append((EventKind.UNABLE, ticket.ticket_id, 0, None))
                 continue
 
             # Check for unresolved dependencies
             if ticket_lookup and ticket.dependencies:
-                unresolved = [
+                unresolved = tuple(
                     dep
                     for dep in ticket.dependencies
                     if ticket_lookup.get(dep) and ticket_lookup[dep].status != "Closed"
-                ]
+                )
                 if unresolved:
                     ticket.status = "Blocked"
-                    logs.append(
-                        f"{ts_gen()} | {team_member.name} | Blocked on {ticket.ticket_id} waiting for {','.join(unresolved)}"
-                    )
+                    planned.append((EventKind.BLOCKED, ticket.ticket_id, 0, unresolved))
                     continue
 
-            logs.append(
-                f"{ts_gen()} | {team_member.name} | Started {ticket.ticket_id}: {ticket.description}"
-            )
+            planned.append((EventKind.STARTED, ticket.ticket_id, 0, ticket.description))
 
             ticket.status = "In Progress"
-            ticket.assigned_to = team_member.name
-            effort = team_member.estimate_effort(ticket)
+            ticket.assigned_to = name
+            effort = estimate_effort(ticket)
 
             if team_member.skill_level < 6 and effort > self.ESCALATION_THRESHOLD:
                 ticket.status = "Open"
                 ticket.assigned_to = None
-                logs.append(
-                    f"{ts_gen()} | {team_member.name} | Escalating {ticket.ticket_id} to senior engineer"
-                )
+                planned.append((EventKind.ESCALATED, ticket.ticket_id, 0, None))
                 escalated.append(ticket)
                 continue
 
@@ -71,14 +102,25 @@ class DailyWorkSimulator:
             team_member.current_workload += effort
             team_member.completed_tickets.append(ticket.ticket_id)
 
-            logs.append(
-                f"{ts_gen()} | {team_member.name} | Completed {ticket.ticket_id} in {effort} pts"
-            )
+            planned.append((EventKind.COMPLETED, ticket.ticket_id, effort, None))
+
+        planned.append((EventKind.WRAP_UP, None, 0, None))
+
+        if not self.timestamps:
+            outcomes = self.OUTCOMES
+            for kind, ticket_id, effort, detail in planned:
+                if kind in outcomes:
+                    events.emit(day, kind, name, ticket_id, effort, detail)
+            if after_hours:
+                events.emit(day, EventKind.AFTER_HOURS, name)
+            return events.lines(first_event, len(events)), escalated
 
-        logs.append(f"{ts_gen()} | {team_member.name} | Wrap up and documentation")
+        clock = WorkdayClock(day, after_hours, rng=self.rng, epoch=self.epoch)
+        for (kind, ticket_id, effort, detail), ts in zip(planned, clock.batch(len(planned))):
+            events.emit(day, kind, name, ticket_id, effort, detail, ts)
 
+        # Critical work always means an after-hours response; it is pushed
+        # past 18:00 if the day itself ended earlier.
         if after_hours:
-            end_time = ts_gen.current()
-            if end_time.time() <= time(18, 0):
-                logs.append(f"{ts_gen(force_after_hours=True)} | {team_member.name} | After-hours incident response")
-        return logs, escalated
+            events.emit(day, EventKind.AFTER_HOURS, name, timestamp=clock.tick(force_after_hours=True))
+        return events.lines(first_event, len(events)), escalated
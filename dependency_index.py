@@ -0,0 +1,110 @@
+"""
+Incremental dependency tracking for sprint simulation.
+
+``DependencyIndex`` is built once from the sprint backlog and then updated as
+tickets close: it keeps reverse dependency edges, a per-ticket count of
+unresolved dependencies and a priority-ordered queue of tickets that are ready
+to be worked, so a simulated day only touches tickets whose state changed.
+"""
+
+import heapq
+from collections import defaultdict
+
+from sprint_planning import PRIORITY_ORDER
+
+
+class DependencyIndex:
+    """Reverse edges, unresolved-dependency counts and a ready queue."""
+
+    def __init__(self, backlog, completed_work=(), external=()):
+        """
+        :param backlog: Tickets in the sprint backlog, in backlog order.
+        :param completed_work: Tickets already moved out of the backlog.
+        :param external: Ids of open tickets owned elsewhere (e.g. another
+            team) that still block their dependents until
+            ``resolve_external`` is called.
+
+        Other dependencies on tickets that are neither in the backlog nor in
+        ``completed_work`` are ignored, matching the simulator's lookup rules.
+        """
+        lookup = {t.ticket_id: t for t in completed_work}
+        lookup.update((t.ticket_id, t) for t in backlog)
+
+        self.dependents = defaultdict(list)
+        self.unresolved = {}
+        self.blocked = []
+        self.has_closed = False
+        self.checks = 0  # dependency edges examined, for profiling
+        self._keys = {}
+        self._ready = []
+        self._unblocked = []
+
+        for position, ticket in enumerate(backlog):
+            if ticket.status == "Closed":
+                self.has_closed = True
+                continue
+            self._keys[ticket.ticket_id] = (PRIORITY_ORDER.get(ticket.priority, 5), position)
+            self.checks += len(ticket.dependencies)
+            waiting_on = [
+                dep for dep in ticket.dependencies
+                if (dep in lookup and lookup[dep].status != "Closed")
+                or (dep not in lookup and dep in external)
+            ]
+            for dep in waiting_on:
+                self.dependents[dep].append(ticket)
+            self.unresolved[ticket.ticket_id] = len(waiting_on)
+
+            if waiting_on:
+                ticket.status = "Blocked"
+                self.blocked.append((ticket, waiting_on))
+            else:
+                if ticket.dependencies and ticket.status == "Blocked":
+                    ticket.status = "Open"
+                self.push(ticket)
+
+    def push(self, ticket):
+        """Queue ``ticket`` for work if it is open."""
+        if ticket.status == "Open":
+            key = self._keys[ticket.ticket_id]
+            heapq.heappush(self._ready, (key, ticket))
+
+    def requeue(self, tickets):
+        """Return tickets that could not be worked today to the ready queue."""
+        for ticket in tickets:
+            self.push(ticket)
+
+    def pop_ready(self):
+        """
+        Drain the ready queue in priority order.
+
+        Tickets unblocked by closures since the last call are reopened first,
+        so they become available on the day after their last dependency closed.
+        """
+        for ticket in self._unblocked:
+            if ticket.status == "Blocked":
+                ticket.status = "Open"
+            self.push(ticket)
+        self._unblocked = []
+
+        ready = []
+        while self._ready:
+            ready.append(heapq.heappop(self._ready)[1])
+        return ready
+
+    def mark_closed(self, ticket):
+        """Record that ``ticket`` closed and release tickets waiting on it."""
+        self._release(ticket.ticket_id)
+
+    def resolve_external(self, ticket_ids):
+        """Record that external tickets closed; dependents unblock next day."""
+        for ticket_id in ticket_ids:
+            self._release(ticket_id)
+
+    def _release(self, ticket_id):
+        dependents = self.dependents.pop(ticket_id, ())
+        self.checks += len(dependents)
+        for dependent in dependents:
+            remaining = self.unresolved[dependent.ticket_id] - 1
+            self.unresolved[dependent.ticket_id] = remaining
+            if remaining == 0:
+                self._unblocked.append(dependent)
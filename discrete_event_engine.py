@@ -0,0 +1,333 @@
+"""
+Discrete-event engine for SprintSimulator.
+
+Instead of stepping through whole days, this engine keeps a priority queue of
+timed events (ticket start, finish, escalation handoff, dependency unblock,
+after-hours page) and jumps straight from one event to the next, so idle
+stretches and long horizons cost nothing.
+
+Time is integer seconds since 1970-01-01, as in ``log_utils``. Each member
+works one ticket at a time during business hours (08:00-12:00 and
+13:00-18:00); one story point of effort takes ``point_seconds`` of working
+time, so large tickets span days and a day holds only as much work as fits.
+Critical tickets are worked into the evening (until 22:00) and page the
+member with an after-hours event when their work runs past 18:00.
+
+Assignment, effort and escalation follow the same rules as the other engines:
+ready tickets go to the first capable member in priority order, and members
+with skill below 6 hand tickets above the escalation threshold to the first
+senior after a short triage. A ticket becomes ready the moment its last
+dependency finishes. Roster changes are applied in place with
+``set_capabilities``, so work already in flight keeps its schedule.
+"""
+
+import heapq
+
+from daily_work_simulator import DailyWorkSimulator
+from events import EventKind, EventLog
+from log_utils import (
+    AFTER_HOURS_END, DAY_START, END_OF_DAY, LUNCH_END, LUNCH_START, SECONDS_PER_DAY, epoch_seconds,
+)
+from sprint_planning import PRIORITY_ORDER
+
+
+START, FINISH, ESCALATE, UNBLOCK, PAGE = range(5)
+
+_BUSINESS = ((DAY_START, LUNCH_START), (LUNCH_END, END_OF_DAY))
+_EXTENDED = ((DAY_START, LUNCH_START), (LUNCH_END, AFTER_HOURS_END))
+
+
+def next_working_time(t, windows=_BUSINESS):
+    """Return ``t`` if it falls in a work window, else the next window start."""
+    midnight = t - t % SECONDS_PER_DAY
+    rel = t - midnight
+    for start, end in windows:
+        if rel < start:
+            return midnight + start
+        if rel < end:
+            return t
+    return midnight + SECONDS_PER_DAY + windows[0][0]
+
+
+def add_working_time(t, seconds, windows=_BUSINESS):
+    """Return the time at which ``seconds`` of work started at ``t`` ends."""
+    t = next_working_time(t, windows)
+    while True:
+        midnight = t - t % SECONDS_PER_DAY
+        rel = t - midnight
+        for start, end in windows:
+            if rel < end:
+                rel = max(rel, start)
+                if seconds <= end - rel:
+                    return midnight + rel + seconds
+                seconds -= end - rel
+                rel = end
+        t = midnight + SECONDS_PER_DAY + windows[0][0]
+
+
+class DiscreteEventEngine:
+    """Event-queue simulation of a backlog worked by one team."""
+
+    POINT_SECONDS = 3600
+    TRIAGE_SECONDS = 15 * 60
+
+    def __init__(
+        self,
+        capabilities,
+        backlog,
+        completed_work=(),
+        events=None,
+        epoch=None,
+        escalation_threshold=None,
+        external=(),
+        point_seconds=None,
+    ):
+        """
+        :param capabilities: CapabilityIndex for the team working the backlog.
+        :param backlog: Tickets still in the sprint backlog.
+        :param completed_work: Tickets already moved out of the backlog.
+        :param events: EventLog receiving the engine's events.
+        :param epoch: Date of day 1; defaults to today.
+        :param escalation_threshold: Defaults to DailyWorkSimulator's.
+        :param external: Ids of open tickets owned elsewhere that block their
+            dependents until ``resolve_external`` is called.
+        :param point_seconds: Working seconds per story point.
+        """
+        self.capabilities = capabilities
+        self.team = capabilities.team
+        self.events = events if events is not None else EventLog()
+        self.threshold = (
+            DailyWorkSimulator.ESCALATION_THRESHOLD if escalation_threshold is None else escalation_threshold
+        )
+        self.point_seconds = point_seconds or self.POINT_SECONDS
+        self.day_one = epoch_seconds(epoch)
+        self.now = self.day_one + DAY_START
+
+        self._queue = []
+        self._seq = 0
+        self._member_queues = [[] for _ in self.team]
+        self._busy = [False] * len(self.team)
+        self._waking = [None] * len(self.team)
+        self._paged = set()
+        self._unrouted = []
+        self._handoffs = set()
+        self._closed = []
+        self._keys = {}
+        self._unresolved = {}
+        self._dependents = {}
+        self._initially_blocked = []
+
+        lookup = {t.ticket_id: t for t in completed_work}
+        lookup.update((t.ticket_id, t) for t in backlog)
+        for position, ticket in enumerate(backlog):
+            if ticket.status == "Closed":
+                continue
+            self._keys[ticket.ticket_id] = (PRIORITY_ORDER.get(ticket.priority, 5), position)
+            waiting_on = tuple(
+                dep for dep in ticket.dependencies
+                if (dep in lookup and lookup[dep].status != "Closed")
+                or (dep not in lookup and dep in external)
+            )
+            for dep in waiting_on:
+                self._dependents.setdefault(dep, []).append(ticket)
+            self._unresolved[ticket.ticket_id] = len(waiting_on)
+            if waiting_on:
+                ticket.status = "Blocked"
+                self._initially_blocked.append((ticket, waiting_on))
+            else:
+                if ticket.status != "Open":
+                    ticket.status = "Open"
+                    ticket.assigned_to = None
+                self._route(ticket)
+        for m in range(len(self.team)):
+            self._wake(m, self.now)
+
+    def _push(self, when, kind, *payload):
+        self._seq += 1
+        heapq.heappush(self._queue, (when, self._seq, kind, payload))
+
+    def set_capabilities(self, capabilities):
+        """
+        Switch to an updated roster without losing scheduled work.
+
+        Tickets in progress finish with the member working them, even one who
+        left the roster. Tickets queued for a remaining member stay queued,
+        those of departed members and tickets nobody could take are routed
+        again under the new capabilities.
+        """
+        old_team, old_busy, old_queues = self.team, self._busy, self._member_queues
+        team = list(capabilities.team)
+        position = {id(member): m for m, member in enumerate(team)}
+        for m, member in enumerate(old_team):
+            if old_busy[m] and id(member) not in position:
+                position[id(member)] = len(team)
+                team.append(member)
+        remap = [position.get(id(member)) for member in old_team]
+
+        self.capabilities = capabilities
+        self.team = team
+        self._busy = [False] * len(team)
+        self._member_queues = [[] for _ in team]
+        self._waking = [None] * len(team)
+        rerouted = []
+        for m, new in enumerate(remap):
+            if new is not None:
+                self._busy[new] = old_busy[m]
+            if new is None or new >= len(capabilities.team):
+                rerouted.extend(ticket for _, ticket in sorted(old_queues[m], key=lambda entry: entry[0]))
+            else:
+                self._member_queues[new] = old_queues[m]
+
+        # Work in flight keeps its finish time; member wake-ups are re-issued below
+        queue = []
+        for when, seq, kind, payload in self._queue:
+            if kind == START:
+                continue
+            if kind in (FINISH, ESCALATE, PAGE):
+                payload = (remap[payload[0]],) + payload[1:]
+            queue.append((when, seq, kind, payload))
+        heapq.heapify(queue)
+        self._queue = queue
+        self._paged = {(remap[m], when) for m, when in self._paged if remap[m] is not None}
+
+        unrouted, self._unrouted = self._unrouted, []
+        for ticket in rerouted:
+            ticket.status = "Open"
+            self._route(ticket, senior=ticket.ticket_id in self._handoffs)
+        for ticket, senior in unrouted:
+            self._route(ticket, senior=senior)
+        for m in range(len(team)):
+            self._wake(m, self.now)
+
+    def _route(self, ticket, senior=False):
+        """Queue a ready ticket for its first capable (or senior) member."""
+        member = self.capabilities.first_capable(ticket.category, senior=senior)
+        if member is None:
+            # Retried when the roster changes
+            self._unrouted.append((ticket, senior))
+            return None
+        m = self.capabilities.position(member)
+        if senior:
+            self._handoffs.add(ticket.ticket_id)
+        ticket.status = "Assigned"
+        heapq.heappush(self._member_queues[m], (self._keys[ticket.ticket_id], ticket))
+        return m
+
+    def _wake(self, m, when):
+        """Schedule member ``m`` to look for work at ``when`` unless already due."""
+        if self._busy[m] or not self._member_queues[m]:
+            return
+        if self._waking[m] is not None and self._waking[m] <= when:
+            return
+        self._waking[m] = when
+        self._push(when, START, m)
+
+    def resolve_external(self, ticket_ids):
+        """Record that external tickets closed; dependents become ready now."""
+        for ticket_id in ticket_ids:
+            self._push(self.now, UNBLOCK, ticket_id)
+
+    def run_until(self, day):
+        """
+        Process every event before the end of ``day``.
+
+        :param day: Day index (1-based).
+        :return: Tickets closed since the previous call, in closing order.
+        """
+        for ticket, waiting_on in self._initially_blocked:
+            self.events.emit(day, EventKind.BLOCKED, ticket=ticket.ticket_id, detail=waiting_on)
+        self._initially_blocked = []
+
+        horizon = self.day_one + day * SECONDS_PER_DAY
+        queue = self._queue
+        while queue and queue[0][0] < horizon:
+            when, _, kind, payload = heapq.heappop(queue)
+            self.now = when
+            if kind == START:
+                self._start(when, *payload)
+            elif kind == FINISH:
+                self._finish(when, *payload)
+            elif kind == ESCALATE:
+                self._escalate(when, *payload)
+            elif kind == UNBLOCK:
+                self._release(when, *payload)
+            else:
+                self._page(when, *payload)
+        self.now = max(self.now, horizon)
+
+        closed, self._closed = self._closed, []
+        return closed
+
+    def _day(self, when):
+        return (when - self.day_one) // SECONDS_PER_DAY + 1
+
+    def _start(self, when, m):
+        self._waking[m] = None
+        if self._busy[m] or not self._member_queues[m]:
+            return
+        ticket = self._member_queues[m][0][1]
+        critical = ticket.priority == "Critical"
+        begin = next_working_time(when, _EXTENDED if critical else _BUSINESS)
+        if begin > when:
+            self._wake(m, begin)
+            return
+        heapq.heappop(self._member_queues[m])
+
+        member = self.team[m]
+        self._busy[m] = True
+        self.events.emit(self._day(when), EventKind.STARTED, member.name, ticket.ticket_id,
+                         detail=ticket.description, timestamp=when)
+        ticket.status = "In Progress"
+        ticket.assigned_to = member.name
+        effort = self.capabilities.estimate_effort(member, ticket)
+
+        if member.skill_level < 6 and effort > self.threshold:
+            self._push(when + self.TRIAGE_SECONDS, ESCALATE, m, ticket)
+            return
+
+        done = add_working_time(when, effort * self.point_seconds, _EXTENDED if critical else _BUSINESS)
+        evening = when - when % SECONDS_PER_DAY + END_OF_DAY
+        if critical and done > evening:
+            self._push(max(when, evening), PAGE, m)
+        self._push(done, FINISH, m, ticket, effort)
+
+    def _finish(self, when, m, ticket, effort):
+        member = self.team[m]
+        ticket.actual_effort = effort
+        ticket.status = "Closed"
+        member.current_workload += effort
+        member.completed_tickets.append(ticket.ticket_id)
+        self.events.emit(self._day(when), EventKind.COMPLETED, member.name, ticket.ticket_id, effort,
+                         timestamp=when)
+        self._closed.append(ticket)
+        self._release(when, ticket.ticket_id)
+        self._busy[m] = False
+        self._wake(m, when)
+
+    def _escalate(self, when, m, ticket):
+        member = self.team[m]
+        self.events.emit(self._day(when), EventKind.ESCALATED, member.name, ticket.ticket_id, timestamp=when)
+        ticket.status = "Open"
+        ticket.assigned_to = None
+        senior = self._route(ticket, senior=True)
+        if senior is not None:
+            self._wake(senior, when)
+        self._busy[m] = False
+        self._wake(m, when)
+
+    def _release(self, when, ticket_id):
+        """Unblock tickets whose last open dependency was ``ticket_id``."""
+        for dependent in self._dependents.pop(ticket_id, ()):
+            remaining = self._unresolved[dependent.ticket_id] - 1
+            self._unresolved[dependent.ticket_id] = remaining
+            if remaining == 0:
+                dependent.status = "Open"
+                m = self._route(dependent)
+                if m is not None:
+                    self._wake(m, when)
+
+    def _page(self, when, m):
+        key = (m, when)
+        if key not in self._paged:
+            self._paged.add(key)
+            self.events.emit(self._day(when), EventKind.AFTER_HOURS, self.team[m].name, timestamp=when)
@@ -0,0 +1,171 @@
+"""
+Streaming sinks and readers for simulation events.
+
+An ``EventLog`` created with a sink forwards every event to it as it is
+emitted, so long runs can keep only a small ring of recent events in memory.
+Two on-disk formats are supported, both optionally gzip-compressed:
+
+* JSON Lines, one event object per line (``JsonlEventSink``).
+* A compact binary stream (``BinaryEventSink``): a magic header followed by
+  tagged records. Member names, ticket ids and details are written once as
+  definition records and events refer to them by code.
+
+``read_events`` detects the format and yields ``Event`` tuples one at a time
+without loading the whole file.
+"""
+
+import gzip
+import json
+import struct
+
+from events import Event, EventKind
+from serialization import tuples_from_json
+
+
+BINARY_MAGIC = b"SPEV1\n"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_TAG_EVENT = 0
+_TAG_MEMBER = 1
+_TAG_TICKET = 2
+_TAG_DETAIL = 3
+
+_EVENT = struct.Struct("<iqiiBii")
+_LENGTH = struct.Struct("<I")
+
+
+def _open(path, mode, compress):
+    if compress or str(path).endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class _BufferedSink:
+    """Shared buffering, flushing and context-manager behaviour."""
+
+    def __init__(self, path, compress=False, flush_every=1000):
+        """
+        :param path: Output file; a ``.gz`` suffix implies compression.
+        :param compress: Gzip the stream.
+        :param flush_every: Number of events buffered between writes.
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self._file = _open(path, "wb", compress)
+        self._buffer = []
+        self._pending = 0
+        self.written = 0
+
+    def write(self, event):
+        """Queue one ``Event``; writes the buffer every ``flush_every`` events."""
+        self._encode(event)
+        self._pending += 1
+        self.written += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write buffered events to the file."""
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer = []
+        self._pending = 0
+        self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonlEventSink(_BufferedSink):
+    """Write events as JSON Lines."""
+
+    def _encode(self, event):
+        record = event._asdict()
+        record["kind"] = event.kind.name
+        self._buffer.append(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+
+
+class BinaryEventSink(_BufferedSink):
+    """Write events in the compact tagged binary format."""
+
+    def __init__(self, path, compress=False, flush_every=1000):
+        super().__init__(path, compress=compress, flush_every=flush_every)
+        self._buffer.append(BINARY_MAGIC)
+        self._codes = {_TAG_MEMBER: {}, _TAG_TICKET: {}, _TAG_DETAIL: {}}
+
+    def _code(self, tag, value):
+        if value is None:
+            return -1
+        codes = self._codes[tag]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            payload = (json.dumps(value) if tag == _TAG_DETAIL else value).encode()
+            self._buffer.append(bytes([tag]) + _LENGTH.pack(len(payload)) + payload)
+        return code
+
+    def _encode(self, event):
+        member = self._code(_TAG_MEMBER, event.member)
+        ticket = self._code(_TAG_TICKET, event.ticket)
+        detail = self._code(_TAG_DETAIL, event.detail)
+        timestamp = -1 if event.timestamp is None else event.timestamp
+        self._buffer.append(
+            bytes([_TAG_EVENT])
+            + _EVENT.pack(event.day, timestamp, member, ticket, event.kind, event.effort, detail)
+        )
+
+
+def read_events(path):
+    """
+    Iterate the events of a finished run written by either sink.
+
+    :param path: File written by ``JsonlEventSink`` or ``BinaryEventSink``.
+    :return: Generator of ``Event`` tuples in emission order.
+    """
+    with open(path, "rb") as raw:
+        compressed = raw.read(2) == _GZIP_MAGIC
+    with (gzip.open(path, "rb") if compressed else open(path, "rb")) as f:
+        if f.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            yield from _read_binary(f)
+            return
+        f.seek(0)
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                record["kind"] = EventKind[record["kind"]]
+                record["detail"] = tuples_from_json(record["detail"])
+                yield Event(**record)
+
+
+def _read_binary(f):
+    tables = {_TAG_MEMBER: [], _TAG_TICKET: [], _TAG_DETAIL: []}
+    members, tickets, details = tables[_TAG_MEMBER], tables[_TAG_TICKET], tables[_TAG_DETAIL]
+    while True:
+        tag = f.read(1)
+        if not tag:
+            return
+        tag = tag[0]
+        if tag == _TAG_EVENT:
+            day, ts, member, ticket, kind, effort, detail = _EVENT.unpack(f.read(_EVENT.size))
+            yield Event(
+                day,
+                None if ts == -1 else ts,
+                members[member] if member >= 0 else None,
+                tickets[ticket] if ticket >= 0 else None,
+                EventKind(kind),
+                effort,
+                details[detail] if detail >= 0 else None,
+            )
+        else:
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            payload = f.read(length).decode()
+            tables[tag].append(tuples_from_json(json.loads(payload)) if tag == _TAG_DETAIL else payload)
@@ -0,0 +1,358 @@
+"""
+Typed simulation event stream.
+
+Simulators append compact event records (day, timestamp, member, ticket,
+kind, effort) to an ``EventLog``, which stores them column-wise in typed
+arrays with member names, ticket ids and details interned. Text log lines are
+only rendered when read through ``EventLog.lines()``, and per-kind counts are
+kept as events arrive so metrics never scan the log.
+
+With a sink (see ``event_sinks``) and a retention limit, events are streamed
+out as they are emitted and only the most recent ones stay in memory. Event
+indices are global: ``len(log)`` counts every event ever emitted and
+``log.first`` is the index of the oldest one still held.
+
+A log created with ``record_events=False`` keeps only the per-kind counts,
+for runs where nothing but the metrics is read.
+"""
+
+from array import array
+from collections import namedtuple
+from collections.abc import Sequence
+from enum import IntEnum
+
+from log_utils import format_timestamp
+
+
+class EventKind(IntEnum):
+    STANDUP = 0
+    PLANNING = 1
+    STARTED = 2
+    COMPLETED = 3
+    ESCALATED = 4
+    BLOCKED = 5
+    UNABLE = 6
+    WRAP_UP = 7
+    AFTER_HOURS = 8
+    # Free-text line appended through ``daily_logs``; the text is the detail
+    NOTE = 9
+
+
+Event = namedtuple("Event", "day timestamp member ticket kind effort detail")
+
+NO_TIMESTAMP = -1
+
+
+class _Table:
+    """Interned values addressed by small integer codes; -1 means ``None``."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def code(self, value):
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def get(self, code):
+        return None if code < 0 else self.values[code]
+
+
+def _extend(column, values):
+    """Extend an ``array`` column from a list or a NumPy array."""
+    if hasattr(values, "astype"):
+        column.frombytes(values.astype(column.typecode).tobytes())
+    else:
+        column.extend(values)
+
+
+class EventLog:
+    """Append-only columnar buffer of simulation events."""
+
+    def __init__(self, sink=None, retain=None, record_events=True):
+        """
+        :param sink: Optional object with ``write(event)`` and ``flush()``
+            receiving every event as it is emitted.
+        :param retain: Keep at most about this many recent events in memory;
+            ``None`` keeps everything.
+        :param record_events: Store events; when False only ``count()`` is
+            kept and events are neither retained nor sent to the sink.
+        """
+        self.sink = sink
+        self.retain = retain
+        self.record_events = record_events
+        self.first = 0
+        self.day = array("i")
+        self.timestamp = array("q")
+        self.member = array("i")
+        self.ticket = array("i")
+        self.kind = array("B")
+        self.effort = array("i")
+        self.detail = array("i")
+        self.members = _Table()
+        self.tickets = _Table()
+        self.details = _Table()
+        self._counts = [0] * len(EventKind)
+
+    def emit(self, day, kind, member=None, ticket=None, effort=0, detail=None, timestamp=None):
+        """
+        Append one event.
+
+        :param day: Day index.
+        :param kind: EventKind.
+        :param member: Member name, if the event belongs to a member.
+        :param ticket: Ticket id, if the event concerns a ticket.
+        :param effort: Effort in points (completions).
+        :param detail: Hashable extra payload (description, waiting ids,
+            standup snapshot); interned.
+        :param timestamp: Integer seconds since 1970-01-01, or None for
+            day-level events.
+        """
+        if not self.record_events:
+            self._counts[kind] += 1
+            return
+        self.day.append(day)
+        self.timestamp.append(NO_TIMESTAMP if timestamp is None else timestamp)
+        self.member.append(self.members.code(member))
+        self.ticket.append(self.tickets.code(ticket))
+        self.kind.append(kind)
+        self.effort.append(effort)
+        self.detail.append(self.details.code(detail))
+        self._counts[kind] += 1
+        self._emitted(1)
+
+    def emit_batch(self, day, kind, member_codes, ticket_codes, efforts=None):
+        """
+        Append many day-level events of one kind from pre-interned codes.
+
+        :param member_codes: Codes from ``member_code()`` (list or NumPy array).
+        :param ticket_codes: Codes from ``ticket_code()``, same length.
+        :param efforts: Optional efforts, same length; defaults to 0.
+        """
+        n = len(ticket_codes)
+        if not n:
+            return
+        if not self.record_events:
+            self._counts[kind] += n
+            return
+        self.day.extend([day] * n)
+        self.timestamp.extend([NO_TIMESTAMP] * n)
+        _extend(self.member, member_codes)
+        _extend(self.ticket, ticket_codes)
+        self.kind.extend([kind] * n)
+        _extend(self.effort, [0] * n if efforts is None else efforts)
+        self.detail.extend([-1] * n)
+        self._counts[kind] += n
+        self._emitted(n)
+
+    def _emitted(self, n):
+        """Forward the last ``n`` events to the sink and enforce retention."""
+        if self.sink is not None:
+            end = len(self)
+            for i in range(end - n, end):
+                self.sink.write(self.record(i))
+        if self.retain is not None and len(self.kind) > 2 * self.retain:
+            self._trim(len(self.kind) - self.retain)
+
+    def _trim(self, n):
+        """Drop the ``n`` oldest events and re-intern the remaining details."""
+        for column in self._columns():
+            del column[:n]
+        self.first += n
+        # Details (descriptions, waiting lists, standup snapshots) are the only
+        # table that grows with run length, so rebuild it from what is kept.
+        old, self.details = self.details, _Table()
+        self.detail = array("i", (self.details.code(old.get(code)) for code in self.detail))
+
+    def _columns(self):
+        return (
+            self.day, self.timestamp, self.member, self.ticket, self.kind, self.effort, self.detail,
+        )
+
+    TABLES = ("members", "tickets", "details")
+
+    def state(self):
+        """
+        Return ``(first, counts, tables, columns)`` describing the retained
+        events, for serialization.
+        """
+        tables = {name: getattr(self, name).values for name in self.TABLES}
+        columns = dict(zip(("day", "timestamp", "member", "ticket", "kind", "effort", "detail"), self._columns()))
+        return self.first, list(self._counts), tables, columns
+
+    @classmethod
+    def from_state(cls, first, counts, tables, columns, sink=None, retain=None, record_events=True):
+        """Rebuild a log from ``state()`` output; columns are copied."""
+        log = cls(sink=sink, retain=retain, record_events=record_events)
+        log.first = first
+        # Logs saved before a kind was added carry fewer counts
+        log._counts[:len(counts)] = counts
+        for name in cls.TABLES:
+            table = getattr(log, name)
+            table.values = list(tables[name])
+            table.codes = dict(zip(table.values, range(len(table.values))))
+        for name, data in columns.items():
+            getattr(log, name).frombytes(data)
+        return log
+
+    def note(self, text, day=None):
+        """
+        Append a free-text line, rendered verbatim.
+
+        :param day: Day index; defaults to the day of the last retained event.
+        """
+        if day is None:
+            day = self.day[-1] if self.day else 0
+        self.emit(day, EventKind.NOTE, detail=text)
+
+    def discard(self):
+        """Drop every retained event; counts and global indices are kept."""
+        self._trim(len(self.kind))
+
+    def flush(self):
+        """Flush the sink, if any."""
+        if self.sink is not None:
+            self.sink.flush()
+
+    def member_code(self, name):
+        """Intern a member name for ``emit_batch``."""
+        return self.members.code(name)
+
+    def ticket_code(self, ticket_id):
+        """Intern a ticket id for ``emit_batch``."""
+        return self.tickets.code(ticket_id)
+
+    def count(self, kind):
+        """Return how many events of ``kind`` were emitted."""
+        return self._counts[kind]
+
+    def __len__(self):
+        return self.first + len(self.kind)
+
+    def record(self, i):
+        """Return event ``i`` (a global index) with names and details decoded."""
+        if i < self.first:
+            raise IndexError(f"event {i} is no longer retained")
+        i -= self.first
+        ts = self.timestamp[i]
+        return Event(
+            self.day[i],
+            None if ts == NO_TIMESTAMP else ts,
+            self.members.get(self.member[i]),
+            self.tickets.get(self.ticket[i]),
+            EventKind(self.kind[i]),
+            self.effort[i],
+            self.details.get(self.detail[i]),
+        )
+
+    def records(self, start=0, stop=None):
+        """Iterate retained decoded events in ``[start, stop)``."""
+        stop = len(self) if stop is None else stop
+        return (self.record(i) for i in range(max(start, self.first), stop))
+
+    def render(self, i):
+        """Render event ``i`` as a text log line."""
+        return render_event(self.record(i))
+
+    def lines(self, start=0, stop=None):
+        """
+        Return a lazy sequence of text lines for retained events in
+        ``[start, stop)``.
+        """
+        return LogLines(self, start, stop)
+
+
+def render_event(event):
+    """Render an ``Event`` in the simulator's text log format."""
+    day, ts, member, ticket, kind, effort, detail = event
+    if kind == EventKind.NOTE:
+        return detail
+    if kind == EventKind.STANDUP:
+        return "\n".join(
+            [f"Day {day} Standup"]
+            + [f"- {name}: {done} tickets completed" for name, done in detail]
+        )
+    if member is None:
+        # Simulator-level notices carry neither member nor timestamp
+        return f"Day {day} | {ticket} blocked waiting for {','.join(detail)}"
+
+    prefix = f"Day {day}" if ts is None else format_timestamp(ts)
+    if kind == EventKind.PLANNING:
+        text = "Planning and standup"
+    elif kind == EventKind.STARTED:
+        text = f"Started {ticket}: {detail}"
+    elif kind == EventKind.COMPLETED:
+        text = f"Completed {ticket} in {effort} pts"
+    elif kind == EventKind.ESCALATED:
+        text = f"Escalating {ticket} to senior engineer"
+    elif kind == EventKind.BLOCKED:
+        text = f"Blocked on {ticket} waiting for {','.join(detail)}"
+    elif kind == EventKind.UNABLE:
+        text = f"Unable to work on {ticket}"
+    elif kind == EventKind.WRAP_UP:
+        text = "Wrap up and documentation"
+    else:
+        text = "After-hours incident response"
+    return f"{prefix} | {member} | {text}"
+
+
+class LogLines(Sequence):
+    """
+    Sequence of log lines rendered from an EventLog on access.
+
+    ``append`` and ``extend`` add free-text lines to the log as
+    ``EventKind.NOTE`` events, like appending to the list it replaces.
+    """
+
+    def __init__(self, log, start=0, stop=None):
+        self._log = log
+        self._start = start
+        self._stop = stop
+
+    def _bounds(self):
+        stop = len(self._log) if self._stop is None else self._stop
+        return max(self._start, self._log.first), stop
+
+    @property
+    def log(self):
+        """The EventLog the lines are rendered from."""
+        return self._log
+
+    def __len__(self):
+        start, stop = self._bounds()
+        return max(0, stop - start)
+
+    def __getitem__(self, i):
+        start, stop = self._bounds()
+        if isinstance(i, slice):
+            return [self._log.render(start + j) for j in range(*i.indices(stop - start))]
+        if i < 0:
+            i += stop - start
+        if not 0 <= i < stop - start:
+            raise IndexError(i)
+        return self._log.render(start + i)
+
+    def __iter__(self):
+        start, stop = self._bounds()
+        return (self._log.render(i) for i in range(start, stop))
+
+    def append(self, line):
+        self._log.note(line)
+
+    def extend(self, lines):
+        for line in lines:
+            self._log.note(line)
+
+    def __iadd__(self, lines):
+        self.extend(lines)
+        return self
+
+    def __repr__(self):
+        return f"LogLines({len(self)} lines)"
@@ -9,28 +9,34 @@ import argparse
 from datetime import datetime
 
 from ticket_system import TicketGenerator
-from team_members import TeamMember
 from sprint_planning import simulate_triage_meeting
 
 
 def build_team():
     """
     Define the default team composition for the sprint simulation.
+
+    The roster is fixed and valid, so members are built without validation.
     """
+    from models import TeamMember, construct
+
     return [
-        TeamMember(
+        construct(
+            TeamMember,
             name="dev_engineer",
             role="Senior Developer/DevOps Engineer",
             skill_level=9,
             specialties=["Python", "Java", "Infrastructure Automation"],
         ),
-        TeamMember(
+        construct(
+            TeamMember,
             name="senior_syseng",
             role="Senior Information Systems Engineer",
             skill_level=8,
             specialties=["Google Workspace", "Email Architecture", "Authentication Systems"],
         ),
-        TeamMember(
+        construct(
+            TeamMember,
             name="junior_syseng_tech",
             role="Junior Information Systems Engineer (Technical)",
             skill_level=5,
@@ -42,13 +48,15 @@ def build_team():
                 "Adobe Enterprise License Management",
             ],
         ),
-        TeamMember(
+        construct(
+            TeamMember,
             name="junior_syseng_a",
             role="Junior Information Systems Engineer A",
             skill_level=4,
             specialties=["User Provisioning", "Permissions Management", "Documentation"],
         ),
-        TeamMember(
+        construct(
+            TeamMember,
             name="junior_syseng_b",
             role="Junior Information Systems Engineer B",
             skill_level=4,
@@ -59,7 +67,8 @@ def build_team():
                 "Compliance Support",
             ],
         ),
-        TeamMember(
+        construct(
+            TeamMember,
             name="project_manager",
             role="Project Manager",
             skill_level=7,
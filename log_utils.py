@@ -1,9 +1,119 @@
 # Utility functions for timestamped log generation.
-from datetime import datetime, timedelta, time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import random
 
 
-def generate_realistic_timestamp_logs(day_index=1, after_hours=False):
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+SECONDS_PER_DAY = 24 * 3600
+DAY_START = 8 * 3600
+LUNCH_START = 12 * 3600
+LUNCH_END = 13 * 3600
+END_OF_DAY = 18 * 3600
+AFTER_HOURS_END = 22 * 3600
+
+
+def epoch_seconds(epoch=None):
+    """Return midnight of ``epoch`` (a date or datetime; default today) as
+    integer seconds since 1970-01-01."""
+    if epoch is None:
+        epoch = date.today()
+    if isinstance(epoch, datetime):
+        epoch = epoch.date()
+    return (epoch.toordinal() - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+class WorkdayClock:
+    """Integer-second clock for one member's simulated work day.
+
+    Parameters
+    ----------
+    day_index : int
+        Index of the simulated day (1-based).
+    after_hours : bool
+        If True, timestamps may extend past business hours (up to 22:00).
+    rng : random.Random, optional
+        Random stream used for the increments. Defaults to the global
+        ``random`` module.
+    epoch : date or datetime, optional
+        Date of day 1 of the sprint. Defaults to today; pass a fixed date to
+        make timelines reproducible across runs and processes.
+
+    Timestamps are integer seconds since 1970-01-01; use
+    ``format_timestamp`` to render them.
+    """
+
+    __slots__ = ("after_hours", "rng", "midnight", "current", "_started")
+
+    def __init__(self, day_index=1, after_hours=False, rng=None, epoch=None):
+        self.after_hours = after_hours
+        self.rng = rng if rng is not None else random
+        self.midnight = epoch_seconds(epoch) + (day_index - 1) * SECONDS_PER_DAY
+        self.current = self.midnight + DAY_START
+        self._started = False
+
+    def tick(self, force_after_hours=False):
+        """Advance 15-45 minutes (skipping lunch) and return the new time.
+
+        The first call returns the 08:00 start of day. With
+        ``force_after_hours`` the time jumps 15-60 minutes past 18:00 if it
+        is still within business hours.
+        """
+        if not self._started:
+            self._started = True
+            return self.current
+
+        midnight = self.midnight
+        rel = self.current - midnight + self.rng.randint(15, 45) * 60
+        if LUNCH_START <= rel < LUNCH_END:
+            rel += LUNCH_END - LUNCH_START
+
+        if force_after_hours and rel < END_OF_DAY:
+            rel = END_OF_DAY + self.rng.randint(15, 60) * 60
+        if not self.after_hours and rel > END_OF_DAY:
+            rel = END_OF_DAY
+        if self.after_hours and rel > AFTER_HOURS_END:
+            rel = AFTER_HOURS_END
+        self.current = midnight + rel
+        return self.current
+
+    def batch(self, count):
+        """Return the next ``count`` timestamps in one call.
+
+        Draws exactly the same random increments as ``count`` calls to
+        ``tick()``.
+        """
+        tick = self.tick
+        return [tick() for _ in range(count)]
+
+
+@lru_cache(maxsize=1024)
+def _date_prefix(day_number):
+    return date.fromordinal(_EPOCH_ORDINAL + day_number).isoformat()
+
+
+def format_timestamp(seconds):
+    """Format integer seconds since 1970-01-01 as ``YYYY-MM-DD HH:MM:SS``."""
+    day_number, rel = divmod(seconds, SECONDS_PER_DAY)
+    hours, rel = divmod(rel, 3600)
+    minutes, secs = divmod(rel, 60)
+    return f"{_date_prefix(day_number)} {hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def to_seconds(value):
+    """Return a naive datetime, or a date at midnight, as integer seconds since 1970-01-01."""
+    if not isinstance(value, datetime):
+        return epoch_seconds(value)
+    return epoch_seconds(value) + value.hour * 3600 + value.minute * 60 + value.second
+
+
+def from_seconds(seconds):
+    """Return integer seconds since 1970-01-01 as a naive datetime."""
+    return datetime(1970, 1, 1) + timedelta(seconds=seconds)
+
+
+def generate_realistic_timestamp_logs(day_index=1, after_hours=False, rng=None, epoch=None):
     """Return a generator yielding sequential timestamp strings.
 
     Parameters
@@ -12,6 +122,11 @@ def generate_realistic_timestamp_logs(day_index=1, after_hours=False):
         Index of the simulated day (1-based).
     after_hours : bool
         If True, timestamps may extend past business hours.
+    rng : random.Random, optional
+        Random stream used for the increments. Defaults to the global
+        ``random`` module.
+    epoch : date or datetime, optional
+        Date of day 1; defaults to today.
 
     Returns
     -------
@@ -19,36 +134,14 @@ def generate_realistic_timestamp_logs(day_index=1, after_hours=False):
         Function that when called returns the next timestamp string in
         ``YYYY-MM-DD HH:MM:SS`` format.
     """
-    base_date = datetime.now().date() + timedelta(days=day_index - 1)
-    current = datetime.combine(base_date, time(8, 0))
-    lunch_start = datetime.combine(base_date, time(12, 0))
-    lunch_end = datetime.combine(base_date, time(13, 0))
-    end_of_day = datetime.combine(base_date, time(18, 0))
-    after_end = datetime.combine(base_date, time(22, 0))
-
-    first = True
+    clock = WorkdayClock(day_index, after_hours, rng=rng, epoch=epoch)
 
     def next_timestamp(force_after_hours=False):
-        nonlocal current, first
-        if first:
-            first = False
-            return current.strftime("%Y-%m-%d %H:%M:%S")
-
-        increment = timedelta(minutes=random.randint(15, 45))
-        current += increment
-        if current >= lunch_start and current < lunch_end:
-            current = lunch_end + (current - lunch_start)
-
-        if force_after_hours and current < end_of_day:
-            current = end_of_day + timedelta(minutes=random.randint(15, 60))
-        if not after_hours and current > end_of_day:
-            current = end_of_day
-        if after_hours and current > after_end:
-            current = after_end
-        return current.strftime("%Y-%m-%d %H:%M:%S")
+        return format_timestamp(clock.tick(force_after_hours))
 
     # expose current datetime for inspection
     def _current():
-        return current
+        return from_seconds(clock.current)
     next_timestamp.current = _current
+    next_timestamp.clock = clock
     return next_timestamp
@@ -0,0 +1,314 @@
+"""
+Memory profiling of sprint simulations with ``tracemalloc``.
+
+``profile_scenario`` runs one fixed-seed scenario (team, backlog, simulation,
+metrics report, rendered log lines) under ``tracemalloc`` and records:
+
+- ``stages``: peak bytes above the stage's start and bytes retained after it,
+  for each stage in ``STAGES``;
+- ``phases``: the same per ``SprintSimulator`` phase (standup, assignment,
+  work, ...), from ``SprintSimulator(profile="memory")``;
+- ``types``: bytes per object for the main object types: a ``Ticket``
+  model, a ``TicketStore`` row, a ``TeamMember``, a logged event, a
+  rendered log line and a metrics report;
+- ``bytes_per_ticket``: everything the scenario retains, apart from
+  rendered log lines, divided by the backlog size.
+
+Peak RSS is measured separately, in a fresh interpreter without tracing
+(``measure_peak_rss``), because tracemalloc adds its own overhead to the
+process. The budget limits its growth over the child's warm-up baseline
+rather than the absolute peak, which depends on the interpreter build.
+``check_budget`` compares a reference scenario against the limits recorded
+in ``memory_budget.json``:
+
+    python memory_profiling.py --sizes 1000,10000,100000 --output memory_profile.json
+    python memory_profiling.py --budget memory_budget.json
+    python memory_profiling.py --update-budget memory_budget.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import tracemalloc
+
+from benchmarks import EPOCH, SEED, build_team
+from sprint_simulator import SprintSimulator
+from ticket_system import TicketGenerator
+
+
+STAGES = ("team", "generate", "simulate", "report", "render_logs")
+DEFAULT_SIZES = (1_000, 10_000)
+REFERENCE = {"tickets": 5_000, "team_size": 20, "sprint_length": 10, "engine": "object", "verbosity": "full"}
+BUDGET_FIELDS = ("bytes_per_ticket", "rss_growth_bytes")
+# Limits written by --update-budget, relative to the measured values
+BUDGET_HEADROOM = 1.25
+
+
+def _measure(func):
+    """Run ``func`` and return ``(result, peak bytes, retained bytes)`` above the start."""
+    gc.collect()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    return result, peak - base, current - base
+
+
+def _each(count, nbytes):
+    return {"count": count, "bytes_each": nbytes / count if count else 0.0}
+
+
+def _run(tickets, team_size, sprint_length, engine, verbosity, seed):
+    """Run a scenario untraced and return the simulator and its log lines."""
+    team = build_team(team_size)
+    sim = SprintSimulator(
+        team,
+        sprint_length_days=sprint_length,
+        rng=random.Random(seed),
+        engine=engine,
+        epoch=EPOCH,
+        verbosity=verbosity,
+    )
+    sim.sprint_backlog = TicketGenerator(rng=random.Random(seed)).generate_realistic_tickets(tickets)
+    sim.run_complete_simulation()
+    return sim, list(sim.daily_logs)
+
+
+def _warm_up(engine, verbosity):
+    """Run a tiny scenario so imports and pydantic model builds are not charged to the first stage."""
+    _run(10, 2, 1, engine, verbosity, SEED)
+    TicketGenerator(rng=random.Random(SEED)).generate_ticket_store(10)
+
+
+def profile_scenario(tickets, team_size=20, sprint_length=10, engine="object", verbosity="full", seed=SEED):
+    """
+    Profile the memory of one scenario.
+
+    :param tickets: Backlog size.
+    :param team_size: Members from ``benchmarks.build_team``.
+    :param sprint_length: Sprint length in business days.
+    :param engine: SprintSimulator engine.
+    :param verbosity: SprintSimulator verbosity.
+    :param seed: Seed of the backlog and of the simulator's rng.
+    :return: Dict with the scenario, ``stages``, ``phases``, ``types``,
+        ``bytes_per_ticket`` and ``peak_bytes`` (highest traced memory above
+        the scenario's start).
+    """
+    import events
+
+    _warm_up(engine, verbosity)
+    owns_tracing = not tracemalloc.is_tracing()
+    if owns_tracing:
+        tracemalloc.start()
+    try:
+        # The store is measured on its own and dropped before the scenario
+        store, _, store_bytes = _measure(
+            lambda: TicketGenerator(rng=random.Random(seed)).generate_ticket_store(tickets)
+        )
+        del store
+
+        gc.collect()
+        start = tracemalloc.get_traced_memory()[0]
+        stages = {}
+        peak = 0
+
+        def stage(name, func):
+            nonlocal peak
+            offset = tracemalloc.get_traced_memory()[0] - start
+            result, stage_peak, retained = _measure(func)
+            if name == "simulate":
+                # The memory profiler resets the tracemalloc peak every phase
+                stage_peak = max(stage_peak, sim.profiler.peak_traced - start - offset)
+            stages[name] = {"peak_bytes": stage_peak, "retained_bytes": retained}
+            peak = max(peak, offset + stage_peak)
+            return result
+
+        team = stage("team", lambda: build_team(team_size))
+        backlog = stage(
+            "generate", lambda: TicketGenerator(rng=random.Random(seed)).generate_realistic_tickets(tickets)
+        )
+        sim = SprintSimulator(
+            team,
+            sprint_length_days=sprint_length,
+            rng=random.Random(seed),
+            engine=engine,
+            epoch=EPOCH,
+            verbosity=verbosity,
+            profile="memory",
+        )
+        sim.sprint_backlog = backlog
+        before = tracemalloc.take_snapshot()
+        stage("simulate", sim.run_complete_simulation)
+        after = tracemalloc.take_snapshot()
+        event_bytes = sum(
+            stat.size_diff
+            for stat in after.compare_to(before, "filename")
+            if stat.traceback[0].filename == events.__file__
+        )
+        del before, after
+        report = stage("report", sim.generate_metrics_report)
+        lines = stage("render_logs", lambda: list(sim.daily_logs))
+    finally:
+        if owns_tracing:
+            tracemalloc.stop()
+
+    retained = sum(stages[name]["retained_bytes"] for name in STAGES if name != "render_logs")
+    return {
+        "tickets": tickets,
+        "team_size": team_size,
+        "sprint_length": sprint_length,
+        "engine": engine,
+        "verbosity": verbosity,
+        "stages": stages,
+        "phases": report["profile"]["memory"],
+        "types": {
+            "Ticket": _each(tickets, stages["generate"]["retained_bytes"]),
+            "TicketStore row": _each(tickets, store_bytes),
+            "TeamMember": _each(team_size, stages["team"]["retained_bytes"]),
+            "event": _each(len(sim.events), event_bytes),
+            "log line": _each(len(lines), stages["render_logs"]["retained_bytes"]),
+            "metrics report": _each(1, stages["report"]["retained_bytes"]),
+        },
+        "bytes_per_ticket": retained / tickets if tickets else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def _max_rss_bytes():
+    """Return this process's peak resident set size in bytes."""
+    # On Linux ru_maxrss of a freshly exec'd child can still report the
+    # parent's high-water mark, while VmHWM starts over at exec
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure_peak_rss(tickets, team_size=20, sprint_length=10, engine="object", verbosity="full", seed=SEED):
+    """
+    Run a scenario untraced in a fresh interpreter and return its RSS.
+
+    :return: Dict with ``baseline_rss_bytes`` (after imports and a warm-up),
+        ``peak_rss_bytes`` (after the scenario) of the child process and
+        ``rss_growth_bytes``, the difference between the two.
+    """
+    command = [
+        sys.executable, os.path.abspath(__file__), "--rss-only",
+        "--sizes", str(tickets), "--team-size", str(team_size), "--days", str(sprint_length),
+        "--engine", engine, "--verbosity", verbosity, "--seed", str(seed),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    rss = json.loads(result.stdout)
+    rss["rss_growth_bytes"] = rss["peak_rss_bytes"] - rss["baseline_rss_bytes"]
+    return rss
+
+
+def profile_memory(sizes=DEFAULT_SIZES, rss=False, **scenario):
+    """
+    Profile one scenario per backlog size.
+
+    :param sizes: Backlog sizes.
+    :param rss: Also measure peak RSS of each scenario in a child process.
+    :param scenario: Other ``profile_scenario`` options.
+    :return: Dict with the Python version and a report per size under
+        ``"scenarios"`` keyed ``tickets=<n>``.
+    """
+    scenarios = {}
+    for tickets in sizes:
+        report = profile_scenario(tickets, **scenario)
+        if rss:
+            report.update(measure_peak_rss(tickets, **scenario))
+        scenarios[f"tickets={tickets}"] = report
+    return {"python": sys.version.split()[0], "scenarios": scenarios}
+
+
+def check_budget(report, budget):
+    """
+    Compare a scenario report against a budget.
+
+    :param report: ``profile_scenario`` result, with ``rss_growth_bytes`` when
+        the budget limits it.
+    :param budget: Dict of limits for ``BUDGET_FIELDS``.
+    :return: List of human-readable overruns (empty when within budget).
+    """
+    failures = []
+    for field in BUDGET_FIELDS:
+        limit = budget.get(field)
+        if limit is not None and report[field] > limit:
+            failures.append(f"{field} {report[field]:.6g} exceeds budget {limit:.6g}")
+    return failures
+
+
+def run_budget_scenario(budget):
+    """Profile the budget's reference scenario, including its RSS growth."""
+    scenario = budget.get("scenario", REFERENCE)
+    report = profile_scenario(**scenario)
+    report.update(measure_peak_rss(**scenario))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile sprint simulation memory with tracemalloc.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated backlog sizes.")
+    parser.add_argument("--team-size", type=int, default=REFERENCE["team_size"], help="Team members.")
+    parser.add_argument("-d", "--days", type=int, default=REFERENCE["sprint_length"], help="Sprint length.")
+    parser.add_argument("-e", "--engine", default="object", choices=SprintSimulator.ENGINES)
+    parser.add_argument("--verbosity", default="full", choices=SprintSimulator.VERBOSITY)
+    parser.add_argument("-s", "--seed", type=int, default=SEED, help="Backlog and simulator seed.")
+    parser.add_argument("--rss", action="store_true", help="Also measure peak RSS per size.")
+    parser.add_argument("--rss-only", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("-o", "--output", default="memory_profile.json", help="Output JSON file name.")
+    parser.add_argument("--budget", help="Budget JSON to check the reference scenario against.")
+    parser.add_argument("--update-budget", metavar="PATH", help="Measure the reference scenario and write a budget.")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    scenario = {
+        "team_size": args.team_size,
+        "sprint_length": args.days,
+        "engine": args.engine,
+        "verbosity": args.verbosity,
+        "seed": args.seed,
+    }
+
+    if args.rss_only:
+        _warm_up(args.engine, args.verbosity)
+        baseline = _max_rss_bytes()
+        _run(sizes[0], **scenario)
+        print(json.dumps({"baseline_rss_bytes": baseline, "peak_rss_bytes": _max_rss_bytes()}))
+        return 0
+
+    if args.update_budget:
+        report = run_budget_scenario({"scenario": REFERENCE})
+        budget = {"scenario": REFERENCE, "headroom": BUDGET_HEADROOM}
+        budget.update((field, round(report[field] * BUDGET_HEADROOM)) for field in BUDGET_FIELDS)
+        with open(args.update_budget, "w") as f:
+            json.dump(budget, f, indent=2)
+        return 0
+
+    if args.budget:
+        with open(args.budget) as f:
+            budget = json.load(f)
+        failures = check_budget(run_budget_scenario(budget), budget)
+        for failure in failures:
+            print(f"OVER BUDGET {failure}")
+        return 1 if failures else 0
+
+    report = profile_memory(sizes, rss=args.rss, **scenario)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Pydantic models for tickets and team members.
+
+``ticket_system`` and ``team_members`` re-export these lazily, so modules
+that only need the generator, capability tables or ticket views do not pay
+for importing pydantic. Schemas are built on first validation rather than at
+class creation, and values the simulator produces itself can skip validation
+entirely through ``construct()``.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+try:
+    from pydantic import ConfigDict
+except ImportError:  # pydantic 1.x
+    ConfigDict = None
+
+
+def construct(model, **fields):
+    """
+    Build ``model`` from fields that are already valid, without validation.
+
+    Use only for values created by the simulator itself (generated tickets,
+    cloned rosters, validated import records); user input goes through the
+    model constructor.
+    """
+    build = getattr(model, "model_construct", None) or model.construct
+    return build(**fields)
+
+
+class Ticket(BaseModel):
+    """
+    Representation of a work ticket.
+    """
+    if ConfigDict is not None:
+        model_config = ConfigDict(defer_build=True)
+
+    ticket_id: str
+    source: str  # 'ServiceNow' or 'Jira'
+    priority: str  # 'Critical', 'High', 'Medium', 'Low'
+    category: str
+    description: str
+    estimated_effort: Optional[int] = None
+    actual_effort: Optional[int] = None
+    status: str = 'Open'
+    assigned_to: Optional[str] = None
+    created_timestamp: Optional[datetime] = None
+    completed_timestamp: Optional[datetime] = None
+    dependencies: List[str] = Field(default_factory=list)
+
+
+class TeamMember(BaseModel):
+    """
+    Representation of a team member and their capabilities.
+    """
+    if ConfigDict is not None:
+        model_config = ConfigDict(defer_build=True)
+
+    name: str
+    role: str
+    skill_level: int  # 1-10 scale
+    specialties: List[str]
+    availability: float = 1.0  # fraction of capacity (0.0-1.0)
+    current_workload: int = 0
+    completed_tickets: List[str] = Field(default_factory=list)
+
+    def can_handle_ticket(self, ticket) -> bool:
+        """
+        Determine if this member can handle the given ticket.
+        """
+        # Project managers typically don't work tickets directly
+        if self.role.lower().startswith("project manager"):
+            return False
+
+        # If the ticket category matches one of the member's specialties,
+        # we assume they can handle it.
+        if ticket.category in self.specialties:
+            return True
+
+        # Senior members (skill level >=7) can generally help with any ticket
+        return self.skill_level >= 7
+
+    def estimate_effort(self, ticket) -> int:
+        """
+        Estimate effort (e.g., story points or time) for the ticket.
+        """
+        base = ticket.estimated_effort or 1
+
+        # Higher skill reduces effort while low availability increases it
+        skill_factor = max(0.5, 1.5 - (self.skill_level / 10))
+        avail_factor = 1 / self.availability if self.availability > 0 else 2
+
+        effort = int(round(base * skill_factor * avail_factor))
+        return max(1, effort)
@@ -0,0 +1,155 @@
+"""
+Parallel Monte Carlo runner producing sprint outcome distributions.
+
+Each run generates its own backlog and plays a full sprint with a private
+``random.Random`` stream derived from the base seed and the run index, so the
+result does not depend on how runs are spread over worker processes.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from sprint_simulator import SprintSimulator
+from team_members import clone_team
+from ticket_system import TicketGenerator
+
+
+PERCENTILES = (5, 25, 50, 75, 95)
+SCALAR_METRICS = ("completed_tickets", "velocity", "escalations")
+
+
+def run_rng(seed, run_index):
+    """Return the independent random stream for one run."""
+    return random.Random(f"{seed}:{run_index}")
+
+
+def simulate_run(team, num_tickets, sprint_length, rng):
+    """Simulate one sprint on a fresh copy of ``team`` and return its metrics."""
+    members = clone_team(team)
+    sim = SprintSimulator(members, sprint_length_days=sprint_length, rng=rng, verbosity="off")
+    sim.sprint_backlog = TicketGenerator(rng=rng).generate_realistic_tickets(num_tickets)
+    sim.run_complete_simulation()
+    return sim.metrics
+
+
+def _run_batch(team, num_tickets, sprint_length, seed, start, stop):
+    """
+    Run simulations ``start``..``stop`` and return value histograms only.
+
+    Returning histograms instead of per-run metrics keeps what crosses the
+    process boundary small regardless of batch size.
+    """
+    scalars = {name: Counter() for name in SCALAR_METRICS}
+    utilization = {m.name: Counter() for m in team}
+    for run_index in range(start, stop):
+        metrics = simulate_run(team, num_tickets, sprint_length, run_rng(seed, run_index))
+        for name in SCALAR_METRICS:
+            scalars[name][metrics[name]] += 1
+        for name, workload in metrics["utilization"].items():
+            utilization[name][workload] += 1
+    return scalars, utilization
+
+
+def summarize_histogram(hist):
+    """Return mean, min, max and percentiles for a value -> count histogram."""
+    total = sum(hist.values())
+    if not total:
+        return {}
+    ordered = sorted(hist.items())
+    summary = {
+        "mean": sum(v * c for v, c in ordered) / total,
+        "min": ordered[0][0],
+        "max": ordered[-1][0],
+    }
+    for p in PERCENTILES:
+        rank = max(1, math.ceil(p * total / 100))
+        seen = 0
+        for value, count in ordered:
+            seen += count
+            if seen >= rank:
+                summary[f"p{p}"] = value
+                break
+    return summary
+
+
+def run_monte_carlo(team, runs=1000, num_tickets=20, sprint_length=10, seed=0, processes=None):
+    """
+    Run ``runs`` independent sprint simulations and aggregate the outcomes.
+
+    :param team: List of TeamMember instances; every run uses a fresh clone.
+    :param runs: Number of simulated sprints.
+    :param num_tickets: Backlog size generated for each run.
+    :param sprint_length: Sprint length in business days.
+    :param seed: Base seed; run ``i`` uses a stream derived from ``(seed, i)``.
+    :param processes: Worker processes (defaults to the CPU count). ``1``
+        runs everything in the calling process.
+    :return: Dict of distribution summaries per metric.
+    """
+    processes = processes or os.cpu_count() or 1
+    team = clone_team(team)
+    batches = max(1, min(runs, processes * 4))
+    bounds = [(runs * i // batches, runs * (i + 1) // batches) for i in range(batches)]
+
+    if processes == 1:
+        results = [
+            _run_batch(team, num_tickets, sprint_length, seed, start, stop)
+            for start, stop in bounds
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(_run_batch, team, num_tickets, sprint_length, seed, start, stop)
+                for start, stop in bounds
+            ]
+            results = [f.result() for f in futures]
+
+    scalars = {name: Counter() for name in SCALAR_METRICS}
+    utilization = {m.name: Counter() for m in team}
+    for batch_scalars, batch_util in results:
+        for name, hist in batch_scalars.items():
+            scalars[name].update(hist)
+        for name, hist in batch_util.items():
+            utilization[name].update(hist)
+
+    report = {"runs": runs, "seed": seed}
+    for name in SCALAR_METRICS:
+        report[name] = summarize_histogram(scalars[name])
+    report["utilization"] = {
+        name: summarize_histogram(hist) for name, hist in utilization.items()
+    }
+    return report
+
+
+def main():
+    from generate_pre_sprint_analysis import build_team
+
+    parser = argparse.ArgumentParser(
+        description="Run Monte Carlo sprint simulations and report outcome distributions."
+    )
+    parser.add_argument("-r", "--runs", type=int, default=1000, help="Number of simulated sprints.")
+    parser.add_argument("-n", "--num-tickets", type=int, default=20, help="Tickets generated per run.")
+    parser.add_argument("-d", "--days", type=int, default=10, help="Sprint length in business days.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Base random seed.")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="Worker processes.")
+    parser.add_argument("-o", "--output", default="monte_carlo.json", help="Output JSON file name.")
+    args = parser.parse_args()
+
+    report = run_monte_carlo(
+        build_team(),
+        runs=args.runs,
+        num_tickets=args.num_tickets,
+        sprint_length=args.days,
+        seed=args.seed,
+        processes=args.processes,
+    )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Organization-level simulation of many teams working in lockstep.
+
+``OrganizationSimulator`` runs one ``SprintSimulator`` shard per team. Shards
+are spread over worker processes and advanced one day at a time: every worker
+simulates the day for its teams, reports which cross-team tickets closed, and
+the coordinator forwards those closures to the teams depending on them before
+the next day starts. A team's tickets that depend on another team's tickets
+stay blocked until the closure message arrives, so, as within a team, work
+unblocks the day after its dependency closes.
+
+Only tickets some other team depends on are ever reported. They are numbered
+once up front and closure messages are packed arrays of those numbers, so no
+ticket objects cross process boundaries after start-up. Each day costs as much
+as the slowest worker, not the sum of all teams. If a worker raises, the
+others are stopped and ``run`` re-raises the worker's exception, with the
+worker's traceback as its cause.
+
+Every team draws from its own random stream derived from the seed and the
+team name, so results do not depend on the number of processes.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import pickle
+import random
+import traceback
+from array import array
+from datetime import date
+
+from sprint_simulator import SprintSimulator
+
+
+ORG_TOTALS = ("total_tickets", "completed_tickets", "velocity", "escalations", "blocks", "after_hours")
+
+
+def team_rng(seed, team_name):
+    """Return the independent random stream of one team."""
+    return random.Random(f"{seed}:{team_name}")
+
+
+class _Shard:
+    """One team's simulator plus its side of the cross-team protocol."""
+
+    def __init__(self, name, members, backlog, exports, imports, sprint_length, seed, engine, epoch):
+        self.name = name
+        self.sim = SprintSimulator(
+            members, sprint_length_days=sprint_length, rng=team_rng(seed, name), engine=engine, epoch=epoch
+        )
+        self.sim.sprint_backlog = list(backlog)
+        self.exports = exports  # ticket id -> code, for this team's tickets others need
+        self.imports = imports  # code -> ticket id, for other teams' tickets this team needs
+        self.sim.block_on_external(imports.values())
+        self._reported = 0
+
+    def run_day(self, closed_codes):
+        """Apply closures from other teams, simulate one day, return own closures."""
+        resolved = [self.imports[c] for c in closed_codes if c in self.imports]
+        if resolved:
+            self.sim.resolve_external(resolved)
+        self.sim.continue_simulation(days=1)
+
+        completed = self.sim.completed_work
+        closed = array("i", (
+            self.exports[t.ticket_id] for t in completed[self._reported:] if t.ticket_id in self.exports
+        ))
+        self._reported = len(completed)
+        return closed
+
+    def result(self):
+        return self.sim.metrics or self.sim.generate_metrics_report()
+
+
+def _build_shards(specs, sprint_length, seed, engine, epoch):
+    return [_Shard(*spec, sprint_length, seed, engine, epoch) for spec in specs]
+
+
+def _run_day(shards, closed):
+    out = array("i")
+    for shard in shards:
+        out.extend(shard.run_day(closed))
+    return out
+
+
+class _RemoteTraceback(Exception):
+    """Carries a worker's formatted traceback as the cause of its error."""
+
+    def __init__(self, tb):
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self):
+        return self.tb
+
+
+class _WorkerFailure:
+    """A worker's exception and traceback, sent back to the coordinator."""
+
+    def __init__(self, exc, tb):
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(f"{type(exc).__name__}: {exc}")
+        self.exc = exc
+        self.tb = tb
+
+
+def _worker(conn, specs, sprint_length, seed, engine, epoch):
+    """Process loop: build shards, then answer one message per day."""
+    try:
+        shards = _build_shards(specs, sprint_length, seed, engine, epoch)
+        conn.send(None)
+        while True:
+            message = conn.recv()
+            if message is None:
+                conn.send({shard.name: shard.result() for shard in shards})
+                return
+            closed = array("i")
+            closed.frombytes(message)
+            conn.send(_run_day(shards, closed).tobytes())
+    except EOFError:
+        # The coordinator closed the pipe after another worker failed
+        return
+    except BaseException as exc:
+        conn.send(_WorkerFailure(exc, traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+def _receive(conn):
+    """Return a worker's reply, re-raising the worker's exception if it failed."""
+    reply = conn.recv()
+    if isinstance(reply, _WorkerFailure):
+        raise reply.exc from _RemoteTraceback(reply.tb)
+    return reply
+
+
+class OrganizationSimulator:
+    """Lockstep simulation of several teams with cross-team dependencies."""
+
+    def __init__(self, teams, sprint_length_days=10, seed=0, processes=None, engine="object", epoch=None):
+        """
+        :param teams: Mapping of team name to ``(members, backlog)``. Ticket
+            ids must be unique across the organization; a dependency on a
+            ticket in another team's backlog blocks until that team closes it.
+        :param sprint_length_days: Sprint length in business days.
+        :param seed: Base seed; each team's stream derives from it and the
+            team name.
+        :param processes: Worker processes (defaults to the CPU count, at most
+            one per team). ``1`` runs every team in the calling process.
+        :param engine: SprintSimulator engine used by every team.
+        :param epoch: Date of day 1; defaults to today.
+        """
+        self.teams = dict(teams)
+        self.sprint_length = sprint_length_days
+        self.seed = seed
+        self.engine = engine
+        self.epoch = epoch if epoch is not None else date.today()
+        self.processes = max(1, min(processes or os.cpu_count() or 1, len(self.teams) or 1))
+        self.messages = 0
+        self.metrics = {}
+
+    def _shard_specs(self):
+        """Number cross-team tickets and give each team its exports/imports."""
+        owner = {}
+        for name, (_, backlog) in self.teams.items():
+            for ticket in backlog:
+                if ticket.status != "Closed":
+                    owner[ticket.ticket_id] = name
+
+        codes = {}
+        imports = {name: {} for name in self.teams}
+        for name, (_, backlog) in self.teams.items():
+            for ticket in backlog:
+                for dep in ticket.dependencies:
+                    if owner.get(dep, name) != name:
+                        code = codes.setdefault(dep, len(codes))
+                        imports[name][code] = dep
+
+        return [
+            (
+                name,
+                members,
+                backlog,
+                {t.ticket_id: codes[t.ticket_id] for t in backlog if t.ticket_id in codes},
+                imports[name],
+            )
+            for name, (members, backlog) in self.teams.items()
+        ]
+
+    def run(self):
+        """Simulate the sprint for every team and return the org metrics."""
+        specs = self._shard_specs()
+        if self.processes == 1:
+            shards = _build_shards(specs, self.sprint_length, self.seed, self.engine, self.epoch)
+            closed = array("i")
+            for _ in range(self.sprint_length):
+                closed = _run_day(shards, closed)
+                self.messages += len(closed)
+            results = {shard.name: shard.result() for shard in shards}
+        else:
+            results = self._run_processes(specs)
+
+        self.metrics = self._aggregate(results)
+        return self.metrics
+
+    def _run_processes(self, specs):
+        groups = [specs[i::self.processes] for i in range(self.processes)]
+        context = multiprocessing.get_context()
+        connections, workers = [], []
+        for group in groups:
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_worker,
+                args=(child, group, self.sprint_length, self.seed, self.engine, self.epoch),
+                daemon=True,
+            )
+            worker.start()
+            child.close()
+            connections.append(parent)
+            workers.append(worker)
+
+        finished = False
+        try:
+            for conn in connections:
+                _receive(conn)
+            closed = b""
+            for _ in range(self.sprint_length):
+                # Broadcast yesterday's closures, then wait for the slowest worker
+                for conn in connections:
+                    conn.send(closed)
+                closed = b"".join(_receive(conn) for conn in connections)
+                self.messages += len(closed) // array("i").itemsize
+            results = {}
+            for conn in connections:
+                conn.send(None)
+                results.update(_receive(conn))
+            finished = True
+        finally:
+            # After a failure the other workers still wait for the next day's
+            # message, so they are stopped rather than joined
+            for conn in connections:
+                conn.close()
+            for worker in workers:
+                if not finished:
+                    worker.terminate()
+                worker.join()
+        return results
+
+    def _aggregate(self, results):
+        totals = dict.fromkeys(ORG_TOTALS, 0)
+        for metrics in results.values():
+            for name in ORG_TOTALS:
+                totals[name] += metrics[name]
+        return {
+            "teams": {name: results[name] for name in self.teams},
+            "totals": totals,
+            "cross_team_closures": self.messages,
+        }
+
+
+def main():
+    from generate_pre_sprint_analysis import build_team
+    from ticket_system import TicketGenerator
+
+    parser = argparse.ArgumentParser(description="Simulate a sprint for many teams in lockstep.")
+    parser.add_argument("-t", "--teams", type=int, default=8, help="Number of teams.")
+    parser.add_argument("-n", "--num-tickets", type=int, default=200, help="Tickets per team.")
+    parser.add_argument("-x", "--cross-team", type=float, default=0.05,
+                        help="Fraction of tickets depending on another team's ticket.")
+    parser.add_argument("-d", "--days", type=int, default=10, help="Sprint length in business days.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Base random seed.")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="Worker processes.")
+    parser.add_argument("-o", "--output", default="org_metrics.json", help="Output JSON file name.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    teams = {}
+    for t in range(args.teams):
+        backlog = TicketGenerator(rng=rng).generate_realistic_tickets(args.num_tickets)
+        for ticket in backlog:
+            ticket.ticket_id = f"T{t}-{ticket.ticket_id}"
+            ticket.dependencies = [f"T{t}-{dep}" for dep in ticket.dependencies]
+        teams[f"team_{t}"] = (build_team(), backlog)
+    names = list(teams)
+    for t, name in enumerate(names):
+        for ticket in teams[name][1]:
+            if len(names) > 1 and rng.random() < args.cross_team:
+                other = teams[names[(t + rng.randrange(1, len(names))) % len(names)]][1]
+                ticket.dependencies.append(rng.choice(other).ticket_id)
+
+    org = OrganizationSimulator(teams, sprint_length_days=args.days, seed=args.seed, processes=args.processes)
+    with open(args.output, "w") as f:
+        json.dump(org.run(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
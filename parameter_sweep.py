@@ -0,0 +1,283 @@
+"""
+Parameter sweeps with common random numbers.
+
+A sweep runs every scenario against the same replications: replication ``r``
+draws its backlog from the stream ``monte_carlo.run_rng(seed, r)``, and with
+logging off the simulation itself consumes no randomness. Every scenario
+therefore works the same backlogs, and the difference between two scenarios
+in a replication is due to the parameter change alone.
+
+Each backlog is generated once per replication and copied for every
+scenario. Scenarios that differ only in ``sprint_length`` share their
+prefix: one run is taken to the longest length and reports metrics as each
+shorter length is reached. Replications are spread over worker processes in
+batches, and the results come back as one tidy table with a row per
+scenario and replication.
+
+Scenario keys:
+
+- ``escalation_threshold``: ``DailyWorkSimulator.ESCALATION_THRESHOLD``.
+- ``sprint_length``: sprint length in business days.
+- ``members``: team composition as a sequence of member names from the base
+  team; repeating a name adds another copy of that member.
+- ``availability.<name>`` / ``skill_level.<name>``: override one member.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from monte_carlo import run_rng
+from sprint_simulator import SprintSimulator
+from team_members import clone_team
+
+
+METRICS = ("completed_tickets", "velocity", "escalations", "blocks", "after_hours", "remaining_points")
+MEMBER_FIELDS = ("availability", "skill_level")
+
+
+def expand_grid(axes):
+    """
+    Return the cartesian product of ``axes`` as a list of scenarios.
+
+    :param axes: Dict of scenario key -> list of values, e.g.
+        ``{"escalation_threshold": [4, 5, 6], "sprint_length": [5, 10]}``.
+    """
+    keys = list(axes)
+    return [dict(zip(keys, values)) for values in itertools.product(*(axes[k] for k in keys))]
+
+
+def _normalize(scenario, team):
+    """Validate ``scenario`` against ``team`` and return it with tuples for members."""
+    names = [m.name for m in team]
+    scenario = dict(scenario)
+    for key, value in scenario.items():
+        field, _, member = key.partition(".")
+        if key in ("escalation_threshold", "sprint_length"):
+            continue
+        if key == "members":
+            unknown = set(value) - set(names)
+            if unknown:
+                raise ValueError(f"Unknown members {sorted(unknown)} in scenario {scenario}")
+            scenario[key] = tuple(value)
+        elif field in MEMBER_FIELDS and member in names:
+            continue
+        else:
+            raise ValueError(f"Unknown scenario key {key!r}")
+    return scenario
+
+
+def build_scenario_team(team, scenario):
+    """
+    Return a fresh roster for ``scenario``.
+
+    Copies of a member listed more than once in ``members`` are named
+    ``<name>_2``, ``<name>_3``, ...
+    """
+    by_name = {m.name: m for m in team}
+    roster = clone_team([by_name[name] for name in scenario.get("members", by_name)])
+    seen = {}
+    for member in roster:
+        base = member.name
+        for field in MEMBER_FIELDS:
+            value = scenario.get(f"{field}.{base}")
+            if value is not None:
+                setattr(member, field, value)
+        seen[base] = seen.get(base, 0) + 1
+        if seen[base] > 1:
+            member.name = f"{base}_{seen[base]}"
+    return roster
+
+
+def _prefix_groups(scenarios):
+    """
+    Group scenario indices by everything except ``sprint_length``.
+
+    :return: List of ``(scenario, {length: [indices]})`` pairs.
+    """
+    groups = {}
+    for i, scenario in enumerate(scenarios):
+        key = tuple(sorted((k, v) for k, v in scenario.items() if k != "sprint_length"))
+        lengths = groups.setdefault(key, (scenario, {}))[1]
+        lengths.setdefault(scenario.get("sprint_length"), []).append(i)
+    return list(groups.values())
+
+
+def _row_metrics(metrics):
+    burndown = metrics["burndown"]
+    row = {name: metrics[name] for name in METRICS if name in metrics}
+    row["remaining_points"] = burndown[-1]["remaining_points"] if burndown else None
+    return row
+
+
+def _run_replications(team, groups, num_tickets, sprint_length, seed, engine, start, stop):
+    """Run replications ``start``..``stop`` of every scenario group and return result rows."""
+    from ticket_system import TicketGenerator
+
+    rows = []
+    for replication in range(start, stop):
+        rng = run_rng(seed, replication)
+        backlog = TicketGenerator(rng=rng).generate_ticket_store(num_tickets)
+        for scenario, lengths in groups:
+            days = sorted(sprint_length if length is None else length for length in lengths)
+            sim = SprintSimulator(
+                build_scenario_team(team, scenario),
+                sprint_length_days=days[-1],
+                engine=engine,
+                verbosity="off",
+                escalation_threshold=scenario.get("escalation_threshold"),
+            )
+            sim.sprint_backlog = backlog.copy().views()
+            for length, indices in sorted(lengths.items(), key=lambda item: item[0] or sprint_length):
+                sim.continue_simulation(days=(length or sprint_length) - sim.current_day)
+                metrics = _row_metrics(sim.generate_metrics_report())
+                rows.extend((i, replication, metrics) for i in indices)
+    return rows
+
+
+def run_sweep(
+    team, scenarios, replications=100, num_tickets=20, sprint_length=10, seed=0, processes=None, engine="object"
+):
+    """
+    Run every scenario on the same ``replications`` backlogs.
+
+    :param team: Base roster (list of TeamMember); never mutated.
+    :param scenarios: List of scenario dicts (see the module docstring), e.g.
+        from ``expand_grid``. Keys a scenario omits keep the base value.
+    :param replications: Backlogs simulated per scenario.
+    :param num_tickets: Backlog size.
+    :param sprint_length: Sprint length for scenarios without one.
+    :param seed: Base seed; replication ``r`` uses ``run_rng(seed, r)``.
+    :param processes: Worker processes (defaults to the CPU count). ``1``
+        runs everything in the calling process.
+    :param engine: SprintSimulator engine.
+    :return: List of row dicts ordered by scenario, then replication, with
+        ``scenario`` (index), the scenario's keys, ``replication`` and the
+        ``METRICS``.
+    """
+    team = clone_team(team)
+    scenarios = [_normalize(s, team) for s in scenarios]
+    groups = _prefix_groups(scenarios)
+    processes = processes or os.cpu_count() or 1
+    batches = max(1, min(replications, processes * 4))
+    bounds = [(replications * i // batches, replications * (i + 1) // batches) for i in range(batches)]
+    args = (team, groups, num_tickets, sprint_length, seed, engine)
+
+    if processes == 1:
+        results = [_run_replications(*args, start, stop) for start, stop in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_run_replications, *args, start, stop) for start, stop in bounds]
+            results = [f.result() for f in futures]
+
+    keys = sorted({key for s in scenarios for key in s})
+    table = []
+    for i, replication, metrics in sorted(
+        (r for batch in results for r in batch), key=lambda r: (r[0], r[1])
+    ):
+        row = {"scenario": i}
+        for key in keys:
+            value = scenarios[i].get(key)
+            row[key] = "+".join(value) if key == "members" and value is not None else value
+        row["replication"] = replication
+        row.update(metrics)
+        table.append(row)
+    return table
+
+
+def summarize_sweep(rows, baseline=0, metrics=METRICS):
+    """
+    Summarize a sweep table per scenario.
+
+    Differences are paired by replication against the ``baseline`` scenario,
+    so their standard errors reflect the parameter effect without backlog
+    noise.
+
+    :return: Dict of scenario index -> {metric: {"mean", "diff", "diff_se"}}.
+    """
+    by_scenario = {}
+    for row in rows:
+        by_scenario.setdefault(row["scenario"], {})[row["replication"]] = row
+    base = by_scenario[baseline]
+    summary = {}
+    for scenario, runs in by_scenario.items():
+        shared = sorted(set(runs) & set(base))
+        summary[scenario] = {}
+        for name in metrics:
+            values = [runs[r][name] for r in runs]
+            diffs = [runs[r][name] - base[r][name] for r in shared]
+            mean_diff = sum(diffs) / len(diffs) if diffs else None
+            se = None
+            if len(diffs) > 1:
+                var = sum((d - mean_diff) ** 2 for d in diffs) / (len(diffs) - 1)
+                se = math.sqrt(var / len(diffs))
+            summary[scenario][name] = {
+                "mean": sum(values) / len(values),
+                "diff": mean_diff,
+                "diff_se": se,
+            }
+    return summary
+
+
+def write_table(rows, path):
+    """Write sweep rows to ``path`` as CSV."""
+    fields = list(rows[0]) if rows else ["scenario", "replication", *METRICS]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _parse_axis(text):
+    """Parse ``key=v1,v2,...``; ``members`` values are ``+``-joined names."""
+    key, _, values = text.partition("=")
+    if key == "members":
+        return key, [tuple(v.split("+")) for v in values.split(",")]
+    return key, [json.loads(v) for v in values.split(",")]
+
+
+def main():
+    from generate_pre_sprint_analysis import build_team
+
+    parser = argparse.ArgumentParser(
+        description="Sweep sprint parameters over shared backlogs and write a results table."
+    )
+    parser.add_argument(
+        "-g", "--grid", action="append", default=[], metavar="KEY=V1,V2",
+        help="Grid axis, e.g. escalation_threshold=4,5,6 or availability.project_manager=0.5,1.0; repeatable.",
+    )
+    parser.add_argument("--scenarios", help="JSON file with a list of scenarios, used instead of --grid.")
+    parser.add_argument("-r", "--replications", type=int, default=100, help="Backlogs per scenario.")
+    parser.add_argument("-n", "--num-tickets", type=int, default=20, help="Tickets per backlog.")
+    parser.add_argument("-d", "--days", type=int, default=10, help="Default sprint length in business days.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Base random seed.")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="Worker processes.")
+    parser.add_argument("-e", "--engine", default="object", choices=SprintSimulator.ENGINES)
+    parser.add_argument("-o", "--output", default="sweep.csv", help="Output CSV file name.")
+    args = parser.parse_args()
+
+    if args.scenarios:
+        with open(args.scenarios) as f:
+            scenarios = json.load(f)
+    else:
+        scenarios = expand_grid(dict(_parse_axis(axis) for axis in args.grid))
+
+    rows = run_sweep(
+        build_team(),
+        scenarios,
+        replications=args.replications,
+        num_tickets=args.num_tickets,
+        sprint_length=args.days,
+        seed=args.seed,
+        processes=args.processes,
+        engine=args.engine,
+    )
+    write_table(rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Per-day, per-phase instrumentation for sprint simulations.
+
+``SprintSimulator(profile=True)`` attaches a ``PhaseProfiler``. The simulator
+calls ``start()`` when a phase sequence begins and ``lap(day, phase)`` as each
+phase ends, so a phase's time is the time since the previous mark. Counters
+are plain integer increments. With profiling disabled the simulator holds
+``None`` and skips every call, so the disabled path costs one attribute check
+per phase.
+
+Hooks receive each finished day, e.g. to forward numbers to an external
+profiler::
+
+    def forward(day, record):
+        statsd.timing("sprint.work", record["phases"]["work"])
+
+    sim = SprintSimulator(team, profile=True, profile_hooks=[forward])
+
+``SprintSimulator(profile="memory")`` attaches a ``MemoryProfiler`` instead,
+which also records traced memory per phase with ``tracemalloc``: the peak
+reached above the phase's starting point and the bytes still allocated when
+the phase ends. Tracing slows the run down several times, so timings from a
+memory profile are not comparable with plain ones.
+"""
+
+import tracemalloc
+from time import perf_counter
+
+
+PHASES = ("standup", "dependencies", "assignment", "work", "escalation", "cleanup")
+COUNTERS = ("tickets_scanned", "assignments", "escalations", "blocked_checks")
+
+
+class PhaseProfiler:
+    """Accumulates phase timings and counters per simulated day."""
+
+    def __init__(self, hooks=()):
+        """
+        :param hooks: Callables invoked as ``hook(day, record)`` when a day
+            ends, where ``record`` has ``"phases"`` (seconds) and
+            ``"counters"`` dicts.
+        """
+        self.hooks = list(hooks)
+        self.days = {}
+        self._mark = perf_counter()
+
+    def add_hook(self, hook):
+        """Register another end-of-day hook."""
+        self.hooks.append(hook)
+
+    def _day(self, day):
+        record = self.days.get(day)
+        if record is None:
+            record = self.days[day] = {
+                "phases": dict.fromkeys(PHASES, 0.0),
+                "counters": dict.fromkeys(COUNTERS, 0),
+            }
+        return record
+
+    def start(self):
+        """Start timing the next phase from now."""
+        self._mark = perf_counter()
+
+    def lap(self, day, phase):
+        """Charge the time since the last mark to ``phase`` of ``day``."""
+        now = perf_counter()
+        self._day(day)["phases"][phase] += now - self._mark
+        self._mark = now
+
+    def count(self, day, counter, n=1):
+        """Add ``n`` to ``counter`` for ``day``."""
+        self._day(day)["counters"][counter] += n
+
+    def end_day(self, day):
+        """Notify hooks that ``day`` is complete."""
+        record = self._day(day)
+        for hook in self.hooks:
+            hook(day, record)
+
+    def report(self):
+        """
+        Return the structured ``profile`` metrics section: totals per phase
+        and counter plus the per-day records.
+        """
+        phases = dict.fromkeys(PHASES, 0.0)
+        counters = dict.fromkeys(COUNTERS, 0)
+        days = []
+        for day in sorted(self.days):
+            record = self.days[day]
+            for name, seconds in record["phases"].items():
+                phases[name] += seconds
+            for name, value in record["counters"].items():
+                counters[name] += value
+            days.append({"day": day, **record})
+        return {
+            "total_seconds": sum(phases.values()),
+            "phases": phases,
+            "counters": counters,
+            "days": days,
+        }
+
+
+class MemoryProfiler(PhaseProfiler):
+    """PhaseProfiler that also records traced memory per phase."""
+
+    def __init__(self, hooks=()):
+        """
+        Starts ``tracemalloc`` unless it is already tracing, and then stops
+        it again once ``report()`` is called.
+
+        :param hooks: As for PhaseProfiler; day records also carry a
+            ``"memory"`` dict of ``{"peak_bytes", "retained_bytes"}`` per phase.
+        """
+        self.owns_tracing = not tracemalloc.is_tracing()
+        if self.owns_tracing:
+            tracemalloc.start()
+        self.peak_traced = 0
+        self._base = 0
+        super().__init__(hooks)
+
+    def _day(self, day):
+        record = self.days.get(day)
+        if record is None:
+            record = super()._day(day)
+            record["memory"] = {phase: {"peak_bytes": 0, "retained_bytes": 0} for phase in PHASES}
+        return record
+
+    def start(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._base = tracemalloc.get_traced_memory()[0]
+        super().start()
+
+    def lap(self, day, phase):
+        """Charge the time and memory since the last mark to ``phase`` of ``day``."""
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            memory = self._day(day)["memory"][phase]
+            memory["peak_bytes"] = max(memory["peak_bytes"], peak - self._base)
+            memory["retained_bytes"] += current - self._base
+            # Phases reset the tracemalloc peak, so keep the overall one here
+            self.peak_traced = max(self.peak_traced, peak)
+            tracemalloc.reset_peak()
+            self._base = current
+        super().lap(day, phase)
+
+    def stop(self):
+        """Stop tracing if this profiler started it."""
+        if self.owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.owns_tracing = False
+
+    def report(self):
+        """
+        Return the ``profile`` section with an added ``"memory"`` dict: the
+        highest peak and the total retained bytes per phase over all days.
+        """
+        report = super().report()
+        memory = {phase: {"peak_bytes": 0, "retained_bytes": 0} for phase in PHASES}
+        for record in self.days.values():
+            for phase, values in record["memory"].items():
+                memory[phase]["peak_bytes"] = max(memory[phase]["peak_bytes"], values["peak_bytes"])
+                memory[phase]["retained_bytes"] += values["retained_bytes"]
+        report["memory"] = memory
+        self.stop()
+        return report
@@ -0,0 +1,349 @@
+"""
+Release-level simulation chaining many sprints.
+
+``ReleaseSimulator`` runs one ``SprintSimulator`` per sprint on the same team.
+Unfinished tickets carry over into the next sprint, new tickets arrive from
+``TicketGenerator`` at a Poisson rate per sprint, and each sprint's metrics
+are rolled up into a release report.
+
+A sprint's closed tickets and event log are appended to an on-disk archive
+as soon as the sprint ends, and the sprint's simulator is dropped. Members'
+``completed_tickets`` are cleared at the same time, since the archive keeps
+each ticket's assignee. The working set is only the open backlog and one
+sprint's events, so memory stays flat however many sprints run.
+
+Archive layout::
+
+    b"SPRA2\\n" | segment | segment | ...
+
+One segment per sprint: header length (u64) | JSON header | padding |
+sections. As in ``checkpoint``, the sections are the raw bytes of the closed
+tickets' ``TicketStore`` columns and of the ``EventLog`` columns, aligned to
+8 bytes. ``read_archive`` memory-maps the file and yields one sprint at a
+time.
+"""
+
+import argparse
+import json
+import mmap
+import random
+import struct
+from array import array
+from collections import namedtuple
+from datetime import date, timedelta
+
+from events import EventLog
+from running_metrics import QuantileSketch
+from serialization import decode_strings, encode_strings, tuples_from_json
+from sprint_simulator import SprintSimulator
+from ticket_store import TicketStore
+
+
+MAGIC = b"SPRA2\n"
+_LENGTH = struct.Struct("<Q")
+_ALIGN = 8
+_EVENT_COLUMNS = ("day", "timestamp", "member", "ticket", "kind", "effort", "detail")
+
+RELEASE_TOTALS = ("arrivals", "completed_tickets", "velocity", "escalations", "blocks", "after_hours")
+
+ArchivedSprint = namedtuple("ArchivedSprint", "sprint metrics tickets events")
+
+
+def sprint_rng(seed, sprint):
+    """Return the random stream of one sprint (arrivals and timestamps)."""
+    return random.Random(f"{seed}:sprint:{sprint}")
+
+
+def poisson(rng, mean):
+    """Draw a Poisson count by summing unit exponential inter-arrival times."""
+    count = 0
+    elapsed = rng.expovariate(1.0) if mean > 0 else 0.0
+    while elapsed < mean:
+        count += 1
+        elapsed += rng.expovariate(1.0)
+    return count
+
+
+class ReleaseArchive:
+    """Append-only columnar archive of closed tickets and event logs per sprint."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self.segments = 0
+
+    def write_sprint(self, sprint, tickets, events, metrics):
+        """
+        Append one sprint.
+
+        :param sprint: Sprint number.
+        :param tickets: Tickets closed during the sprint.
+        :param events: The sprint's EventLog.
+        :param metrics: JSON-serializable metrics row for the sprint.
+        """
+        ids, tables, columns = TicketStore.from_tickets(tickets).state()
+        first, counts, event_tables, event_columns = events.state()
+        sections = {"ticket_ids": encode_strings(ids)}
+        sections.update((f"column_{name}", column) for name, column in columns.items())
+        sections.update((f"event_{name}", column) for name, column in event_columns.items())
+
+        header = {
+            "sprint": sprint,
+            "metrics": metrics,
+            "tables": tables,
+            "events": {"first": first, "counts": counts, "tables": event_tables},
+            "sections": {},
+        }
+        offset = 0
+        for name, data in sections.items():
+            size = len(data) * (data.itemsize if isinstance(data, array) else 1)
+            header["sections"][name] = [offset, size]
+            offset += size + (-size % _ALIGN)
+
+        encoded = json.dumps(header, separators=(",", ":")).encode()
+        f = self._file
+        f.write(_LENGTH.pack(len(encoded)))
+        f.write(encoded)
+        f.write(b"\0" * (-(_LENGTH.size + len(encoded)) % _ALIGN))
+        for data in sections.values():
+            raw = data.tobytes() if isinstance(data, array) else data
+            f.write(raw)
+            f.write(b"\0" * (-len(raw) % _ALIGN))
+        f.flush()
+        self.segments += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_archive(path):
+    """
+    Iterate the sprints of a release archive.
+
+    :return: Generator of ``ArchivedSprint(sprint, metrics, tickets, events)``
+        with the closed tickets as a TicketStore and the events as an
+        EventLog, one sprint at a time.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a release archive")
+        view = memoryview(mm)
+        try:
+            position = len(MAGIC)
+            while position < len(mm):
+                (length,) = _LENGTH.unpack_from(mm, position)
+                start = position + _LENGTH.size
+                header = json.loads(bytes(view[start:start + length]))
+                base = start + length + (-(_LENGTH.size + length) % _ALIGN)
+                spans = header["sections"]
+
+                def section(name):
+                    offset, size = spans[name]
+                    return view[base + offset:base + offset + size]
+
+                store = TicketStore.from_state(
+                    decode_strings(section("ticket_ids")),
+                    header["tables"],
+                    {name: section(f"column_{name}") for name in TicketStore.COLUMNS},
+                )
+                events = header["events"]
+                tables = dict(events["tables"], details=[tuples_from_json(d) for d in events["tables"]["details"]])
+                log = EventLog.from_state(
+                    events["first"],
+                    events["counts"],
+                    tables,
+                    {name: section(f"event_{name}") for name in _EVENT_COLUMNS},
+                )
+                yield ArchivedSprint(header["sprint"], header["metrics"], store, log)
+                position = base + max((o + s + (-s % _ALIGN) for o, s in spans.values()), default=0)
+        finally:
+            view.release()
+
+
+class ReleaseSimulator:
+    """Chain sprints on one team, carrying the unfinished backlog forward."""
+
+    def __init__(
+        self,
+        team,
+        sprint_length_days=10,
+        arrival_rate=20,
+        initial_tickets=None,
+        seed=0,
+        engine="object",
+        verbosity="summary",
+        archive=None,
+        epoch=None,
+        ticket_types=None,
+    ):
+        """
+        :param team: List of TeamMember instances. The release works on them
+            directly: workloads accumulate over the release.
+        :param sprint_length_days: Business days per sprint.
+        :param arrival_rate: Mean number of new tickets per sprint (Poisson).
+        :param initial_tickets: Size of the starting backlog; defaults to a
+            Poisson draw like every later sprint.
+        :param seed: Base seed; sprint ``i`` draws from ``sprint_rng(seed, i)``.
+        :param engine: SprintSimulator engine.
+        :param verbosity: SprintSimulator verbosity; ``"off"`` archives no
+            events.
+        :param archive: Optional path of the archive file for closed tickets
+            and event logs. Without it they are discarded after each sprint.
+        :param epoch: Date of the release's first day; sprint ``i`` starts
+            ``(i - 1) * sprint_length_days`` days later. Defaults to today.
+        :param ticket_types: Optional template overrides for TicketGenerator.
+        """
+        self.team = team
+        self.sprint_length = sprint_length_days
+        self.arrival_rate = arrival_rate
+        self.initial_tickets = initial_tickets
+        self.seed = seed
+        self.engine = engine
+        self.verbosity = verbosity
+        self.epoch = epoch if epoch is not None else date.today()
+        self.ticket_types = ticket_types
+        self.archive = ReleaseArchive(archive) if archive is not None else None
+        self.sprint = 0
+        self.backlog = []
+        self.sprints = []
+        self.sprints_to_close = QuantileSketch()
+        self._arrived = {}
+
+    def run_sprint(self):
+        """Simulate the next sprint and return its metrics row."""
+        from ticket_system import TicketGenerator
+
+        self.sprint += 1
+        sprint = self.sprint
+        rng = sprint_rng(self.seed, sprint)
+        count = self.initial_tickets if sprint == 1 and self.initial_tickets is not None else None
+        if count is None:
+            count = poisson(rng, self.arrival_rate)
+        arrivals = TicketGenerator(rng=rng).generate_ticket_store(count, self.ticket_types, id_prefix=f"R{sprint}-")
+        for ticket in arrivals:
+            self._arrived[ticket.ticket_id] = sprint
+
+        # Rebuild one compact store from the carried tickets and the arrivals
+        # so nothing keeps the previous sprint's store alive.
+        store = TicketStore()
+        store.extend(self.backlog)
+        store.extend(arrivals)
+        backlog = store.views()
+        # Carried tickets go back to the queue; blocks are re-derived
+        for ticket in backlog[:len(self.backlog)]:
+            ticket.status = "Open"
+        workload = {m.name: m.current_workload for m in self.team}
+
+        sim = SprintSimulator(
+            self.team,
+            sprint_length_days=self.sprint_length,
+            rng=rng,
+            engine=self.engine,
+            epoch=self.epoch + timedelta(days=(sprint - 1) * self.sprint_length),
+            verbosity=self.verbosity,
+        )
+        sim.sprint_backlog = backlog
+        sim.run_complete_simulation()
+
+        metrics = sim.metrics
+        burndown = metrics["burndown"]
+        row = {
+            "sprint": sprint,
+            "arrivals": count,
+            "carried_in": len(self.backlog),
+            "total_tickets": metrics["total_tickets"],
+            "completed_tickets": metrics["completed_tickets"],
+            "velocity": metrics["velocity"],
+            "escalations": metrics["escalations"],
+            "blocks": metrics["blocks"],
+            "after_hours": metrics["after_hours"],
+            "carried_over": len(sim.sprint_backlog),
+            "remaining_points": burndown[-1]["remaining_points"] if burndown else 0,
+            "utilization": {m.name: m.current_workload - workload.get(m.name, 0) for m in self.team},
+            "cycle_time": metrics["cycle_time"],
+        }
+        for ticket in sim.completed_work:
+            self.sprints_to_close.add(sprint - self._arrived.pop(ticket.ticket_id, sprint) + 1)
+        if self.archive is not None:
+            self.archive.write_sprint(sprint, sim.completed_work, sim.events, row)
+        for member in self.team:
+            member.completed_tickets.clear()
+
+        self.backlog = list(sim.sprint_backlog)
+        self.sprints.append(row)
+        return row
+
+    def run(self, sprints):
+        """
+        Simulate ``sprints`` more sprints and return the release report.
+
+        The archive, if any, stays open so the release can be continued;
+        call ``close()`` when done.
+        """
+        for _ in range(sprints):
+            self.run_sprint()
+        return self.report()
+
+    def report(self):
+        """Roll the per-sprint rows up into a release report."""
+        totals = dict.fromkeys(RELEASE_TOTALS, 0)
+        for row in self.sprints:
+            for name in RELEASE_TOTALS:
+                totals[name] += row[name]
+        return {
+            "sprints": self.sprint,
+            "totals": totals,
+            "mean_velocity": totals["velocity"] / self.sprint if self.sprint else 0.0,
+            "open_tickets": len(self.backlog),
+            "remaining_points": sum(t.estimated_effort or 0 for t in self.backlog),
+            "sprints_to_close": self.sprints_to_close.summary(),
+            "per_sprint": list(self.sprints),
+        }
+
+    def close(self):
+        """Close the archive file."""
+        if self.archive is not None:
+            self.archive.close()
+
+
+def main():
+    from generate_pre_sprint_analysis import build_team
+
+    parser = argparse.ArgumentParser(description="Simulate a release of many sprints with carryover.")
+    parser.add_argument("--sprints", type=int, default=12, help="Number of sprints.")
+    parser.add_argument("-d", "--days", type=int, default=10, help="Sprint length in business days.")
+    parser.add_argument("--arrival-rate", type=float, default=20, help="Mean new tickets per sprint.")
+    parser.add_argument("--initial-tickets", type=int, default=None, help="Starting backlog size.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Base random seed.")
+    parser.add_argument("-e", "--engine", default="object", choices=SprintSimulator.ENGINES)
+    parser.add_argument("--archive", default="release_archive.bin", help="Archive file for closed work.")
+    parser.add_argument("-o", "--output", default="release_metrics.json", help="Output JSON file name.")
+    args = parser.parse_args()
+
+    release = ReleaseSimulator(
+        build_team(),
+        sprint_length_days=args.days,
+        arrival_rate=args.arrival_rate,
+        initial_tickets=args.initial_tickets,
+        seed=args.seed,
+        engine=args.engine,
+        archive=args.archive,
+    )
+    try:
+        report = release.run(args.sprints)
+    finally:
+        release.close()
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
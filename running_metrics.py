@@ -0,0 +1,193 @@
+"""
+Incrementally maintained sprint metrics.
+
+``RunningMetrics`` is updated as tickets close and days end, so a live
+snapshot costs O(team size) at any point of a run instead of a pass over all
+completed work. It keeps velocity, completions by priority and category,
+per-day throughput and burndown series, and streaming quantile sketches of
+cycle time and daily throughput.
+
+``QuantileSketch`` is a log-bucketed histogram (in the style of DDSketch):
+every value is counted in a bucket whose bounds are within a fixed relative
+error of each other, so updates are O(1), memory grows only with the log of
+the value range and sketches can be merged.
+"""
+
+import math
+from collections import Counter
+
+
+class QuantileSketch:
+    """Streaming quantiles with bounded relative error."""
+
+    def __init__(self, relative_accuracy=0.01):
+        """
+        :param relative_accuracy: Maximum relative error of reported
+            quantiles for positive values.
+        """
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets = Counter()
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value, count=1):
+        """Add ``value`` (non-negative) ``count`` times."""
+        if value <= 0:
+            self.zeros += count
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += count
+        self.count += count
+        self.total += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """Fold another sketch with the same accuracy into this one."""
+        self.buckets.update(other.buckets)
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """Return the approximate ``q`` quantile (0-1), or None when empty."""
+        if not self.count:
+            return None
+        rank = max(0, math.ceil(q * self.count) - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                value = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99)):
+        """Return count, mean, min, max and the requested quantiles."""
+        if not self.count:
+            return {"count": 0}
+        result = {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+        for q in quantiles:
+            result[f"p{round(q * 100):g}"] = self.quantile(q)
+        return result
+
+    def state(self):
+        """Return a JSON-serializable representation."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": sorted(self.buckets.items()),
+            "zeros": self.zeros,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(state["relative_accuracy"])
+        sketch.buckets = Counter(dict((k, c) for k, c in state["buckets"]))
+        sketch.zeros = state["zeros"]
+        sketch.count = state["count"]
+        sketch.total = state["total"]
+        if sketch.count:
+            sketch.min, sketch.max = state["min"], state["max"]
+        return sketch
+
+
+class RunningMetrics:
+    """Sprint aggregates maintained as tickets close and days end."""
+
+    def __init__(self):
+        self.completed = 0
+        self.velocity = 0
+        self.by_priority = Counter()
+        self.by_category = Counter()
+        self.cycle_time = QuantileSketch()
+        self.daily_throughput = QuantileSketch()
+        self.throughput = []
+        self.burndown = []
+        self.remaining_points = 0
+        self._closed_today = 0
+
+    def record_arrival(self, ticket):
+        """Count a ticket entering the backlog towards the remaining work."""
+        self.remaining_points += ticket.estimated_effort or 0
+
+    def record_close(self, ticket, cycle_time):
+        """
+        Record one closed ticket.
+
+        :param cycle_time: Days from the ticket entering the backlog to its
+            close, counting both days.
+        """
+        self.completed += 1
+        self.velocity += ticket.actual_effort or ticket.estimated_effort or 0
+        self.by_priority[ticket.priority] += 1
+        self.by_category[ticket.category] += 1
+        self.remaining_points -= ticket.estimated_effort or 0
+        self.cycle_time.add(cycle_time)
+        self._closed_today += 1
+
+    def end_day(self, day, remaining_tickets):
+        """Close the books on ``day``, appending throughput and burndown points."""
+        self.throughput.append(self._closed_today)
+        self.daily_throughput.add(self._closed_today)
+        self.burndown.append(
+            {"day": day, "remaining_tickets": remaining_tickets, "remaining_points": self.remaining_points}
+        )
+        self._closed_today = 0
+
+    def snapshot(self):
+        """Return the current aggregates as a metrics-style dict."""
+        return {
+            "completed_tickets": self.completed,
+            "velocity": self.velocity,
+            "completed_by_priority": dict(self.by_priority),
+            "completed_by_category": dict(self.by_category),
+            "throughput_today": self.throughput[-1] if self.throughput else 0,
+            "cycle_time": self.cycle_time.summary(),
+            "daily_throughput": self.daily_throughput.summary(),
+            "remaining": self.burndown[-1] if self.burndown else None,
+        }
+
+    def state(self):
+        """Return a JSON-serializable representation."""
+        return {
+            "completed": self.completed,
+            "velocity": self.velocity,
+            "by_priority": dict(self.by_priority),
+            "by_category": dict(self.by_category),
+            "cycle_time": self.cycle_time.state(),
+            "daily_throughput": self.daily_throughput.state(),
+            "throughput": self.throughput,
+            "burndown": self.burndown,
+            "remaining_points": self.remaining_points,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        running = cls()
+        running.completed = state["completed"]
+        running.velocity = state["velocity"]
+        running.by_priority = Counter(state["by_priority"])
+        running.by_category = Counter(state["by_category"])
+        running.cycle_time = QuantileSketch.from_state(state["cycle_time"])
+        running.daily_throughput = QuantileSketch.from_state(state["daily_throughput"])
+        running.throughput = list(state["throughput"])
+        running.burndown = list(state["burndown"])
+        running.remaining_points = state["remaining_points"]
+        return running
@@ -0,0 +1,46 @@
+"""
+Binary encoding helpers shared by checkpoints, event sinks and release
+archives.
+
+String tables are stored as a count, one length per string and the
+concatenated UTF-8 bytes, so empty strings (and any other character)
+round-trip exactly::
+
+    count (u32) | lengths (u32 each) | UTF-8 bytes
+"""
+
+import struct
+from array import array
+
+
+_COUNT = struct.Struct("<I")
+
+
+def encode_strings(values):
+    """Encode a list of strings as one length-prefixed bytes section."""
+    encoded = [value.encode() for value in values]
+    lengths = array("I", map(len, encoded))
+    return _COUNT.pack(len(encoded)) + lengths.tobytes() + b"".join(encoded)
+
+
+def decode_strings(data):
+    """Decode a section written by ``encode_strings`` (bytes or a memoryview)."""
+    data = memoryview(data)
+    (count,) = _COUNT.unpack_from(data)
+    lengths = array("I")
+    start = _COUNT.size + count * lengths.itemsize
+    lengths.frombytes(data[_COUNT.size:start])
+    payload = bytes(data[start:])
+    values = []
+    position = 0
+    for length in lengths:
+        values.append(payload[position:position + length].decode())
+        position += length
+    return values
+
+
+def tuples_from_json(value):
+    """Turn JSON lists back into the tuples events were emitted with."""
+    if isinstance(value, list):
+        return tuple(tuples_from_json(v) for v in value)
+    return value
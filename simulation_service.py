@@ -0,0 +1,505 @@
+"""
+Long-lived local HTTP service for simulation and triage jobs.
+
+Tools post JSON jobs instead of starting a new Python process for every
+forecast, so imports are paid once per worker:
+
+- ``POST /simulate``: one sprint on a given or generated backlog; returns
+  the metrics report.
+- ``POST /forecast``: Monte Carlo distribution over generated backlogs (see
+  ``monte_carlo.run_monte_carlo``).
+- ``POST /triage``: the triage meeting notes, commitment and solver stats.
+- ``GET /results/<key>``: a cached result by its content address.
+- ``GET /health``: queue and cache statistics.
+
+Every job is canonicalized first: defaults are filled in, the team and
+backlog are validated, and the result is serialized with sorted keys. Its
+SHA-256 is the job's cache key (returned in the ``ETag`` header). Results
+are kept in an LRU cache bounded by entry count and bytes, so a repeated
+request is answered from memory, and concurrent identical requests share a
+single computation. Jobs run on a process pool. At most ``max_pending``
+distinct jobs may be queued or running; beyond that the service answers
+``503`` with ``Retry-After`` instead of queueing without bound.
+
+The server only binds to loopback addresses. It speaks just enough
+HTTP/1.1 (with keep-alive) for local clients and needs no dependencies
+beyond the standard library.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import ipaddress
+import json
+import os
+import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+
+DEFAULT_PORT = 8765
+JOB_KINDS = ("simulate", "forecast", "triage")
+MAX_BODY = 16 << 20
+MAX_FORECAST_RUNS = 100_000
+CACHE_VERSION = 1
+
+MEMBER_FIELDS = ("name", "role", "skill_level", "specialties", "availability")
+TEMPLATE_KINDS = ("operations", "incidents", "projects")
+TEMPLATE_FIELDS = ("category", "description")
+
+
+class ServiceBusy(Exception):
+    """Raised when ``max_pending`` jobs are already queued or running."""
+
+
+def _require_loopback(host):
+    if host == "localhost":
+        return
+    try:
+        loopback = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if not loopback:
+        raise ValueError(f"The simulation service only binds to loopback addresses, not {host!r}")
+
+
+def _jsonable(model):
+    """Return a pydantic model's fields as JSON-compatible values."""
+    dump = getattr(model, "model_dump", None)
+    return dump(mode="json") if dump is not None else json.loads(model.json())
+
+
+def _int(payload, name, default, low=0, high=None):
+    value = payload.get(name, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < low or (high is not None and value > high):
+        bounds = f">= {low}" if high is None else f"in [{low}, {high}]"
+        raise ValueError(f"{name!r} must be an integer {bounds}")
+    return value
+
+
+def _team(payload):
+    """Validate the team spec, defaulting to ``build_team()``."""
+    from team_members import TeamMember
+
+    specs = payload.get("team")
+    if specs is None:
+        from generate_pre_sprint_analysis import build_team
+
+        members = build_team()
+    else:
+        if not isinstance(specs, list) or not specs or not all(isinstance(spec, dict) for spec in specs):
+            raise ValueError("'team' must be a non-empty list of members")
+        members = [TeamMember(**{k: v for k, v in spec.items() if k in MEMBER_FIELDS}) for spec in specs]
+    team = []
+    for member in members:
+        fields = _jsonable(member)
+        team.append({name: fields[name] for name in MEMBER_FIELDS})
+    return team
+
+
+def _ticket_types(ticket_types):
+    """Validate generator template overrides, keeping only the fields tickets use."""
+    if ticket_types is None:
+        return None
+    if not isinstance(ticket_types, dict):
+        raise ValueError("'ticket_types' must be an object of template lists")
+    unknown = set(ticket_types) - set(TEMPLATE_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown ticket types {sorted(unknown)}; expected some of {TEMPLATE_KINDS}")
+    canonical = {}
+    for kind, templates in ticket_types.items():
+        if not isinstance(templates, list) or not templates or not all(
+            isinstance(t, dict) and all(isinstance(t.get(name), str) for name in TEMPLATE_FIELDS) for t in templates
+        ):
+            raise ValueError(f"'ticket_types.{kind}' must be a non-empty list of {{category, description}} strings")
+        canonical[kind] = [{name: t[name] for name in TEMPLATE_FIELDS} for t in templates]
+    return canonical
+
+
+def _tickets(payload):
+    """Validate an explicit backlog or generator parameters (exactly one)."""
+    from ticket_system import Ticket
+
+    backlog = payload.get("backlog")
+    generator = payload.get("generator")
+    if backlog is not None and generator is not None:
+        raise ValueError("Give either 'backlog' or 'generator', not both")
+    if backlog is not None:
+        if not isinstance(backlog, list) or not all(isinstance(t, dict) for t in backlog):
+            raise ValueError("'backlog' must be a list of tickets")
+        return {"backlog": [_jsonable(Ticket(**t)) for t in backlog]}
+    if not isinstance(generator, (dict, type(None))):
+        raise ValueError("'generator' must be an object")
+    generator = dict(generator or {})
+    unknown = set(generator) - {"num_tickets", "ticket_types"}
+    if unknown:
+        raise ValueError(f"Unknown generator options {sorted(unknown)}")
+    return {
+        "generator": {
+            "num_tickets": _int(generator, "num_tickets", 20, high=1_000_000),
+            "ticket_types": _ticket_types(generator.get("ticket_types")),
+        }
+    }
+
+
+def canonicalize(kind, payload):
+    """
+    Validate a job and return its canonical parameters.
+
+    Omitted options get their defaults, so equivalent requests, such as an
+    explicit default team or reordered keys, canonicalize to the same value.
+
+    :raises ValueError: Unknown job kind or invalid parameters.
+    """
+    from sprint_simulator import SprintSimulator
+
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Unknown job kind {kind!r}; expected one of {JOB_KINDS}")
+    if not isinstance(payload, dict):
+        raise ValueError("The request body must be a JSON object")
+    params = {"team": _team(payload), "seed": _int(payload, "seed", 0)}
+    if kind == "forecast":
+        if "backlog" in payload:
+            raise ValueError("Forecasts draw their own backlogs; give 'num_tickets' instead")
+        params["runs"] = _int(payload, "runs", 1000, low=1, high=MAX_FORECAST_RUNS)
+        params["num_tickets"] = _int(payload, "num_tickets", 20, high=1_000_000)
+    else:
+        params.update(_tickets(payload))
+    if kind != "triage":
+        params["sprint_length"] = _int(payload, "sprint_length", 10, low=1, high=10_000)
+    if kind == "simulate":
+        engine = payload.get("engine", "object")
+        if engine not in SprintSimulator.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {SprintSimulator.ENGINES}")
+        params["engine"] = engine
+    return params
+
+
+def cache_key(kind, params):
+    """Return the content address of a canonical job."""
+    document = json.dumps([CACHE_VERSION, kind, params], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(document.encode()).hexdigest()
+
+
+def run_job(kind, params):
+    """Run a canonical job and return its JSON-compatible result."""
+    from models import TeamMember, Ticket, construct
+    from ticket_system import TicketGenerator
+
+    team = [construct(TeamMember, **spec) for spec in params["team"]]
+    if kind == "forecast":
+        from monte_carlo import run_monte_carlo
+
+        return run_monte_carlo(
+            team, runs=params["runs"], num_tickets=params["num_tickets"],
+            sprint_length=params["sprint_length"], seed=params["seed"], processes=1,
+        )
+
+    if "backlog" in params:
+        tickets = [Ticket(**t) for t in params["backlog"]]
+    else:
+        generator = params["generator"]
+        tickets = TicketGenerator(rng=random.Random(params["seed"])).generate_realistic_tickets(
+            generator["num_tickets"], generator["ticket_types"]
+        )
+
+    if kind == "triage":
+        from sprint_planning import simulate_triage_meeting
+
+        notes, commitment, stats = simulate_triage_meeting(tickets, team, return_stats=True)
+        return {"notes": notes, "commitment": commitment, "stats": stats}
+
+    from sprint_simulator import SprintSimulator
+
+    sim = SprintSimulator(
+        team,
+        sprint_length_days=params["sprint_length"],
+        rng=random.Random(f"{params['seed']}:sprint"),
+        engine=params["engine"],
+        verbosity="off",
+    )
+    sim.sprint_backlog = tickets
+    sim.run_complete_simulation()
+    return {"metrics": sim.metrics}
+
+
+def _run_encoded(kind, params):
+    """Worker entry point: run a job and return the encoded JSON result."""
+    return json.dumps(run_job(kind, params), default=str).encode()
+
+
+def _warm_worker():
+    """Import the simulation stack once per worker process."""
+    import models  # noqa: F401
+    import monte_carlo  # noqa: F401
+    import sprint_planning  # noqa: F401
+    import sprint_simulator  # noqa: F401
+
+
+class ResultCache:
+    """LRU cache of encoded results keyed by content address."""
+
+    def __init__(self, max_entries=1024, max_bytes=256 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Return the cached bytes for ``key`` (marking them recently used) or None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key):
+        """Return the cached bytes without touching recency or statistics."""
+        return self._entries.get(key)
+
+    def put(self, key, value):
+        """Store ``value``, evicting least recently used entries beyond the limits."""
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= len(old)
+        self._entries[key] = value
+        self.nbytes += len(value)
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= len(evicted)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class SimulationService:
+    """asyncio HTTP front end over a process pool and a result cache."""
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=DEFAULT_PORT,
+        processes=None,
+        max_pending=64,
+        cache_entries=1024,
+        cache_bytes=256 << 20,
+    ):
+        """
+        :param host: Loopback address to bind; anything else is rejected.
+        :param port: TCP port; ``0`` picks a free one (see ``port`` after
+            ``start()``).
+        :param processes: Worker processes (defaults to the CPU count).
+        :param max_pending: Distinct jobs allowed to be queued or running
+            before new ones are refused with 503.
+        :param cache_entries: Maximum cached results.
+        :param cache_bytes: Maximum total size of cached results.
+        """
+        _require_loopback(host)
+        self.host = host
+        self.port = port
+        self.processes = processes or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.cache = ResultCache(cache_entries, cache_bytes)
+        self.completed = 0
+        self._inflight = {}
+        self._pool = None
+        self._server = None
+
+    async def start(self):
+        """Start the worker pool and begin accepting connections."""
+        self._pool = ProcessPoolExecutor(max_workers=self.processes, initializer=_warm_worker)
+        # Start the workers before listening: forked workers would otherwise
+        # inherit client sockets and keep closed connections open.
+        await asyncio.get_running_loop().run_in_executor(self._pool, os.getpid)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections and shut the worker pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def submit(self, kind, payload):
+        """
+        Run or look up a job.
+
+        :return: ``(key, encoded result, cache status)`` where the status is
+            ``"hit"``, ``"miss"`` or ``"shared"`` (joined an identical job
+            already running).
+        :raises ValueError: Invalid job.
+        :raises ServiceBusy: Too many distinct jobs pending.
+        """
+        params = canonicalize(kind, payload)
+        key = cache_key(kind, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return key, cached, "hit"
+
+        future = self._inflight.get(key)
+        status = "shared"
+        if future is None:
+            if len(self._inflight) >= self.max_pending:
+                raise ServiceBusy(f"{len(self._inflight)} jobs pending")
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._pool, _run_encoded, kind, params)
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._finished(key, f))
+            status = "miss"
+        # Shielded so a client hanging up does not cancel a job others share
+        return key, await asyncio.shield(future), status
+
+    def _finished(self, key, future):
+        self._inflight.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+            self.completed += 1
+
+    def health(self):
+        return {
+            "status": "ok",
+            "pending": len(self._inflight),
+            "max_pending": self.max_pending,
+            "processes": self.processes,
+            "completed": self.completed,
+            "cache": self.cache.stats(),
+        }
+
+    async def _dispatch(self, method, path, body):
+        """Return ``(status, body bytes, extra headers)`` for one request."""
+        def error(status, message, headers=()):
+            return status, json.dumps({"error": message}).encode(), list(headers)
+
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        if path == "/health":
+            if method != "GET":
+                return error(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET", [("Allow", "GET")])
+            return HTTPStatus.OK, json.dumps(self.health()).encode(), []
+        if path.startswith("/results/"):
+            if method != "GET":
+                return error(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET", [("Allow", "GET")])
+            key = path[len("/results/"):]
+            result = self.cache.peek(key)
+            if result is None:
+                return error(HTTPStatus.NOT_FOUND, f"No cached result {key}")
+            return HTTPStatus.OK, result, [("ETag", f'"{key}"'), ("X-Cache", "hit")]
+
+        kind = path.lstrip("/")
+        if kind not in JOB_KINDS:
+            return error(HTTPStatus.NOT_FOUND, f"Unknown path {path}")
+        if method != "POST":
+            return error(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST", [("Allow", "POST")])
+        try:
+            payload = json.loads(body or b"{}")
+            key, result, cache = await self.submit(kind, payload)
+        except ValueError as exc:  # also covers JSON and pydantic validation errors
+            return error(HTTPStatus.BAD_REQUEST, str(exc))
+        except ServiceBusy as exc:
+            return error(HTTPStatus.SERVICE_UNAVAILABLE, str(exc), [("Retry-After", "1")])
+        except Exception as exc:  # a failing job must not take the server down
+            return error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+        return HTTPStatus.OK, result, [("ETag", f'"{key}"'), ("X-Cache", cache)]
+
+    async def _handle(self, reader, writer):
+        """Serve HTTP/1.x requests on one connection until it closes."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                parts = line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = len(parts) == 3 and parts[2] == "HTTP/1.1"
+                keep_alive = keep_alive and headers.get("connection", "").lower() != "close"
+                length = headers.get("content-length", "0")
+                if len(parts) != 3 or not length.isdigit():
+                    status, body, extra = HTTPStatus.BAD_REQUEST, b'{"error": "Malformed request"}', []
+                    keep_alive = False
+                elif int(length) > MAX_BODY:
+                    status, body, extra = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b'{"error": "Body too large"}', []
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(int(length))
+                    status, body, extra = await self._dispatch(parts[0], parts[1], body)
+
+                head = [
+                    f"HTTP/1.1 {status.value} {status.phrase}",
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(body)}",
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}",
+                ]
+                head.extend(f"{name}: {value}" for name, value in extra)
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve simulation and triage jobs over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Loopback address to bind.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port.")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="Worker processes.")
+    parser.add_argument("--max-pending", type=int, default=64, help="Distinct jobs queued before 503.")
+    parser.add_argument("--cache-entries", type=int, default=1024, help="Cached results kept.")
+    args = parser.parse_args()
+
+    service = SimulationService(
+        args.host, args.port, processes=args.processes, max_pending=args.max_pending,
+        cache_entries=args.cache_entries,
+    )
+
+    async def serve():
+        await service.start()
+        print(f"Serving on http://{service.host}:{service.port}", flush=True)
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
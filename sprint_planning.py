@@ -1,8 +1,10 @@
 """Sprint planning utilities including triage meeting simulation."""
-from typing import List, Tuple
+from __future__ import annotations
 
-from ticket_system import Ticket
-from team_members import TeamMember
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from models import TeamMember, Ticket
 
 
 PRIORITY_ORDER = {
@@ -15,48 +17,35 @@ PRIORITY_ORDER = {
 
 def _prioritize_tickets(tickets: List[Ticket]) -> List[Ticket]:
     """Return tickets sorted by priority and dependencies."""
-    # Simple topological sort respecting dependencies then priority
-    ticket_map = {t.ticket_id: t for t in tickets}
-    visited = set()
-    ordered: List[Ticket] = []
-
-    def visit(ticket: Ticket):
-        if ticket.ticket_id in visited:
-            return
-        for dep in ticket.dependencies:
-            if dep in ticket_map:
-                visit(ticket_map[dep])
-        visited.add(ticket.ticket_id)
-        ordered.append(ticket)
-
-    for t in sorted(tickets, key=lambda x: PRIORITY_ORDER.get(x.priority, 5)):
-        visit(t)
-
-    # Remove duplicates while preserving order
-    seen = set()
-    final = []
-    for t in ordered:
-        if t.ticket_id not in seen:
-            final.append(t)
-            seen.add(t.ticket_id)
-    return final
-
-
-def simulate_triage_meeting(tickets: List[Ticket], team: List[TeamMember]) -> Tuple[str, str]:
-    """Simulate a triage meeting and return markdown sections."""
-    ordered = _prioritize_tickets(tickets)
+    from ticket_scheduler import schedule_tickets
 
-    capacity = int(sum(m.availability for m in team) * 8)  # simple velocity model
-    velocity = 0
-    commitment: List[Ticket] = []
+    return schedule_tickets(tickets).order
+
+
+def simulate_triage_meeting(
+    tickets: List[Ticket], team: List[TeamMember], return_stats: bool = False
+) -> Tuple:
+    """
+    Simulate a triage meeting and return markdown sections.
+
+    The commitment is the most valuable set of tickets, weighted by priority,
+    that fits the team's capacity and includes every backlog dependency of
+    each committed ticket (see ``commitment_solver``).
+
+    :param return_stats: Also return the solver statistics dict as a third
+        element.
+    """
+    from commitment_solver import solve_commitment
 
-    for t in ordered:
-        effort = t.estimated_effort or 1
-        if velocity + effort > capacity:
-            continue
-        if any(m.can_handle_ticket(t) for m in team):
-            commitment.append(t)
-            velocity += effort
+    from ticket_scheduler import schedule_tickets
+
+    schedule = schedule_tickets(tickets)
+    ordered = schedule.order
+
+    capacity = int(sum(m.availability for m in team) * 8)  # simple velocity model
+    result = solve_commitment(ordered, capacity, team=team)
+    commitment: List[Ticket] = result.selected
+    velocity = result.effort
 
     dep_pairs = [f"{t.ticket_id}->{dep}" for t in ordered for dep in t.dependencies]
 
@@ -68,9 +57,15 @@ def simulate_triage_meeting(tickets: List[Ticket], team: List[TeamMember]) -> Tu
         notes_lines.append(
             "- Sequenced dependent work: " + ", ".join(dep_pairs)
         )
+    for cycle in schedule.cycles:
+        notes_lines.append(
+            "- Dependency cycle needs to be broken before work can start: " + " <-> ".join(cycle)
+        )
     notes_lines.extend([
         "- Flagged high-effort items for risk mitigation.",
         f"- Team capacity for this sprint is {capacity} story points; committed {velocity} points of work.",
+        f"- Commitment solver ({result.method}) reached value {result.value} of bound "
+        f"{result.bound:.1f} (optimality gap {result.gap:.1%}).",
     ])
 
     commit_lines = ["| Ticket ID | Priority | Est Effort |", "|---|---|---|"]
@@ -81,4 +76,7 @@ def simulate_triage_meeting(tickets: List[Ticket], team: List[TeamMember]) -> Tu
     commit_lines.append("")
     commit_lines.append(f"Estimated velocity: {velocity} pts")
 
-    return "\n".join(notes_lines), "\n".join(commit_lines)
+    notes, commit = "\n".join(notes_lines), "\n".join(commit_lines)
+    if return_stats:
+        return notes, commit, result.stats()
+    return notes, commit
@@ -2,61 +2,233 @@
 Module implementing the SprintSimulator, orchestrating end-to-end sprint flow.
 """
 
+from datetime import date
+
+from dependency_index import DependencyIndex
+from events import EventKind, EventLog, LogLines
+from running_metrics import RunningMetrics
+from team_members import CapabilityIndex
+
+
 class SprintSimulator:
-    def __init__(self, team, sprint_length_days=10):
+    ENGINES = ("object", "vector", "event")
+    VERBOSITY = ("off", "summary", "full")
+
+    def __init__(
+        self,
+        team,
+        sprint_length_days=10,
+        rng=None,
+        engine="object",
+        sink=None,
+        log_retention=None,
+        epoch=None,
+        profile=False,
+        profile_hooks=(),
+        verbosity="full",
+        escalation_threshold=None,
+    ):
         """
         Initialize the sprint simulation.
 
         :param team: List of TeamMember instances.
         :param sprint_length_days: Sprint length in business days.
+        :param rng: Optional ``random.Random`` instance. Give each simulator
+            its own stream to make runs reproducible and independent.
+        :param engine: ``"object"`` works ticket by ticket and logs every
+            action; ``"vector"`` keeps ticket state in NumPy arrays and only
+            records day-level outcome events, producing the same metrics;
+            ``"event"`` runs a discrete-event simulation with timed starts and
+            finishes and realistic intra-day capacity (see
+            ``discrete_event_engine``).
+        :param sink: Optional event sink (see ``event_sinks``) that streams
+            every event to disk as it happens. The caller closes it.
+        :param log_retention: Keep only about this many recent events in
+            memory (``daily_logs`` then shows just those); metrics still
+            cover the whole run.
+        :param epoch: Date of day 1 used for log timestamps; defaults to
+            today. Fix it (together with ``rng``) for identical timelines.
+        :param profile: Record per-day, per-phase timings and counters (see
+            ``profiling``); reported under ``"profile"`` in the metrics.
+            ``"memory"`` also records traced memory per phase.
+        :param profile_hooks: Callables ``hook(day, record)`` called after
+            every profiled day; implies ``profile``.
+        :param verbosity: ``"full"`` logs standups and every member's timed
+            day; ``"summary"`` logs only outcomes (completions, escalations,
+            blocks, after-hours work) without drawing timestamps; ``"off"``
+            stores no events at all and only counts them. Metrics are the same
+            at every level.
+        :param escalation_threshold: Effort above which members with skill
+            below 6 escalate to a senior; defaults to
+            ``DailyWorkSimulator.ESCALATION_THRESHOLD``.
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {self.ENGINES}")
+        if verbosity not in self.VERBOSITY:
+            raise ValueError(f"Unknown verbosity {verbosity!r}; expected one of {self.VERBOSITY}")
+        if verbosity == "off" and sink is not None:
+            raise ValueError("An event sink needs verbosity 'summary' or 'full'")
         self.team = team
+        self.rng = rng
+        self.epoch = epoch if epoch is not None else date.today()
+        self.engine = engine
+        self.verbosity = verbosity
+        self.escalation_threshold = escalation_threshold
+        self._vector_engine = None
+        self._event_engine = None
+        self._dependency_index = None
+        self._capabilities = None
+        self._synced_backlog = None
+        self._synced_len = 0
         self.sprint_length = sprint_length_days
         self.current_day = 0
         self.sprint_backlog = []
         self.completed_work = []
-        self.daily_logs = []
+        self.schedule = None
+        self.external_open = set()
+        self.events = EventLog(sink=sink, retain=log_retention, record_events=verbosity != "off")
+        self.running = RunningMetrics()
+        self._arrivals = {}
         self.metrics = {}
+        self.profiler = None
+        if profile or profile_hooks:
+            from profiling import MemoryProfiler, PhaseProfiler
+
+            profiler = MemoryProfiler if profile == "memory" else PhaseProfiler
+            self.profiler = profiler(profile_hooks)
+
+    @property
+    def daily_logs(self):
+        """Text log lines, rendered from ``events`` on access."""
+        return self.events.lines()
+
+    @daily_logs.setter
+    def daily_logs(self, lines):
+        # Replaces the retained events; the per-kind counts behind the
+        # metrics are kept
+        if isinstance(lines, LogLines) and lines.log is self.events:
+            # ``sim.daily_logs += [...]`` already appended in place
+            return
+        lines = list(lines)
+        self.events.discard()
+        for line in lines:
+            self.events.note(line, self.current_day)
+
+    def plan_backlog(self, tickets):
+        """
+        Load ``tickets`` as the sprint backlog in scheduled order.
+
+        The backlog is ordered with ``ticket_scheduler.schedule_tickets``, so
+        within a priority the ready queue follows the dependency order, and
+        the schedule's depth levels and cycles are reported in the metrics.
+
+        :param tickets: Tickets to work this sprint.
+        :return: The TicketSchedule.
+        """
+        from ticket_scheduler import schedule_tickets
+
+        self.schedule = schedule_tickets(tickets)
+        self.sprint_backlog = list(self.schedule.order)
+        return self.schedule
 
     def run_complete_simulation(self):
         """
         Run the full sprint simulation end-to-end.
         """
-        for day in range(1, self.sprint_length + 1):
+        self.current_day = 0
+        return self.continue_simulation()
+
+    def continue_simulation(self, days=None):
+        """
+        Simulate the days after ``current_day``, e.g. after restoring a
+        checkpoint.
+
+        :param days: Number of days to run; defaults to the rest of the sprint.
+            Metrics are captured once the last sprint day has run.
+        """
+        last = self.sprint_length
+        if days is not None:
+            last = min(last, self.current_day + days)
+        for day in range(self.current_day + 1, last + 1):
             self.current_day = day
             self.simulate_daily_standup(day)
             self.simulate_work_day(day)
 
-        # Capture metrics at the end of the simulation
-        self.metrics = self.generate_metrics_report()
+        if self.current_day >= self.sprint_length:
+            # Capture metrics at the end of the simulation
+            self.metrics = self.generate_metrics_report()
+        self.events.flush()
         return self.daily_logs
 
+    def save_checkpoint(self, path):
+        """Write the full simulation state to ``path`` (see ``checkpoint``)."""
+        import checkpoint
+
+        return checkpoint.save(self, path)
+
+    @classmethod
+    def load_checkpoint(cls, path, **kwargs):
+        """Restore a simulator saved with ``save_checkpoint``."""
+        import checkpoint
+
+        return checkpoint.load(path, **kwargs)
+
     def generate_metrics_report(self):
         """Generate performance metrics for the completed sprint."""
-        from collections import Counter
-
+        running = self.running
         metrics = {}
         backlog_total = len(self.completed_work) + len(self.sprint_backlog)
         metrics["total_tickets"] = backlog_total
         metrics["completed_tickets"] = len(self.completed_work)
 
-        velocity = sum(
-            (t.actual_effort or t.estimated_effort or 0) for t in self.completed_work
-        )
-        metrics["velocity"] = velocity
+        if running.completed == len(self.completed_work):
+            metrics["velocity"] = running.velocity
+            metrics["completed_by_priority"] = dict(running.by_priority)
+            metrics["completed_by_category"] = dict(running.by_category)
+        else:
+            # completed_work was edited outside the simulation; recount it
+            from collections import Counter
 
-        metrics["completed_by_priority"] = dict(
-            Counter(t.priority for t in self.completed_work)
-        )
-        metrics["completed_by_category"] = dict(
-            Counter(t.category for t in self.completed_work)
-        )
+            metrics["velocity"] = sum(
+                (t.actual_effort or t.estimated_effort or 0) for t in self.completed_work
+            )
+            metrics["completed_by_priority"] = dict(
+                Counter(t.priority for t in self.completed_work)
+            )
+            metrics["completed_by_category"] = dict(
+                Counter(t.category for t in self.completed_work)
+            )
         metrics["utilization"] = {m.name: m.current_workload for m in self.team}
-        metrics["escalations"] = len(
-            [log for log in self.daily_logs if "Escalating" in log]
-        )
+        metrics["escalations"] = self.events.count(EventKind.ESCALATED)
+        metrics["blocks"] = self.events.count(EventKind.BLOCKED)
+        metrics["after_hours"] = self.events.count(EventKind.AFTER_HOURS)
+        metrics["cycle_time"] = running.cycle_time.summary()
+        metrics["daily_throughput"] = running.daily_throughput.summary()
+        metrics["throughput"] = list(running.throughput)
+        metrics["burndown"] = list(running.burndown)
+        if self.schedule is not None:
+            levels = self.schedule.levels
+            metrics["dependency_depth"] = max(levels.values(), default=-1) + 1
+            metrics["dependency_cycles"] = [list(c) for c in self.schedule.cycles]
+        if self.profiler is not None:
+            metrics["profile"] = self.profiler.report()
         return metrics
 
+    def metrics_snapshot(self):
+        """
+        Return live metrics as of the last simulated day.
+
+        Built from the running aggregates, so it costs the same on day 1 and
+        day 1000 and can be taken after every day of a long run.
+        """
+        snapshot = self.running.snapshot()
+        snapshot["day"] = self.current_day
+        snapshot["utilization"] = {m.name: m.current_workload for m in self.team}
+        snapshot["escalations"] = self.events.count(EventKind.ESCALATED)
+        snapshot["blocks"] = self.events.count(EventKind.BLOCKED)
+        snapshot["after_hours"] = self.events.count(EventKind.AFTER_HOURS)
+        return snapshot
+
     def save_metrics_report(self, path):
         """Persist metrics as a JSON document."""
         import json
@@ -72,77 +244,251 @@ class SprintSimulator:
         Simulate the daily standup meeting content.
         :param day: Day index.
         """
-        lines = [f"Day {day} Standup"]
-        for member in self.team:
-            lines.append(
-                f"- {member.name}: {len(member.completed_tickets)} tickets completed"
-            )
-        self.daily_logs.append("\n".join(lines))
+        if self.verbosity != "full":
+            return
+        prof = self.profiler
+        if prof is not None:
+            prof.start()
+        snapshot = tuple((m.name, len(m.completed_tickets)) for m in self.team)
+        self.events.emit(day, EventKind.STANDUP, detail=snapshot)
+        if prof is not None:
+            prof.lap(day, "standup")
 
     def simulate_work_day(self, day):
         """
         Simulate the activities of a single work day.
         :param day: Day index.
         """
+        prof = self.profiler
+        if prof is not None:
+            prof.start()
+        if self._backlog_replaced():
+            self._record_arrivals(day)
+        if self.engine == "vector":
+            self._simulate_work_day_vector(day)
+        elif self.engine == "event":
+            self._simulate_work_day_events(day)
+        else:
+            self._simulate_work_day_objects(day)
+        self.running.end_day(day, len(self.sprint_backlog))
+        if prof is not None:
+            prof.end_day(day)
+
+    def _simulate_work_day_objects(self, day):
+        """Work the ready tickets one by one, logging every action."""
         from daily_work_simulator import DailyWorkSimulator
 
-        work_sim = DailyWorkSimulator()
+        prof = self.profiler
+        work_sim = DailyWorkSimulator(
+            rng=self.rng,
+            epoch=self.epoch,
+            timestamps=self.verbosity == "full",
+            escalation_threshold=self.escalation_threshold,
+        )
 
-        ticket_lookup = {t.ticket_id: t for t in self.sprint_backlog + self.completed_work}
+        index = self._dependency_index
+        checks = 0 if index is None else index.checks
+        if index is None or self._backlog_replaced():
+            index = self._dependency_index = DependencyIndex(
+                self.sprint_backlog, self.completed_work, external=self.external_open
+            )
+            self._mark_synced()
+            checks = 0
+            for ticket, waiting_on in index.blocked:
+                self.events.emit(day, EventKind.BLOCKED, ticket=ticket.ticket_id, detail=tuple(waiting_on))
 
+        ready = index.pop_ready()
+        if prof is not None:
+            prof.lap(day, "dependencies")
+            prof.count(day, "tickets_scanned", len(ready))
         assignments = {member.name: [] for member in self.team}
+        waiting = []
 
-        for ticket in self.sprint_backlog:
-            if ticket.status == "Closed":
-                continue
-
-            if ticket.dependencies:
-                unresolved = [
-                    dep for dep in ticket.dependencies
-                    if ticket_lookup.get(dep) and ticket_lookup[dep].status != "Closed"
-                ]
-                if unresolved:
-                    ticket.status = "Blocked"
-                    self.daily_logs.append(
-                        f"Day {day} | {ticket.ticket_id} blocked waiting for {','.join(unresolved)}"
-                    )
-                    continue
-                else:
-                    if ticket.status == "Blocked":
-                        ticket.status = "Open"
-
-            if ticket.status != "Open":
+        capabilities = self._capability_index()
+        for ticket in ready:
+            member = capabilities.first_capable(ticket.category)
+            if member is None:
+                waiting.append(ticket)
                 continue
-
-            for member in self.team:
-                if member.can_handle_ticket(ticket):
-                    assignments[member.name].append(ticket)
-                    ticket.status = "Assigned"
-                    break
+            assignments[member.name].append(ticket)
+            ticket.status = "Assigned"
 
         escalated_assignments = {member.name: [] for member in self.team}
+        if prof is not None:
+            prof.lap(day, "assignment")
+            prof.count(day, "assignments", len(ready) - len(waiting))
 
+        # Only ready tickets are handed out, so DailyWorkSimulator needs no
+        # dependency lookup of its own.
+        escalations = 0
         for member in self.team:
             tickets = assignments[member.name]
             if not tickets:
                 continue
-            logs, escalated = work_sim.simulate_work_day(member, tickets, day, ticket_lookup)
-            self.daily_logs.extend(logs)
+            _, escalated = work_sim.simulate_work_day(
+                member, tickets, day, capabilities=capabilities, events=self.events
+            )
+            escalations += len(escalated)
 
             for t in escalated:
-                for senior in self.team:
-                    if senior.skill_level >= 7 and senior.can_handle_ticket(t):
-                        escalated_assignments[senior.name].append(t)
-                        break
+                senior = capabilities.first_capable(t.category, senior=True)
+                if senior is None:
+                    waiting.append(t)
+                else:
+                    escalated_assignments[senior.name].append(t)
+        if prof is not None:
+            prof.lap(day, "work")
+            prof.count(day, "escalations", escalations)
 
         for member in self.team:
             tickets = escalated_assignments[member.name]
             if not tickets:
                 continue
-            logs, _ = work_sim.simulate_work_day(member, tickets, day, ticket_lookup)
-            self.daily_logs.extend(logs)
+            work_sim.simulate_work_day(
+                member, tickets, day, capabilities=capabilities, events=self.events
+            )
+        if prof is not None:
+            prof.lap(day, "escalation")
 
-        for ticket in list(self.sprint_backlog):
+        index.requeue(waiting)
+        closed = [t for t in ready if t.status == "Closed"]
+        for ticket in closed:
+            index.mark_closed(ticket)
+        if closed or index.has_closed:
+            index.has_closed = False
+            self._move_closed_tickets(day)
+        if prof is not None:
+            prof.lap(day, "cleanup")
+            prof.count(day, "blocked_checks", index.checks - checks)
+
+    def block_on_external(self, ticket_ids):
+        """
+        Treat ``ticket_ids`` as open tickets owned elsewhere, e.g. by another
+        team: backlog tickets depending on them stay blocked until
+        ``resolve_external`` reports them closed. Call before the first day.
+        """
+        self.external_open.update(ticket_ids)
+
+    def resolve_external(self, ticket_ids):
+        """Record that external tickets closed; dependents unblock the next day."""
+        ticket_ids = [t for t in ticket_ids if t in self.external_open]
+        self.external_open.difference_update(ticket_ids)
+        if self._dependency_index is not None:
+            self._dependency_index.resolve_external(ticket_ids)
+        if self._vector_engine is not None:
+            self._vector_engine.resolve_external(ticket_ids)
+        if self._event_engine is not None:
+            self._event_engine.resolve_external(ticket_ids)
+
+    def _capability_index(self):
+        """
+        Return the roster's CapabilityIndex, rebuilding it whenever
+        membership, roles, skills, specialties or availability changed.
+        """
+        if self._capabilities is None or not self._capabilities.is_current(self.team):
+            self._capabilities = CapabilityIndex(self.team)
+        return self._capabilities
+
+    def _backlog_replaced(self):
+        """Return True if ``sprint_backlog`` was reassigned or resized externally."""
+        return (
+            self._synced_backlog is not self.sprint_backlog
+            or self._synced_len != len(self.sprint_backlog)
+        )
+
+    def _mark_synced(self):
+        """Record the backlog the day engine was built from."""
+        self._synced_backlog = self.sprint_backlog
+        self._synced_len = len(self.sprint_backlog)
+
+    def _record_arrivals(self, day):
+        """Note the arrival day of tickets new to the backlog."""
+        arrivals = self._arrivals
+        for ticket in self.sprint_backlog:
+            if ticket.ticket_id not in arrivals:
+                arrivals[ticket.ticket_id] = day
+                self.running.record_arrival(ticket)
+
+    def _move_closed_tickets(self, day):
+        """
+        Move closed tickets from the backlog to completed work in one pass,
+        adding each to the running metrics.
+        """
+        arrivals = self._arrivals
+        running = self.running
+        remaining = []
+        for ticket in self.sprint_backlog:
             if ticket.status == "Closed":
-                self.sprint_backlog.remove(ticket)
                 self.completed_work.append(ticket)
+                running.record_close(ticket, day - arrivals.pop(ticket.ticket_id, day) + 1)
+            else:
+                remaining.append(ticket)
+        self.sprint_backlog[:] = remaining
+        self._mark_synced()
+
+    def _simulate_work_day_vector(self, day):
+        """Run one day on the NumPy engine, rebuilding it if the backlog was replaced."""
+        from vector_engine import VectorSprintEngine
+
+        capabilities = self._capability_index()
+        engine = self._vector_engine
+        if engine is None or self._backlog_replaced():
+            engine = VectorSprintEngine(
+                capabilities,
+                self.sprint_backlog,
+                self.completed_work,
+                events=self.events,
+                escalation_threshold=self.escalation_threshold,
+                external=self.external_open,
+            )
+            self._vector_engine = engine
+            self._mark_synced()
+        elif engine.capabilities is not capabilities:
+            engine.set_capabilities(capabilities)
+
+        prof = self.profiler
+        # The engine assigns, works and escalates in one vectorized step
+        if prof is not None:
+            prof.lap(day, "dependencies")
+            prof.count(day, "tickets_scanned", len(self.sprint_backlog))
+        closed = engine.simulate_day(day)
+        if prof is not None:
+            prof.lap(day, "work")
+            prof.count(day, "assignments", engine.assignments)
+            prof.count(day, "escalations", engine.escalations)
+        if closed:
+            self._move_closed_tickets(day)
+        if prof is not None:
+            prof.lap(day, "cleanup")
+
+    def _simulate_work_day_events(self, day):
+        """Advance the discrete-event engine to the end of ``day``."""
+        from discrete_event_engine import DiscreteEventEngine
+
+        capabilities = self._capability_index()
+        engine = self._event_engine
+        if engine is None or self._backlog_replaced():
+            engine = DiscreteEventEngine(
+                capabilities,
+                self.sprint_backlog,
+                self.completed_work,
+                events=self.events,
+                epoch=self.epoch,
+                escalation_threshold=self.escalation_threshold,
+                external=self.external_open,
+            )
+            self._event_engine = engine
+            self._mark_synced()
+        elif engine.capabilities is not capabilities:
+            engine.set_capabilities(capabilities)
+
+        prof = self.profiler
+        if prof is not None:
+            prof.lap(day, "dependencies")
+        closed = engine.run_until(day)
+        if prof is not None:
+            prof.lap(day, "work")
+        if closed:
+            self._move_closed_tickets(day)
+        if prof is not None:
+            prof.lap(day, "cleanup")
@@ -1,47 +1,126 @@
 """
 Module defining TeamMember model for sprint simulation.
+
+``TeamMember`` lives in ``models`` and is only imported when first accessed,
+so the capability tables used by the simulators do not load pydantic.
 """
-from pydantic import BaseModel, Field
-from typing import List
 
 
-class TeamMember(BaseModel):
+def __getattr__(name):
+    if name == "TeamMember":
+        from models import TeamMember
+
+        return TeamMember
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def clone_team(team):
     """
-    Representation of a team member and their capabilities.
+    Return fresh copies of ``team`` with workloads and completed work reset.
+
+    Simulations mutate their members, so independent runs should each start
+    from a clone of the same roster.
     """
-    name: str
-    role: str
-    skill_level: int  # 1-10 scale
-    specialties: List[str]
-    availability: float = 1.0  # fraction of capacity (0.0-1.0)
-    current_workload: int = 0
-    completed_tickets: List[str] = Field(default_factory=list)
-
-    def can_handle_ticket(self, ticket) -> bool:
-        """
-        Determine if this member can handle the given ticket.
-        """
-        # Project managers typically don't work tickets directly
-        if self.role.lower().startswith("project manager"):
-            return False
+    from models import TeamMember, construct
+
+    return [
+        construct(
+            TeamMember,
+            name=m.name,
+            role=m.role,
+            skill_level=m.skill_level,
+            specialties=list(m.specialties),
+            availability=m.availability,
+        )
+        for m in team
+    ]
+
 
-        # If the ticket category matches one of the member's specialties,
-        # we assume they can handle it.
-        if ticket.category in self.specialties:
-            return True
+class _Probe:
+    """Minimal ticket stand-in used to evaluate member rules per category/effort."""
 
-        # Senior members (skill level >=7) can generally help with any ticket
-        return self.skill_level >= 7
+    __slots__ = ("category", "estimated_effort")
 
-    def estimate_effort(self, ticket) -> int:
+    def __init__(self, category=None, estimated_effort=None):
+        self.category = category
+        self.estimated_effort = estimated_effort
+
+
+class CapabilityIndex:
+    """
+    Precomputed assignment tables for one roster.
+
+    Eligibility only depends on a ticket's category and effort only on its
+    base estimate, so both are evaluated once per category / base value with
+    the members' own ``can_handle_ticket`` and ``estimate_effort`` rules and
+    then served from tables. Eligible members are kept as a bitset per
+    category, lowest bit = first member in team order.
+    """
+
+    SENIOR_SKILL = 7
+
+    def __init__(self, team):
+        self.team = list(team)
+        self.fingerprint = self.team_fingerprint(self.team)
+        self._positions = {id(m): i for i, m in enumerate(self.team)}
+        self._seniors = sum(
+            1 << i for i, m in enumerate(self.team) if m.skill_level >= self.SENIOR_SKILL
+        )
+        self._eligible = {}
+        self._first = {}
+        self._efforts = {}
+
+    @staticmethod
+    def team_fingerprint(team):
+        """Return a value that changes whenever membership or capabilities change."""
+        return tuple(
+            (id(m), m.role, m.skill_level, tuple(m.specialties), m.availability) for m in team
+        )
+
+    def is_current(self, team):
+        """Return True if the tables still describe ``team``."""
+        return self.fingerprint == self.team_fingerprint(team)
+
+    def position(self, member):
+        """Return the index of ``member`` in the roster."""
+        return self._positions[id(member)]
+
+    def eligible(self, category):
+        """Return the bitset of members able to handle ``category``."""
+        mask = self._eligible.get(category)
+        if mask is None:
+            probe = _Probe(category=category)
+            mask = sum(1 << i for i, m in enumerate(self.team) if m.can_handle_ticket(probe))
+            self._eligible[category] = mask
+        return mask
+
+    def first_capable(self, category, senior=False):
         """
-        Estimate effort (e.g., story points or time) for the ticket.
+        Return the first member able to handle ``category`` or ``None``.
+
+        :param senior: Restrict to members with skill of at least 7, as used
+            for escalation handoffs.
         """
-        base = ticket.estimated_effort or 1
+        key = (category, senior)
+        if key not in self._first:
+            mask = self.eligible(category)
+            if senior:
+                mask &= self._seniors
+            self._first[key] = self.team[(mask & -mask).bit_length() - 1] if mask else None
+        return self._first[key]
+
+    def can_handle(self, member, ticket):
+        """Table-backed equivalent of ``member.can_handle_ticket(ticket)``."""
+        return bool(self.eligible(ticket.category) >> self.position(member) & 1)
 
-        # Higher skill reduces effort while low availability increases it
-        skill_factor = max(0.5, 1.5 - (self.skill_level / 10))
-        avail_factor = 1 / self.availability if self.availability > 0 else 2
+    def efforts(self, base):
+        """Return every member's effort for a ticket with estimate ``base``."""
+        row = self._efforts.get(base)
+        if row is None:
+            probe = _Probe(estimated_effort=base)
+            row = self._efforts[base] = tuple(m.estimate_effort(probe) for m in self.team)
+        return row
 
-        effort = int(round(base * skill_factor * avail_factor))
-        return max(1, effort)
+    def estimate_effort(self, member, ticket):
+        """Table-backed equivalent of ``member.estimate_effort(ticket)``."""
+        return self.efforts(ticket.estimated_effort or 1)[self.position(member)]
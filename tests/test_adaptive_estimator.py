@@ -0,0 +1,51 @@
+import pytest
+
+from adaptive_estimator import AntitheticRandom, BacklogStrata, estimate
+from generate_pre_sprint_analysis import build_team
+from ticket_system import TicketGenerator
+
+
+def test_mirrored_stream_stays_in_lockstep():
+    rng, twin = AntitheticRandom("4:2"), AntitheticRandom("4:2", mirrored=True)
+    for _ in range(200):
+        assert rng.random() + twin.random() == pytest.approx(1.0)
+        assert rng.randint(1, 3) + twin.randint(1, 3) == 4
+        assert rng.choice("abcde") + twin.choice("abcde") in {"ae", "bd", "cc", "db", "ea"}
+
+    tickets = TicketGenerator(rng=AntitheticRandom("x")).generate_realistic_tickets(40)
+    twins = TicketGenerator(rng=AntitheticRandom("x", mirrored=True)).generate_realistic_tickets(40)
+    pairs = {(a.priority, b.priority) for a, b in zip(tickets, twins)}
+    assert ("Critical", "Low") in pairs
+    assert all(b == "Low" for a, b in pairs if a == "Critical")
+
+
+def test_stops_at_target_precision_with_fewer_runs_than_naive():
+    report = estimate(
+        build_team(), num_tickets=20, sprint_length=1, seed=5, metrics=("completion_rate", "velocity"),
+        relative_precision=0.02, antithetic=True, stratify=True, batch_size=40, min_runs=40, processes=1,
+    )
+    parallel = estimate(
+        build_team(), num_tickets=20, sprint_length=1, seed=5, metrics=("completion_rate", "velocity"),
+        relative_precision=0.02, antithetic=True, stratify=True, batch_size=40, min_runs=40, processes=2,
+    )
+
+    assert report == parallel
+    assert report["converged"] and report["runs"] % 2 == 0
+    assert report["runs"] < report["naive_runs"]
+    for summary in report["metrics"].values():
+        assert summary["half_width"] <= summary["target"]
+        assert summary["ci_low"] <= summary["mean"] <= summary["ci_high"]
+
+
+def test_strata_cover_the_backlog_distribution():
+    strata = BacklogStrata(20)
+    assert len(strata) == 9
+    assert sum(strata.weights) == pytest.approx(1.0)
+
+    hits = [0] * len(strata)
+    for i in range(600):
+        hits[strata.classify(TicketGenerator(rng=AntitheticRandom(i)).generate_ticket_store(20).views())] += 1
+    assert [h / 600 for h in hits] == pytest.approx(strata.weights, abs=0.05)
+
+    with pytest.raises(ValueError):
+        estimate(build_team(), metrics=("burndown",))
@@ -0,0 +1,32 @@
+import json
+
+import benchmarks
+from benchmarks import compare_to_baseline, main, run_suite
+
+
+def test_suite_records_time_and_memory():
+    report = run_suite([("generate_tickets", 50, 5), ("simulation", 50, 5)], repeat=1)
+
+    result = report["results"]["simulation[tickets=50,team=5]"]
+    assert result["wall_seconds"] > 0
+    assert result["peak_memory_bytes"] > 0
+    assert result["allocated_blocks"] >= 0
+    assert compare_to_baseline(report, report) == []
+
+
+def test_regressions_fail_against_baseline(tmp_path, monkeypatch):
+    baseline = {"results": {"triage[tickets=100,team=5]": {"wall_seconds": 1e-6, "peak_memory_bytes": 1}}}
+    slow = {"results": {"triage[tickets=100,team=5]": {"wall_seconds": 0.5, "peak_memory_bytes": 1}}}
+
+    failures = compare_to_baseline(slow, baseline)
+    assert len(failures) == 1 and "wall_seconds" in failures[0]
+
+    # A one-case suite keeps this a test of the comparison, not of benchmark runtime
+    monkeypatch.setitem(benchmarks.SUITES, "quick", [("triage", 100, 5)])
+    path = tmp_path / "baseline.json"
+    args = ["--suite", "quick", "--repeat", "1", "-o", str(tmp_path / "out.json"), "--baseline", str(path)]
+    path.write_text(json.dumps(baseline))
+    assert main(args) == 1
+    generous = {"results": {"triage[tickets=100,team=5]": {"wall_seconds": 60.0, "peak_memory_bytes": 1 << 40}}}
+    path.write_text(json.dumps(generous))
+    assert main(args) == 0
@@ -0,0 +1,56 @@
+from sprint_simulator import SprintSimulator
+from team_members import CapabilityIndex, TeamMember
+from ticket_system import Ticket
+
+
+def _team():
+    return [
+        TeamMember(name="pm", role="Project Manager", skill_level=9, specialties=["Email"]),
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Email"]),
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=[], availability=0.5),
+    ]
+
+
+def _ticket(tid, category="Email", effort=3):
+    return Ticket(ticket_id=tid, source="ServiceNow", priority="Medium", category=category, description=tid, estimated_effort=effort)
+
+
+def test_tables_match_member_rules():
+    team = _team()
+    index = CapabilityIndex(team)
+
+    assert index.eligible("Email") == 0b110
+    assert index.eligible("VPN") == 0b100
+    assert index.first_capable("Email") is team[1]
+    assert index.first_capable("Email", senior=True) is team[2]
+    for ticket in (_ticket("a"), _ticket("b", "VPN", 7), _ticket("c", effort=None)):
+        for member in team:
+            assert index.can_handle(member, ticket) == member.can_handle_ticket(ticket)
+            assert index.estimate_effort(member, ticket) == member.estimate_effort(ticket)
+
+
+def test_index_invalidated_by_roster_changes():
+    team = _team()
+    index = CapabilityIndex(team)
+    assert index.is_current(team)
+
+    team[1].specialties.append("VPN")
+    assert not index.is_current(team)
+    assert CapabilityIndex(team).first_capable("VPN") is team[1]
+
+    team[2].availability = 1.0
+    assert not CapabilityIndex(team[:2]).is_current(team)
+
+
+def test_simulator_picks_up_mid_sprint_changes():
+    team = [TeamMember(name="dev", role="Developer", skill_level=5, specialties=[])]
+    ticket = _ticket("SNW-1", effort=1)
+    sim = SprintSimulator(team, sprint_length_days=2)
+    sim.sprint_backlog = [ticket]
+
+    sim.simulate_work_day(1)
+    assert ticket.status == "Open"
+
+    team[0].specialties.append("Email")
+    sim.simulate_work_day(2)
+    assert ticket.status == "Closed"
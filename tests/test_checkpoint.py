@@ -0,0 +1,73 @@
+import random
+from datetime import date
+
+import pytest
+
+import checkpoint
+from generate_pre_sprint_analysis import build_team
+from serialization import decode_strings, encode_strings
+from sprint_simulator import SprintSimulator
+from ticket_system import Ticket, TicketGenerator
+
+
+def _simulator(engine="object", seed=5):
+    sim = SprintSimulator(build_team(), rng=random.Random(seed), engine=engine, epoch=date(2024, 1, 1))
+    sim.plan_backlog(TicketGenerator(rng=random.Random(6)).generate_realistic_tickets(300))
+    return sim
+
+
+@pytest.mark.parametrize("engine", ["object", "vector"])
+def test_resumed_run_matches_uninterrupted_run(tmp_path, engine):
+    full = _simulator(engine)
+    full.run_complete_simulation()
+
+    paused = _simulator(engine)
+    paused.continue_simulation(days=4)
+    path = tmp_path / "day4.ckpt"
+    paused.save_checkpoint(path)
+
+    resumed = SprintSimulator.load_checkpoint(path)
+    assert resumed.current_day == 4
+    resumed.continue_simulation()
+
+    assert resumed.metrics == full.metrics
+    assert list(resumed.daily_logs) == list(full.daily_logs)
+    assert [m.completed_tickets for m in resumed.team] == [m.completed_tickets for m in full.team]
+
+
+def test_forked_branches_are_independent():
+    base = _simulator()
+    base.continue_simulation(days=1)
+    data = checkpoint.dumps(base)
+
+    same_a, same_b = checkpoint.fork(data, 2)
+    other, = checkpoint.fork(data, 1, rngs=[random.Random(99)])
+    same_a.team[0].availability = 0.5
+    for sim in (same_a, same_b, other):
+        sim.continue_simulation()
+
+    assert base.current_day == 1 and not base.metrics
+    assert same_b.metrics["completed_tickets"] == _finish(base).metrics["completed_tickets"]
+    assert list(other.daily_logs)[:50] == list(same_b.daily_logs)[:50]
+    assert list(other.daily_logs) != list(same_b.daily_logs)
+
+
+def _finish(sim):
+    sim.continue_simulation()
+    return sim
+
+
+def test_empty_strings_round_trip():
+    assert decode_strings(encode_strings([""])) == [""]
+    assert decode_strings(encode_strings(["", "a\0b", "é", ""])) == ["", "a\0b", "é", ""]
+    assert decode_strings(encode_strings([])) == []
+
+    sim = SprintSimulator(build_team(), sprint_length_days=2, rng=random.Random(1), epoch=date(2024, 1, 1))
+    ticket = Ticket(
+        ticket_id="SNW-1", source="ServiceNow", priority="Low", category="Email", description="",
+        estimated_effort=1,
+    )
+    sim.sprint_backlog = [ticket]
+    restored = checkpoint.loads(checkpoint.dumps(sim))
+
+    assert [(t.ticket_id, t.description) for t in restored.sprint_backlog] == [("SNW-1", "")]
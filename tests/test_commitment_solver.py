@@ -0,0 +1,91 @@
+import itertools
+import random
+
+from commitment_solver import solve_commitment, ticket_value
+from sprint_planning import simulate_triage_meeting
+from team_members import TeamMember
+from ticket_system import Ticket, TicketGenerator
+
+
+def _ticket(tid, priority, effort, deps=(), category="Email"):
+    return Ticket(
+        ticket_id=tid, source="ServiceNow", priority=priority, category=category,
+        description=tid, estimated_effort=effort, dependencies=list(deps),
+    )
+
+
+def _brute_force(tickets, capacity):
+    ids = {t.ticket_id for t in tickets}
+    best = 0
+    for r in range(len(tickets) + 1):
+        for subset in itertools.combinations(tickets, r):
+            chosen = {t.ticket_id for t in subset}
+            if sum(t.estimated_effort for t in subset) > capacity:
+                continue
+            if any(d in ids and d not in chosen for t in subset for d in t.dependencies):
+                continue
+            best = max(best, sum(ticket_value(t) for t in subset))
+    return best
+
+
+def test_commitment_includes_dependencies_and_is_optimal():
+    rng = random.Random(5)
+    for _ in range(40):
+        tickets = []
+        for i in range(9):
+            deps = [f"T{j}" for j in range(i) if rng.random() < 0.2]
+            tickets.append(_ticket(f"T{i}", rng.choice(["Critical", "High", "Medium", "Low"]), rng.randint(1, 6), deps))
+        capacity = rng.randint(3, 25)
+
+        result = solve_commitment(tickets, capacity)
+        chosen = {t.ticket_id for t in result.selected}
+
+        assert result.optimal and result.gap == 0.0
+        assert result.effort <= capacity
+        assert all(d in chosen for t in result.selected for d in t.dependencies)
+        assert result.value == _brute_force(tickets, capacity)
+
+
+def test_large_backlog_uses_bounded_approximation():
+    backlog = TicketGenerator().generate_bulk(20000, seed=11).views()
+
+    result = solve_commitment(backlog, 15000, exact_limit=1000)
+
+    assert result.method == "greedy"
+    assert result.effort <= 15000
+    assert result.value <= result.bound
+    assert result.gap < 0.05
+
+
+def test_triage_skips_tickets_with_unhandled_dependencies():
+    team = [TeamMember(name="dev", role="Developer", skill_level=5, specialties=["Email"])]
+    tickets = [
+        _ticket("SNW-1", "Low", 1, category="Networking"),
+        _ticket("SNW-2", "Critical", 2, deps=["SNW-1"]),
+        _ticket("SNW-3", "Medium", 3),
+    ]
+
+    notes, commit, stats = simulate_triage_meeting(tickets, team, return_stats=True)
+
+    assert "SNW-3" in commit and "SNW-2" not in commit and "SNW-1" not in commit
+    assert stats["optimal"] and stats["excluded"] == 2
+    assert "optimality gap" in notes
+    # Timing stays in the stats so identical inputs give identical notes
+    assert "elapsed_seconds" in stats
+    assert simulate_triage_meeting(tickets, team) == (notes, commit)
+
+
+def test_branch_and_bound_handles_backlogs_deeper_than_the_recursion_limit():
+    rng = random.Random(8)
+    priorities = ["Critical", "High", "Medium", "Low"]
+    tickets = [_ticket(f"T{i}", rng.choice(priorities), rng.randint(1, 8)) for i in range(1600)]
+    # 2**12 dependency-closed subsets is too many for the grouped DP
+    tickets.append(_ticket("ROOT", "Low", 3))
+    tickets += [_ticket(f"S{i}", "Critical", 2, deps=["ROOT"]) for i in range(12)]
+
+    result = solve_commitment(tickets, 3001, node_limit=20000)
+    chosen = {t.ticket_id for t in result.selected}
+
+    assert result.method == "branch-and-bound"
+    assert result.effort <= 3001 and result.value <= result.bound
+    assert all(d in chosen for t in result.selected for d in t.dependencies)
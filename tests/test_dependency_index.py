@@ -0,0 +1,76 @@
+from dependency_index import DependencyIndex
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import Ticket
+
+
+def _ticket(tid, priority="Medium", deps=(), status="Open"):
+    return Ticket(
+        ticket_id=tid, source="ServiceNow", priority=priority, category="Email",
+        description=tid, estimated_effort=1, dependencies=list(deps), status=status,
+    )
+
+
+def test_ready_queue_orders_by_priority_then_backlog_position():
+    tickets = [
+        _ticket("SNW-1", "Low"),
+        _ticket("SNW-2", "Critical"),
+        _ticket("SNW-3", "Low"),
+        _ticket("SNW-4", "High", deps=["SNW-1"]),
+    ]
+    index = DependencyIndex(tickets)
+
+    assert [t.ticket_id for t in index.pop_ready()] == ["SNW-2", "SNW-1", "SNW-3"]
+    assert tickets[3].status == "Blocked"
+    assert index.pop_ready() == []
+
+    index.mark_closed(tickets[0])
+    assert index.unresolved["SNW-4"] == 0
+    assert [t.ticket_id for t in index.pop_ready()] == ["SNW-4"]
+    assert tickets[3].status == "Open"
+
+
+def test_completed_and_unknown_dependencies_do_not_block():
+    done = _ticket("SNW-0", status="Closed")
+    ticket = _ticket("SNW-1", deps=["SNW-0", "JIRA-404"])
+    index = DependencyIndex([ticket], completed_work=[done])
+
+    assert index.pop_ready() == [ticket]
+
+
+def _stuck_backlog():
+    blocker = _ticket("SNW-1")
+    blocker.category = "VPN"  # nobody on the team can work it
+    return [blocker, _ticket("SNW-2", deps=["SNW-1"])]
+
+
+def test_day_engines_are_not_rebuilt_while_nothing_closes():
+    team = [TeamMember(name="dev", role="Developer", skill_level=4, specialties=["Email"])]
+
+    sim = SprintSimulator(team, sprint_length_days=5)
+    sim.sprint_backlog = _stuck_backlog()
+    sim.run_complete_simulation()
+    assert sim.completed_work == []
+    assert sum("blocked waiting" in log for log in sim.daily_logs) == 1
+
+    vector = SprintSimulator(team, sprint_length_days=5, engine="vector")
+    vector.sprint_backlog = _stuck_backlog()
+    vector.simulate_work_day(1)
+    engine = vector._vector_engine
+    for day in range(2, 6):
+        vector.simulate_work_day(day)
+    assert vector._vector_engine is engine
+
+
+def test_dependency_chain_closes_one_link_per_day():
+    team = [TeamMember(name="dev", role="Developer", skill_level=8, specialties=["Email"])]
+    chain = [_ticket("SNW-0")] + [_ticket(f"SNW-{i}", deps=[f"SNW-{i - 1}"]) for i in range(1, 5)]
+
+    sim = SprintSimulator(team, sprint_length_days=3)
+    sim.sprint_backlog = list(reversed(chain))
+    sim.run_complete_simulation()
+
+    assert [t.ticket_id for t in sim.completed_work] == ["SNW-0", "SNW-1", "SNW-2"]
+    # SNW-3 is released by the day-3 closure but only reopens on the next day
+    assert [t.status for t in sim.sprint_backlog] == ["Blocked", "Blocked"]
+    assert sum("blocked waiting" in log for log in sim.daily_logs) == 4
@@ -0,0 +1,79 @@
+from datetime import date, datetime
+
+from discrete_event_engine import add_working_time
+from log_utils import format_timestamp, to_seconds
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import Ticket
+
+
+def _ticket(tid, priority="High", effort=3, deps=()):
+    return Ticket(
+        ticket_id=tid, source="Jira", priority=priority, category="Email",
+        description=tid, estimated_effort=effort, dependencies=list(deps),
+    )
+
+
+def _simulate(tickets, days=1):
+    team = [TeamMember(name="dev", role="Developer", skill_level=8, specialties=["Email"])]
+    sim = SprintSimulator(team, sprint_length_days=days, engine="event", epoch=date(2024, 1, 1))
+    sim.sprint_backlog = tickets
+    sim.run_complete_simulation()
+    return sim
+
+
+def test_working_time_skips_lunch_and_nights():
+    start = to_seconds(datetime(2024, 1, 1, 11, 0))
+
+    assert format_timestamp(add_working_time(start, 2 * 3600)) == "2024-01-01 14:00:00"
+    assert format_timestamp(add_working_time(start, 8 * 3600)) == "2024-01-02 10:00:00"
+
+
+def test_day_capacity_is_limited_by_working_hours():
+    # Each ticket takes the senior 2 hours: 08-10, 10-12, 13-15, 15-17, then 17-19 spills over
+    sim = _simulate([_ticket(f"T{i}") for i in range(10)])
+
+    assert sim.metrics["completed_tickets"] == 4
+    assert "2024-01-01 17:00:00 | dev | Completed T3 in 2 pts" in list(sim.daily_logs)
+
+
+def test_dependents_start_as_soon_as_dependency_finishes():
+    sim = _simulate([_ticket("B", deps=["A"]), _ticket("A")])
+    logs = list(sim.daily_logs)
+
+    assert sim.metrics["completed_tickets"] == 2
+    assert "2024-01-01 10:00:00 | dev | Started B: B" in logs
+
+
+def test_critical_work_pages_after_hours():
+    tickets = [_ticket(f"T{i}") for i in range(4)] + [_ticket("C", priority="Critical", effort=6, deps=["T3"])]
+    sim = _simulate(tickets)
+
+    assert sim.metrics["completed_tickets"] == 5
+    assert sim.metrics["after_hours"] == 1
+    assert any(line.endswith("| dev | After-hours incident response") for line in sim.daily_logs)
+
+
+def test_roster_change_mid_sprint_keeps_work_in_flight():
+    lead = TeamMember(name="lead", role="Developer", skill_level=6, specialties=["Email"])
+    helper = TeamMember(name="helper", role="Developer", skill_level=8, specialties=["VPN"])
+    vpn = [
+        Ticket(ticket_id=tid, source="Jira", priority="High", category="VPN", description=tid, estimated_effort=effort)
+        for tid, effort in (("V1", 16), ("V2", 2))
+    ]
+    sim = SprintSimulator([lead, helper], sprint_length_days=5, engine="event", epoch=date(2024, 1, 1))
+    sim.sprint_backlog = [_ticket("E1", effort=16)] + vpn
+    sim.continue_simulation(days=1)
+    engine = sim._event_engine
+    assert [t.status for t in sim.sprint_backlog] == ["In Progress", "In Progress", "Assigned"]
+
+    # The helper leaves while working V1; the lead's promotion lets them take V2
+    sim.team.remove(helper)
+    lead.skill_level = 7
+    sim.continue_simulation()
+
+    assert sim._event_engine is engine
+    assert sim.sprint_backlog == []
+    owners = {t.ticket_id: t.assigned_to for t in sim.completed_work}
+    assert owners == {"E1": "lead", "V1": "helper", "V2": "lead"}
+    assert sim.metrics["completed_tickets"] == 3
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from event_sinks import BinaryEventSink, JsonlEventSink, read_events
+from events import EventKind
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import TicketGenerator
+
+
+def _team():
+    return [
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Email", "VPN"]),
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"]),
+    ]
+
+
+def _simulate(**kwargs):
+    rng = random.Random(11)
+    sim = SprintSimulator(_team(), sprint_length_days=5, rng=rng, **kwargs)
+    sim.sprint_backlog = TicketGenerator(rng=rng).generate_realistic_tickets(60)
+    sim.run_complete_simulation()
+    return sim
+
+
+@pytest.mark.parametrize("sink_cls", [JsonlEventSink, BinaryEventSink])
+@pytest.mark.parametrize("compress", [False, True])
+def test_sink_round_trip(tmp_path, sink_cls, compress):
+    path = tmp_path / "events.out"
+    reference = _simulate()
+
+    with sink_cls(path, compress=compress, flush_every=7) as sink:
+        streamed = _simulate(sink=sink)
+
+    assert list(read_events(path)) == list(reference.events.records())
+    assert streamed.metrics == reference.metrics
+
+
+def test_retention_bounds_memory_but_not_metrics(tmp_path):
+    reference = _simulate()
+    with BinaryEventSink(tmp_path / "events.bin") as sink:
+        sim = _simulate(sink=sink, log_retention=20)
+
+    assert len(sim.events.kind) <= 40
+    assert 0 < len(sim.daily_logs) <= 40
+    assert list(sim.daily_logs) == list(reference.daily_logs)[-len(sim.daily_logs):]
+    assert sim.metrics == reference.metrics
+    assert sum(1 for e in read_events(tmp_path / "events.bin") if e.kind == EventKind.ESCALATED) == sim.metrics["escalations"]
@@ -0,0 +1,96 @@
+from events import EventKind, EventLog
+from log_utils import to_seconds
+from datetime import datetime
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import Ticket
+
+
+def test_events_render_lazily_in_log_format():
+    log = EventLog()
+    ts = to_seconds(datetime(2024, 1, 2, 9, 30))
+    log.emit(1, EventKind.STANDUP, detail=(("dev", 0),))
+    log.emit(1, EventKind.STARTED, "dev", "SNW-1", detail="Fix mail", timestamp=ts)
+    log.emit(1, EventKind.COMPLETED, "dev", "SNW-1", effort=3, timestamp=ts)
+    log.emit(2, EventKind.BLOCKED, ticket="SNW-2", detail=("SNW-1",))
+
+    lines = log.lines()
+    assert len(lines) == 4
+    assert lines[0] == "Day 1 Standup\n- dev: 0 tickets completed"
+    assert lines[1] == "2024-01-02 09:30:00 | dev | Started SNW-1: Fix mail"
+    assert lines[-2] == "2024-01-02 09:30:00 | dev | Completed SNW-1 in 3 pts"
+    assert lines[3] == "Day 2 | SNW-2 blocked waiting for SNW-1"
+    assert log.lines(2)[:] == [lines[2], lines[3]]
+    assert log.record(2).effort == 3
+
+
+def test_batch_emit_and_counts():
+    log = EventLog()
+    members = [log.member_code("dev")] * 2
+    tickets = [log.ticket_code("SNW-1"), log.ticket_code("SNW-2")]
+    log.emit_batch(3, EventKind.ESCALATED, members, tickets)
+
+    assert log.count(EventKind.ESCALATED) == 2
+    assert log.count(EventKind.COMPLETED) == 0
+    assert list(log.lines()) == [
+        "Day 3 | dev | Escalating SNW-1 to senior engineer",
+        "Day 3 | dev | Escalating SNW-2 to senior engineer",
+    ]
+
+
+def test_metrics_counted_from_event_kinds():
+    team = [
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Email"]),
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"]),
+    ]
+    hard = Ticket(ticket_id="SNW-1", source="ServiceNow", priority="Critical", category="Email", description="Hard", estimated_effort=6)
+    later = Ticket(ticket_id="SNW-2", source="ServiceNow", priority="Low", category="Email", description="Later", estimated_effort=1, dependencies=["SNW-1"])
+
+    sim = SprintSimulator(team, sprint_length_days=2)
+    sim.sprint_backlog = [hard, later]
+    sim.run_complete_simulation()
+
+    assert sim.metrics["escalations"] == 1
+    assert sim.metrics["blocks"] == 1
+    # Junior's pass and the senior's handoff pass both involved critical work
+    assert sim.metrics["after_hours"] == 2
+
+
+def test_daily_logs_accept_list_style_writes():
+    team = [TeamMember(name="dev", role="Developer", skill_level=8, specialties=["Email"])]
+    sim = SprintSimulator(team, sprint_length_days=1)
+    sim.sprint_backlog = [
+        Ticket(ticket_id="SNW-1", source="ServiceNow", priority="High", category="Email", description="Mail", estimated_effort=1)
+    ]
+    sim.run_complete_simulation()
+    metrics = sim.generate_metrics_report()
+
+    sim.daily_logs.append("Retro: ship it")
+    sim.daily_logs += ["Sprint closed"]
+    assert list(sim.daily_logs)[-2:] == ["Retro: ship it", "Sprint closed"]
+    assert sim.events.record(0).kind == EventKind.STANDUP
+
+    sim.daily_logs = ["Reset by caller"]
+    assert list(sim.daily_logs) == ["Reset by caller"]
+    sim.daily_logs = []
+    assert list(sim.daily_logs) == []
+    assert sim.generate_metrics_report() == metrics
+
+
+def test_member_day_log_excludes_later_events():
+    from daily_work_simulator import DailyWorkSimulator
+
+    log = EventLog()
+    sim = DailyWorkSimulator()
+    first = TeamMember(name="first", role="Developer", skill_level=8, specialties=["Email"])
+    second = TeamMember(name="second", role="Developer", skill_level=8, specialties=["Email"])
+    ticket = Ticket(ticket_id="SNW-1", source="ServiceNow", priority="Low", category="Email", description="Mail", estimated_effort=1)
+    other = Ticket(ticket_id="SNW-2", source="ServiceNow", priority="Low", category="Email", description="Mail", estimated_effort=1)
+
+    day_log, _ = sim.simulate_work_day(first, [ticket], day=1, events=log)
+    lines = list(day_log)
+    sim.simulate_work_day(second, [other], day=1, events=log)
+    log.emit(2, EventKind.BLOCKED, ticket="SNW-3", detail=("SNW-2",))
+
+    assert len(day_log) == len(lines) and list(day_log) == lines
+    assert all("| first |" in line for line in lines)
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+
+from ticket_system import TicketGenerator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIMULATOR_MODULES = ["sprint_simulator", "ticket_system", "team_members", "sprint_planning", "commitment_solver"]
+# Packages whose import dominates start-up; the simulator loads them on first use
+HEAVY_PACKAGES = ("models", "numpy", "pydantic")
+# Modules the entry points may add to a bare interpreter; they load 46 on Python 3.11
+IMPORT_MODULE_BUDGET = 80
+
+
+def _imported_modules(modules):
+    """Import ``modules`` in a fresh interpreter and return the modules they added."""
+    code = (
+        "import json, sys; before = set(sys.modules); "
+        f"import {', '.join(modules)}; print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_simulator_modules_stay_within_import_budget():
+    loaded = _imported_modules(SIMULATOR_MODULES)
+
+    assert [name for name in loaded if name.split(".")[0] in HEAVY_PACKAGES] == []
+    assert len(loaded) <= IMPORT_MODULE_BUDGET
+
+
+def test_models_stay_reachable_and_trusted_tickets_match_validated_ones():
+    from ticket_system import Ticket
+    from team_members import TeamMember
+
+    tickets = TicketGenerator().generate_realistic_tickets(20)
+    assert all(type(t) is Ticket for t in tickets)
+    assert [Ticket(**t.__dict__) for t in tickets] == tickets
+    assert TeamMember(name="a", role="Developer", skill_level="5", specialties=[]).skill_level == 5
@@ -0,0 +1,54 @@
+import json
+import random
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+from generate_pre_sprint_analysis import build_team
+from memory_profiling import STAGES, check_budget, profile_scenario, run_budget_scenario
+from profiling import PHASES
+from sprint_simulator import SprintSimulator
+from ticket_system import TicketGenerator
+
+BUDGET = Path(__file__).resolve().parent.parent / "memory_budget.json"
+
+
+def _run(**kwargs):
+    sim = SprintSimulator(build_team(), sprint_length_days=5, rng=random.Random(3), epoch=date(2024, 1, 1), **kwargs)
+    sim.sprint_backlog = TicketGenerator(rng=random.Random(4)).generate_realistic_tickets(200)
+    sim.run_complete_simulation()
+    return sim
+
+
+def test_memory_profile_reports_phases_without_changing_results():
+    profiled = _run(profile="memory").metrics
+    profile = profiled.pop("profile")
+
+    assert not tracemalloc.is_tracing()
+    assert set(profile["memory"]) == set(PHASES)
+    assert profile["memory"]["work"]["peak_bytes"] > 0
+    assert all("memory" in day for day in profile["days"])
+    assert profiled == _run().metrics
+
+
+def test_scenario_breaks_memory_down_by_stage_and_type():
+    report = profile_scenario(300, team_size=5, sprint_length=3)
+
+    assert list(report["stages"]) == list(STAGES)
+    assert report["peak_bytes"] >= report["stages"]["generate"]["peak_bytes"] > 0
+    types = report["types"]
+    assert types["event"]["count"] > 0 and types["log line"]["count"] == types["event"]["count"]
+    assert 0 < types["TicketStore row"]["bytes_each"] < types["Ticket"]["bytes_each"]
+    assert report["bytes_per_ticket"] > types["Ticket"]["bytes_each"]
+
+    assert check_budget(report, {"bytes_per_ticket": 1}) != []
+    assert check_budget(report, {"bytes_per_ticket": report["bytes_per_ticket"]}) == []
+
+
+def test_reference_scenario_stays_within_recorded_budget():
+    budget = json.loads(BUDGET.read_text())
+    report = run_budget_scenario(budget)
+
+    assert report["rss_growth_bytes"] == report["peak_rss_bytes"] - report["baseline_rss_bytes"] > 0
+    assert check_budget(report, budget) == []
+    assert check_budget(dict(report, rss_growth_bytes=budget["rss_growth_bytes"] + 1), budget) != []
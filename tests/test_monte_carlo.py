@@ -0,0 +1,37 @@
+from monte_carlo import run_monte_carlo, summarize_histogram
+from team_members import TeamMember
+
+
+def _team():
+    return [
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"]),
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Slack"]),
+    ]
+
+
+def test_summarize_histogram_percentiles():
+    summary = summarize_histogram({1: 1, 2: 2, 10: 1})
+    assert summary["min"] == 1
+    assert summary["max"] == 10
+    assert summary["p50"] == 2
+    assert summary["p95"] == 10
+    assert summary["mean"] == 15 / 4
+
+
+def test_results_independent_of_worker_count():
+    team = _team()
+    serial = run_monte_carlo(team, runs=6, num_tickets=8, sprint_length=2, seed=7, processes=1)
+    parallel = run_monte_carlo(team, runs=6, num_tickets=8, sprint_length=2, seed=7, processes=2)
+
+    assert serial == parallel
+    assert serial["runs"] == 6
+    assert set(serial["utilization"]) == {"senior", "junior"}
+    # The caller's team is never mutated by the runs
+    assert all(m.current_workload == 0 for m in team)
+
+
+def test_different_seeds_give_different_streams():
+    team = _team()
+    a = run_monte_carlo(team, runs=5, num_tickets=10, sprint_length=1, seed=1, processes=1)
+    b = run_monte_carlo(team, runs=5, num_tickets=10, sprint_length=1, seed=2, processes=1)
+    assert a["velocity"] != b["velocity"] or a["completed_tickets"] != b["completed_tickets"]
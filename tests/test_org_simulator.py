@@ -0,0 +1,64 @@
+from datetime import date
+
+import pytest
+
+from org_simulator import OrganizationSimulator
+from team_members import TeamMember
+from ticket_system import Ticket
+
+
+def _ticket(tid, deps=(), category="Email"):
+    return Ticket(
+        ticket_id=tid, source="Jira", priority="High", category=category,
+        description=tid, estimated_effort=2, dependencies=list(deps),
+    )
+
+
+class _StuckTicket(Ticket):
+    def __setattr__(self, name, value):
+        if name == "status" and value != "Open":
+            raise RuntimeError(f"{self.ticket_id} refuses status {value}")
+        super().__setattr__(name, value)
+
+
+def _teams():
+    def members(name):
+        return [TeamMember(name=name, role="Developer", skill_level=8, specialties=["Email"])]
+
+    return {
+        "alpha": (members("a"), [_ticket("A-1"), _ticket("A-2", deps=["A-1"])]),
+        "beta": (members("b"), [_ticket("B-1", deps=["A-2"]), _ticket("B-2")]),
+    }
+
+
+def _run(processes):
+    org = OrganizationSimulator(_teams(), sprint_length_days=4, seed=1, processes=processes, epoch=date(2024, 1, 1))
+    return org, org.run()
+
+
+def test_cross_team_dependency_unblocks_day_after_closure():
+    org, metrics = _run(processes=1)
+
+    assert metrics["totals"]["completed_tickets"] == 4
+    assert metrics["cross_team_closures"] == 1
+    # A-1 day 1, A-2 day 2, B-1 waits for the day-2 closure message
+    assert metrics["teams"]["beta"]["blocks"] == 1
+    assert metrics["teams"]["beta"]["completed_tickets"] == 2
+
+
+def test_results_do_not_depend_on_process_count():
+    _, single = _run(processes=1)
+    _, sharded = _run(processes=2)
+
+    assert sharded == single
+
+
+def test_failing_worker_raises_its_error_and_stops_the_others():
+    teams = _teams()
+    members, backlog = teams["beta"]
+    teams["beta"] = (members, [_StuckTicket(**backlog[1].__dict__)])
+    org = OrganizationSimulator(teams, sprint_length_days=4, seed=1, processes=2, epoch=date(2024, 1, 1))
+
+    with pytest.raises(RuntimeError, match="B-2 refuses status") as failure:
+        org.run()
+    assert "__setattr__" in str(failure.value.__cause__)
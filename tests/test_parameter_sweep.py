@@ -0,0 +1,64 @@
+import pytest
+
+from generate_pre_sprint_analysis import build_team
+from monte_carlo import run_rng
+from parameter_sweep import build_scenario_team, expand_grid, run_sweep, summarize_sweep
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import TicketGenerator
+
+
+def _team():
+    return [
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"]),
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Email", "Slack", "VPN", "MFA"]),
+    ]
+
+
+def test_shared_prefixes_match_fresh_runs():
+    team = _team()
+    scenarios = expand_grid({
+        "escalation_threshold": [2, 5],
+        "sprint_length": [1, 4],
+        "members": [("junior", "senior", "junior")],
+        "skill_level.senior": [9],
+    })
+    rows = run_sweep(team, scenarios, replications=4, num_tickets=30, seed=3, processes=1)
+
+    assert [(r["scenario"], r["replication"]) for r in rows] == [(s, r) for s in range(4) for r in range(4)]
+    for row in rows:
+        scenario = scenarios[row["scenario"]]
+        sim = SprintSimulator(
+            build_scenario_team(team, scenario),
+            sprint_length_days=scenario["sprint_length"],
+            verbosity="off",
+            escalation_threshold=scenario["escalation_threshold"],
+        )
+        sim.sprint_backlog = TicketGenerator(rng=run_rng(3, row["replication"])).generate_realistic_tickets(30)
+        sim.run_complete_simulation()
+        assert row["members"] == "junior+senior+junior"
+        assert (row["completed_tickets"], row["velocity"], row["escalations"]) == (
+            sim.metrics["completed_tickets"], sim.metrics["velocity"], sim.metrics["escalations"],
+        )
+    assert sum(r["escalations"] for r in rows if r["escalation_threshold"] == 2) > 0
+    assert set(sim.metrics["utilization"]) == {"junior", "senior", "junior_2"}
+
+
+def test_common_random_numbers_and_worker_count():
+    team = build_team()
+    scenarios = [{}, {"availability.dev_engineer": 1.0}, {"availability.dev_engineer": 0.5}]
+    serial = run_sweep(team, scenarios, replications=6, num_tickets=20, sprint_length=2, processes=1)
+    parallel = run_sweep(team, scenarios, replications=6, num_tickets=20, sprint_length=2, processes=2)
+
+    assert serial == parallel
+    summary = summarize_sweep(serial)
+    # An unchanged scenario replays the baseline's backlogs exactly
+    assert summary[1]["velocity"]["diff"] == 0 and summary[1]["velocity"]["diff_se"] == 0
+    assert summary[2]["velocity"]["diff"] > 0
+
+
+def test_unknown_keys_are_rejected():
+    with pytest.raises(ValueError):
+        run_sweep(build_team(), [{"members": ["nobody"]}], replications=1, processes=1)
+    with pytest.raises(ValueError):
+        run_sweep(build_team(), [{"availability": 0.5}], replications=1, processes=1)
@@ -0,0 +1,54 @@
+import random
+from datetime import date
+
+from generate_pre_sprint_analysis import build_team
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import TicketGenerator
+
+
+def _run(**kwargs):
+    sim = SprintSimulator(build_team(), sprint_length_days=5, rng=random.Random(3), epoch=date(2024, 1, 1), **kwargs)
+    sim.sprint_backlog = TicketGenerator(rng=random.Random(4)).generate_realistic_tickets(40)
+    sim.run_complete_simulation()
+    return sim
+
+
+def test_profile_section_has_phases_counters_and_days():
+    seen = []
+    sim = _run(profile_hooks=[lambda day, record: seen.append((day, record["counters"]["assignments"]))])
+    profile = sim.metrics["profile"]
+
+    assert [d["day"] for d in profile["days"]] == [1, 2, 3, 4, 5]
+    assert set(profile["phases"]) == {"standup", "dependencies", "assignment", "work", "escalation", "cleanup"}
+    assert profile["total_seconds"] > 0
+    assert profile["counters"]["assignments"] == sum(n for _, n in seen) > 0
+    assert profile["counters"]["tickets_scanned"] >= profile["counters"]["assignments"]
+    assert [day for day, _ in seen] == [1, 2, 3, 4, 5]
+
+
+def test_profiling_does_not_change_results():
+    plain = _run().metrics
+    profiled = _run(profile=True).metrics
+    profiled.pop("profile")
+
+    assert "profile" not in plain
+    assert profiled == plain
+
+
+def test_vector_engine_records_assignment_and_escalation_counters():
+    metrics = {}
+    for engine in ("object", "vector"):
+        team = [
+            TeamMember(name="junior", role="Junior", skill_level=3, specialties=["Email", "VPN", "Slack"]),
+            TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email", "VPN", "Slack"]),
+        ]
+        sim = SprintSimulator(team, sprint_length_days=3, rng=random.Random(3), engine=engine, profile=True)
+        sim.sprint_backlog = TicketGenerator(rng=random.Random(4)).generate_realistic_tickets(40)
+        sim.run_complete_simulation()
+        metrics[engine] = sim.metrics
+
+    vector = metrics["vector"]["profile"]["counters"]
+    assert vector["assignments"] == metrics["object"]["profile"]["counters"]["assignments"] > 0
+    assert vector["escalations"] == metrics["object"]["profile"]["counters"]["escalations"]
+    assert vector["escalations"] == metrics["vector"]["escalations"] > 0
@@ -0,0 +1,83 @@
+import tracemalloc
+from datetime import date
+
+from generate_pre_sprint_analysis import build_team
+from events import EventKind, EventLog
+from release_simulator import ReleaseArchive, ReleaseSimulator, read_archive
+from team_members import TeamMember
+from ticket_system import Ticket
+
+
+def _team():
+    return [
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"], availability=0.5),
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Slack", "VPN"]),
+    ]
+
+
+def _release(tmp_path, **kwargs):
+    return ReleaseSimulator(
+        _team(), sprint_length_days=2, arrival_rate=30, initial_tickets=60, seed=4, engine="event",
+        archive=tmp_path / "release.bin", epoch=date(2024, 1, 1), **kwargs,
+    )
+
+
+def test_backlog_carries_over_and_archive_matches_rollup(tmp_path):
+    release = _release(tmp_path)
+    report = release.run(6)
+    release.close()
+
+    rows = report["per_sprint"]
+    assert rows[0]["arrivals"] == 60 and rows[0]["carried_in"] == 0
+    for before, after in zip(rows, rows[1:]):
+        assert after["carried_in"] == before["carried_over"] > 0
+        assert after["total_tickets"] == after["carried_in"] + after["arrivals"]
+    assert report["open_tickets"] == rows[-1]["carried_over"]
+    assert report["totals"]["completed_tickets"] == sum(r["completed_tickets"] for r in rows)
+    assert report["sprints_to_close"]["max"] > 1
+    assert all(not m.completed_tickets for m in release.team)
+
+    archived = list(read_archive(tmp_path / "release.bin"))
+    assert [a.sprint for a in archived] == list(range(1, 7))
+    assert [a.metrics for a in archived] == rows
+    ids = [t.ticket_id for a in archived for t in a.tickets]
+    assert len(ids) == len(set(ids)) == report["totals"]["completed_tickets"]
+    assert all(t.status == "Closed" and t.assigned_to for a in archived for t in a.tickets)
+    assert all(len(a.events) > 0 and a.events.lines()[0].startswith("Day 1") for a in archived)
+
+
+def test_memory_stays_flat_across_sprints(tmp_path):
+    # The object engine keeps up with arrivals, so the open backlog is stable
+    release = ReleaseSimulator(
+        build_team(), sprint_length_days=3, arrival_rate=40, seed=4, archive=tmp_path / "release.bin",
+        epoch=date(2024, 1, 1), verbosity="full",
+    )
+    tracemalloc.start()
+    try:
+        release.run(5)
+        early = tracemalloc.get_traced_memory()[0]
+        release.run(40)
+        late = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        release.close()
+
+    # Only the per-sprint metric rows accumulate; tickets and logs go to disk
+    assert late - early < 64 * 1024 + 40 * 4096
+    assert release.archive.segments == 45 and not release.backlog
+
+
+def test_archive_round_trips_empty_strings(tmp_path):
+    ticket = Ticket(
+        ticket_id="SNW-1", source="ServiceNow", priority="Low", category="Email", description="",
+        estimated_effort=1, status="Closed", assigned_to="",
+    )
+    events = EventLog()
+    events.emit(1, EventKind.COMPLETED, member="", ticket="SNW-1", effort=1, detail="")
+    with ReleaseArchive(tmp_path / "release.bin") as archive:
+        archive.write_sprint(1, [ticket], events, {"sprint": 1})
+
+    (archived,) = read_archive(tmp_path / "release.bin")
+    (restored,) = archived.tickets
+    assert (restored.ticket_id, restored.description, restored.assigned_to) == ("SNW-1", "", "")
+    assert list(archived.events.records()) == list(events.records())
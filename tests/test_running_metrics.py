@@ -0,0 +1,73 @@
+import random
+from datetime import date
+
+import pytest
+
+from generate_pre_sprint_analysis import build_team
+from running_metrics import QuantileSketch
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import Ticket, TicketGenerator
+
+
+def _sim(engine="object"):
+    sim = SprintSimulator(build_team(), sprint_length_days=5, rng=random.Random(5), engine=engine,
+                          epoch=date(2024, 1, 1))
+    sim.sprint_backlog = TicketGenerator(rng=random.Random(6)).generate_realistic_tickets(60)
+    return sim
+
+
+def test_quantile_sketch_stays_within_relative_accuracy():
+    rng = random.Random(0)
+    values = [rng.lognormvariate(1, 1) for _ in range(5000)]
+    sketch, other = QuantileSketch(), QuantileSketch()
+    for i, v in enumerate(values):
+        (sketch if i % 2 else other).add(v)
+    sketch.merge(other)
+
+    values.sort()
+    for q in (0.1, 0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+    assert sketch.count == 5000
+    assert QuantileSketch.from_state(sketch.state()).quantile(0.5) == sketch.quantile(0.5)
+
+
+@pytest.mark.parametrize("engine", ["object", "vector", "event"])
+def test_running_metrics_match_recount_and_track_days(engine):
+    sim = _sim(engine)
+    snapshots = []
+    for _ in range(5):
+        sim.continue_simulation(days=1)
+        snapshots.append(sim.metrics_snapshot())
+    metrics = sim.metrics
+
+    # Force the from-scratch path and compare
+    sim.running.completed = -1
+    recount = sim.generate_metrics_report()
+    for key in ("velocity", "completed_by_priority", "completed_by_category"):
+        assert metrics[key] == recount[key]
+
+    assert [s["day"] for s in snapshots] == [1, 2, 3, 4, 5]
+    assert snapshots[-1]["completed_tickets"] == metrics["completed_tickets"]
+    assert sum(metrics["throughput"]) == metrics["completed_tickets"] == metrics["cycle_time"]["count"]
+    burndown = metrics["burndown"]
+    assert [b["remaining_tickets"] for b in burndown] == [
+        60 - sum(metrics["throughput"][:d]) for d in range(1, 6)
+    ]
+    assert burndown[-1]["remaining_points"] == sum(t.estimated_effort for t in sim.sprint_backlog)
+
+
+@pytest.mark.parametrize("engine", ["object", "vector", "event"])
+def test_blocked_ticket_is_logged_once(engine):
+    team = [TeamMember(name="Ana", role="Developer", skill_level=8, specialties=["Email"])]
+    sim = SprintSimulator(team, sprint_length_days=5, rng=random.Random(1), engine=engine, epoch=date(2024, 1, 1))
+    sim.sprint_backlog = [
+        Ticket(ticket_id="A", source="Jira", priority="High", category="VPN", description="VPN down",
+               estimated_effort=2),
+        Ticket(ticket_id="B", source="Jira", priority="Low", category="Email", description="Mail rule",
+               estimated_effort=1, dependencies=["A"]),
+    ]
+    sim.run_complete_simulation()
+
+    assert sim.metrics["blocks"] == 1
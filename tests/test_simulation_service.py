@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+
+from simulation_service import ResultCache, SimulationService, canonicalize
+
+
+async def _request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), headers, json.loads(body)
+
+
+def _serve(test, **kwargs):
+    async def run():
+        service = await SimulationService(port=0, processes=1, **kwargs).start()
+        try:
+            await test(service)
+        finally:
+            await service.close()
+
+    asyncio.run(run())
+
+
+def test_identical_jobs_are_answered_from_the_cache():
+    async def test(service):
+        job = {"seed": 3, "generator": {"num_tickets": 12}, "sprint_length": 2}
+        status, headers, first = await _request(service.port, "POST", "/simulate", job)
+        assert status == 200 and headers["X-Cache"] == "miss"
+        assert first["metrics"]["total_tickets"] == 12
+
+        # Reordered keys and explicit defaults canonicalize to the same job
+        same = {"sprint_length": 2, "engine": "object", "generator": {"num_tickets": 12}, "seed": 3}
+        status, again, second = await _request(service.port, "POST", "/simulate", same)
+        assert status == 200 and again["X-Cache"] == "hit" and second == first
+        assert again["ETag"] == headers["ETag"]
+
+        key = headers["ETag"].strip('"')
+        assert (await _request(service.port, "GET", f"/results/{key}"))[2] == first
+        _, _, other = await _request(service.port, "POST", "/simulate", dict(job, seed=4))
+        assert other != first
+
+        status, _, triage = await _request(service.port, "POST", "/triage", {"generator": {"num_tickets": 6}})
+        assert status == 200 and triage["stats"] and triage["commitment"]
+        health = (await _request(service.port, "GET", "/health"))[2]
+        assert health["completed"] == 3 and health["cache"]["hits"] == 1
+
+    _serve(test)
+
+
+def test_invalid_jobs_and_backpressure():
+    async def test(service):
+        assert (await _request(service.port, "POST", "/simulate", {"team": [{"name": 1}]}))[0] == 400
+        assert (await _request(service.port, "POST", "/simulate", {"engine": "warp"}))[0] == 400
+        for bad in (
+            {"backlog": [1]},
+            {"team": ["dev"]},
+            {"generator": {"ticket_types": []}},
+            {"generator": {"ticket_types": {"operations": [{"description": "no category"}]}}},
+            {"generator": {"ticket_types": {"chores": [{"category": "x", "description": "y"}]}}},
+        ):
+            assert (await _request(service.port, "POST", "/simulate", bad))[0] == 400
+        assert (await _request(service.port, "GET", "/simulate"))[0] == 405
+        assert (await _request(service.port, "POST", "/nowhere", {}))[0] == 404
+
+        # One distinct job may be pending; a second one is refused, a duplicate shares it
+        job = {"runs": 2000, "num_tickets": 10, "sprint_length": 1}
+        first = asyncio.create_task(_request(service.port, "POST", "/forecast", job))
+        while not service.health()["pending"]:
+            await asyncio.sleep(0.001)
+        rest = await asyncio.gather(
+            _request(service.port, "POST", "/forecast", job),
+            _request(service.port, "POST", "/forecast", dict(job, seed=1)),
+        )
+        responses = [await first, *rest]
+        assert [r[0] for r in responses] == [200, 200, 503]
+        assert [r[1]["X-Cache"] for r in responses[:2]] == ["miss", "shared"]
+        assert responses[2][1]["Retry-After"] == "1"
+
+    _serve(test, max_pending=1)
+
+
+def test_generator_templates_are_canonicalized():
+    templates = {"operations": [{"category": "Printers", "description": "Queue stuck", "owner": "ops"}]}
+
+    params = canonicalize("simulate", {"generator": {"num_tickets": 5, "ticket_types": templates}})
+
+    assert params["generator"]["ticket_types"] == {"operations": [{"category": "Printers", "description": "Queue stuck"}]}
+    with pytest.raises(ValueError):
+        canonicalize("triage", {"generator": {"ticket_types": {"operations": [{"category": 1, "description": "x"}]}}})
+
+
+def test_cache_evicts_least_recently_used_and_service_stays_local():
+    cache = ResultCache(max_entries=2, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"90")
+    assert cache.peek("b") is None and len(cache) == 2 and cache.evictions == 1
+    cache.put("d", b"123456")
+    assert cache.peek("a") is None and cache.nbytes == 8
+
+    with pytest.raises(ValueError):
+        SimulationService(host="0.0.0.0")
+    SimulationService(host="::1")
@@ -1,5 +1,8 @@
 import random
 from collections import Counter
+from datetime import date, datetime
+
+import pytest
 
 from ticket_system import TicketGenerator
 
@@ -30,3 +33,42 @@ def test_priority_distribution():
         proportion = counts[level] / 1000
         assert abs(proportion - weight) < 0.05
 
+
+def test_bulk_generation_distribution_and_determinism():
+    gen = TicketGenerator()
+    store = gen.generate_bulk(5000, seed=7)
+    again = gen.generate_bulk(5000, seed=7)
+
+    assert [t.ticket_id for t in store] == [t.ticket_id for t in again]
+    assert [t.estimated_effort for t in store] == [t.estimated_effort for t in again]
+    assert len(set(t.ticket_id for t in store)) == 5000
+
+    counts = Counter(t.priority for t in store)
+    for level, weight in zip(TicketGenerator.PRIORITY_LEVELS, TicketGenerator.PRIORITY_WEIGHTS):
+        assert abs(counts[level] / 5000 - weight) < 0.03
+    ids = {t.ticket_id for t in store}
+    assert all(dep in ids and dep != t.ticket_id for t in store for dep in t.dependencies)
+
+    dated = gen.generate_bulk(100, seed=7, epoch=date(2024, 1, 1))
+    midnight = gen.generate_bulk(100, seed=7, epoch=datetime(2024, 1, 1))
+    assert [t.created_timestamp for t in dated] == [t.created_timestamp for t in midnight]
+    assert all(datetime(2024, 1, 1) <= t.created_timestamp <= datetime(2024, 1, 1, 2) for t in dated)
+
+
+def test_streamed_chunks_match_bulk_output():
+    gen = TicketGenerator()
+    bulk = gen.generate_bulk(20000, seed=3)
+    chunks = list(gen.iter_ticket_chunks(20000, chunk_size=3000, seed=3))
+
+    assert [len(c) for c in chunks] == [3000] * 6 + [2000]
+    streamed = [t for chunk in chunks for t in chunk]
+    key = lambda t: (t.ticket_id, t.priority, t.category, t.estimated_effort, t.dependencies)
+    assert [key(t) for t in streamed] == [key(t) for t in bulk]
+
+
+def test_caller_supplied_templates_are_validated():
+    with pytest.raises(ValueError):
+        TicketGenerator().generate_realistic_tickets(5, {"operations": [{"category": 5, "description": None}]})
+
+    custom = {"operations": [{"category": "Printers", "description": "Printer queue stuck"}]}
+    assert {t.category for t in TicketGenerator().generate_realistic_tickets(10, custom)} >= {"Printers"}
@@ -0,0 +1,90 @@
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+from ticket_importer import TicketImporter, import_tickets
+
+
+JIRA_CSV = """Issue key,Summary,Priority,Status,Assignee,Created,Resolved,Component/s,Component/s,\
+Custom field (Story Points),Inward issue link (Blocks),Inward issue link (Blocks)
+OPS-1,"VPN cert renewal
+for the office",Highest,To Do,,02/Jan/24 9:15 AM,,VPN,,3.0,,
+OPS-2,Mail rule,Low,Done,Ana,03/Jan/24 10:00 AM,04/Jan/24 1:00 PM,,Email,1,OPS-1,OPS-9
+OPS-3,Slack bot,Medium,In Progress,Ben,2024-01-05T09:00:00.000+0100,,Slack,,,"OPS-2, OPS-1",
+"""
+
+SERVICENOW = {
+    "meta": {"count": 3, "fields": ["number", "state"]},
+    "records": [
+        {"number": "INC001", "priority": "1 - Critical", "category": "Network",
+         "short_description": "Core switch down", "state": "New",
+         "assigned_to": {"display_value": "Ana", "value": "6816f79c"}, "opened_at": "2024-01-02 09:15:00",
+         "u_story_points": "5"},
+        {"number": "INC002", "priority": {"display_value": "3 - Moderate", "value": "3"}, "category": "",
+         "short_description": "Printer offline", "state": "Closed", "closed_at": "2024-01-03 11:00:00",
+         "u_depends_on": "INC001,INC404"},
+        {"number": "INC003", "priority": "4 - Low", "category": "Email", "short_description": "Alias",
+         "state": "In Progress", "u_depends_on": "INC002"},
+    ],
+}
+
+
+def test_jira_csv_maps_fields_and_links(tmp_path):
+    path = tmp_path / "jira.csv"
+    path.write_text(JIRA_CSV)
+    importer = TicketImporter(path, chunk_size=2)
+    store = importer.load()
+
+    first, done, active = store
+    assert (first.priority, first.status, first.category, first.estimated_effort) == ("Critical", "Open", "VPN", 3)
+    assert first.description == "VPN cert renewal\nfor the office"
+    assert first.created_timestamp == datetime(2024, 1, 2, 9, 15)
+    assert (done.status, done.assigned_to, done.category, done.dependencies) == ("Closed", "Ana", "Email",
+                                                                                 ("OPS-1", "OPS-9"))
+    assert active.created_timestamp == datetime(2024, 1, 5, 8, 0)
+    assert active.dependencies == ("OPS-2", "OPS-1")
+    assert importer.rows == 3 and importer.unresolved == {"OPS-9"}
+    assert [len(chunk) for chunk in TicketImporter(path, chunk_size=2).iter_chunks()] == [2, 1]
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1 << 20])
+def test_servicenow_json_streams_across_read_blocks(tmp_path, block_size):
+    path = tmp_path / "incidents.json.gz"
+    with gzip.open(path, "wt") as f:
+        json.dump(SERVICENOW, f)
+    importer = TicketImporter(path, block_size=block_size, chunk_size=2)
+    tickets = importer.load(as_store=False)
+
+    assert [(t.ticket_id, t.source, t.priority, t.status, t.category) for t in tickets] == [
+        ("INC001", "ServiceNow", "Critical", "Open", "Network"),
+        ("INC002", "ServiceNow", "Medium", "Closed", "Uncategorized"),
+        ("INC003", "ServiceNow", "Low", "Open", "Email"),
+    ]
+    assert tickets[0].assigned_to == "Ana" and tickets[0].estimated_effort == 5
+    assert tickets[1].dependencies == ["INC001", "INC404"]
+    assert importer.unresolved == {"INC404"}
+
+
+def test_invalid_rows_raise_or_are_skipped(tmp_path):
+    issues = [
+        {"key": "P-1", "fields": {"summary": "ok", "priority": {"name": "High"}, "status": {"name": "Done"},
+                                  "issuetype": {"name": "Task"}, "customfield_10016": 2.0}},
+        {"key": "P-2", "fields": {"summary": "bad priority", "priority": {"name": "Someday"},
+                                  "issuelinks": [{"type": {"name": "Blocks"}, "inwardIssue": {"key": "P-1"}}]}},
+        {"key": "P-3", "fields": {"summary": "half point", "customfield_10016": 2.5}},
+        {"key": "P-1", "fields": {"summary": "duplicate"}},
+    ]
+    path = tmp_path / "issues.jsonl"
+    path.write_text("".join(json.dumps(issue) + "\n" for issue in issues))
+
+    with pytest.raises(ValueError, match="3 invalid rows"):
+        import_tickets(path)
+
+    importer = TicketImporter(path, errors="skip")
+    store = importer.load()
+    assert [t.ticket_id for t in store] == ["P-1"]
+    assert store[0].category == "Task" and store[0].estimated_effort == 2
+    assert [row for row, _ in importer.errors] == [2, 3, 4]
+    assert "priority" in importer.errors[0][1] and "duplicate" in importer.errors[2][1]
@@ -0,0 +1,54 @@
+from sprint_planning import simulate_triage_meeting
+from team_members import TeamMember
+from ticket_scheduler import schedule_tickets
+from ticket_system import Ticket
+
+
+def _ticket(tid, priority="Medium", deps=()):
+    return Ticket(
+        ticket_id=tid, source="Jira", priority=priority, category="Email",
+        description=tid, estimated_effort=1, dependencies=list(deps),
+    )
+
+
+def test_deep_chain_is_ordered_without_recursion():
+    chain = [_ticket("T0")] + [_ticket(f"T{i}", deps=[f"T{i - 1}"]) for i in range(1, 20000)]
+
+    schedule = schedule_tickets(list(reversed(chain)))
+
+    assert [t.ticket_id for t in schedule.order] == [t.ticket_id for t in chain]
+    assert schedule.levels["T19999"] == 19999
+    assert schedule.cycles == []
+
+
+def test_priority_is_inherited_and_levels_follow_dependencies():
+    tickets = [
+        _ticket("LOW-1", "Low"),
+        _ticket("HIGH-1", "High"),
+        _ticket("CRIT-1", "Critical", deps=["LOW-1"]),
+        _ticket("MED-1", "Medium", deps=["CRIT-1", "MISSING"]),
+    ]
+
+    schedule = schedule_tickets(tickets)
+
+    assert [t.ticket_id for t in schedule.order] == ["LOW-1", "CRIT-1", "HIGH-1", "MED-1"]
+    assert schedule.levels == {"LOW-1": 0, "HIGH-1": 0, "CRIT-1": 1, "MED-1": 2}
+
+
+def test_cycles_are_reported_and_still_scheduled():
+    tickets = [
+        _ticket("A", deps=["B"]),
+        _ticket("B", deps=["C"]),
+        _ticket("C", deps=["A"]),
+        _ticket("D", deps=["D"]),
+        _ticket("E", deps=["A"]),
+    ]
+
+    schedule = schedule_tickets(tickets)
+
+    assert schedule.cycles == [["A", "B", "C"], ["D"]]
+    assert len(schedule.order) == 5 and schedule.order[-1].ticket_id == "E"
+
+    team = [TeamMember(name="dev", role="Developer", skill_level=8, specialties=["Email"])]
+    notes, _ = simulate_triage_meeting(tickets, team)
+    assert "A <-> B <-> C" in notes
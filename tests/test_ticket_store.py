@@ -0,0 +1,53 @@
+import random
+
+from sprint_planning import simulate_triage_meeting
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_store import TicketStore
+from ticket_system import Ticket, TicketGenerator
+
+
+def _team():
+    return [TeamMember(name="dev", role="Developer", skill_level=8, specialties=["Email"])]
+
+
+def test_round_trip_preserves_tickets():
+    random.seed(3)
+    tickets = TicketGenerator().generate_realistic_tickets(50)
+    tickets[0].dependencies.append("EXTERNAL-1")
+    store = TicketStore.from_tickets(tickets)
+
+    assert len(store) == 50
+    assert store.to_tickets() == tickets
+    assert store.get(tickets[0].ticket_id).dependencies == tuple(tickets[0].dependencies)
+
+
+def test_generator_store_matches_pydantic_output():
+    tickets = TicketGenerator(rng=random.Random(5)).generate_realistic_tickets(200)
+    store = TicketGenerator(rng=random.Random(5)).generate_ticket_store(200)
+
+    pairs = zip(store, tickets)
+    assert all(
+        (v.ticket_id, v.priority, v.category, v.estimated_effort, v.dependencies)
+        == (t.ticket_id, t.priority, t.category, t.estimated_effort, tuple(t.dependencies))
+        for v, t in pairs
+    )
+    assert store.nbytes() < 200 * 64
+
+
+def test_views_drive_planning_and_simulation():
+    store = TicketStore()
+    store.append("SNW-1", "ServiceNow", "Critical", "Email", "A", estimated_effort=3)
+    store.append("SNW-2", "ServiceNow", "Low", "Email", "B", estimated_effort=2, dependencies=["SNW-1"])
+
+    notes, commit = simulate_triage_meeting(store.views(), _team())
+    assert "SNW-1->" not in notes and "SNW-2->SNW-1" in notes
+
+    sim = SprintSimulator(_team(), sprint_length_days=2)
+    sim.sprint_backlog = store.views()
+    sim.run_complete_simulation()
+
+    assert [v.status for v in store] == ["Closed", "Closed"]
+    assert store.get("SNW-2").assigned_to == "dev"
+    assert isinstance(store[1].to_ticket(), Ticket)
+    assert sim.metrics["completed_tickets"] == 2
@@ -25,3 +25,39 @@ def test_after_hours_entry_present_for_critical():
 
     times = [datetime.strptime(line.split(" | ", 1)[0], "%Y-%m-%d %H:%M:%S") for line in logs]
     assert any(t.time() > datetime.strptime("18:00:00", "%H:%M:%S").time() for t in times)
+
+
+def test_clock_is_deterministic_and_batch_matches_ticks():
+    import random
+    from datetime import date
+
+    from log_utils import WorkdayClock, format_timestamp
+
+    epoch = date(2024, 3, 4)
+    ticks = WorkdayClock(2, after_hours=True, rng=random.Random(9), epoch=epoch)
+    sequential = [ticks.tick() for _ in range(25)]
+    batch = WorkdayClock(2, after_hours=True, rng=random.Random(9), epoch=epoch).batch(25)
+
+    assert batch == sequential
+    assert format_timestamp(batch[0]) == "2024-03-05 08:00:00"
+    rendered = [format_timestamp(ts)[11:] for ts in batch]
+    assert all(not ("12:00:00" <= t < "13:00:00") for t in rendered)
+    assert max(rendered) <= "22:00:00"
+
+
+def test_simulator_timeline_reproducible_with_fixed_epoch():
+    import random
+    from datetime import date
+
+    from sprint_simulator import SprintSimulator
+
+    def run():
+        team = [TeamMember(name="dev", role="Developer", skill_level=8, specialties=["Email"])]
+        ticket = Ticket(ticket_id="SNW-1", source="ServiceNow", priority="Critical", category="Email", description="Issue", estimated_effort=2)
+        sim = SprintSimulator(team, sprint_length_days=1, rng=random.Random(4), epoch=date(2024, 1, 1))
+        sim.sprint_backlog = [ticket]
+        return list(sim.run_complete_simulation())
+
+    logs = run()
+    assert logs == run()
+    assert logs[1].startswith("2024-01-01 08:00:00 | dev | Planning")
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from sprint_simulator import SprintSimulator
+from team_members import TeamMember
+from ticket_system import Ticket, TicketGenerator
+
+
+def _team():
+    return [
+        TeamMember(name="junior", role="Junior", skill_level=3, specialties=["Email", "VPN", "Slack"]),
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"], availability=0.5),
+        TeamMember(name="pm", role="Project Manager", skill_level=7, specialties=["Email"]),
+    ]
+
+
+def _run(engine, seed):
+    rng = random.Random(seed)
+    tickets = TicketGenerator(rng=rng).generate_realistic_tickets(150)
+    team = _team()
+    sim = SprintSimulator(team, sprint_length_days=3, rng=rng, engine=engine)
+    sim.sprint_backlog = tickets
+    sim.run_complete_simulation()
+    return sim, tickets, team
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vector_engine_matches_object_engine(seed):
+    obj_sim, obj_tickets, obj_team = _run("object", seed)
+    vec_sim, vec_tickets, vec_team = _run("vector", seed)
+
+    assert vec_sim.generate_metrics_report() == obj_sim.generate_metrics_report()
+    assert [(t.status, t.actual_effort, t.assigned_to) for t in vec_tickets] == [
+        (t.status, t.actual_effort, t.assigned_to) for t in obj_tickets
+    ]
+    assert [m.completed_tickets for m in vec_team] == [m.completed_tickets for m in obj_team]
+
+
+def test_vector_engine_blocks_and_escalates():
+    team = [
+        TeamMember(name="junior", role="Junior", skill_level=4, specialties=["Email"]),
+        TeamMember(name="senior", role="Senior", skill_level=8, specialties=["Email"]),
+    ]
+    t1 = Ticket(ticket_id="SNW-1", source="ServiceNow", priority="High", category="Email", description="Hard", estimated_effort=6)
+    t2 = Ticket(ticket_id="SNW-2", source="ServiceNow", priority="Low", category="Email", description="Next", estimated_effort=1, dependencies=["SNW-1"])
+
+    sim = SprintSimulator(team, sprint_length_days=2, engine="vector")
+    sim.sprint_backlog = [t1, t2]
+    sim.run_complete_simulation()
+
+    assert t1.assigned_to == "senior"
+    assert t2.status == "Closed"
+    assert sim.metrics["escalations"] == 1
+    assert any("blocked" in log for log in sim.daily_logs)
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        SprintSimulator([], engine="gpu")
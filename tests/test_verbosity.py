@@ -0,0 +1,48 @@
+import random
+from datetime import date
+
+import pytest
+
+from events import EventKind
+from generate_pre_sprint_analysis import build_team
+from sprint_simulator import SprintSimulator
+from ticket_system import TicketGenerator
+
+
+def _run(engine, verbosity):
+    rng = random.Random(8)
+    sim = SprintSimulator(build_team(), sprint_length_days=5, rng=rng, engine=engine, epoch=date(2024, 1, 1),
+                          verbosity=verbosity)
+    sim.sprint_backlog = TicketGenerator(rng=random.Random(9)).generate_realistic_tickets(60)
+    sim.run_complete_simulation()
+    return sim, rng.getstate()
+
+
+@pytest.mark.parametrize("engine", ["object", "vector", "event"])
+def test_metrics_do_not_depend_on_verbosity(engine):
+    full, _ = _run(engine, "full")
+    summary, _ = _run(engine, "summary")
+    off, _ = _run(engine, "off")
+
+    assert summary.metrics == full.metrics
+    assert off.metrics == full.metrics
+    assert len(off.events) == 0 and list(off.daily_logs) == []
+
+
+def test_quiet_levels_draw_no_timestamps():
+    untouched = random.Random(8).getstate()
+    full, full_state = _run("object", "full")
+    summary, summary_state = _run("object", "summary")
+    _, off_state = _run("object", "off")
+
+    assert full_state != untouched
+    assert summary_state == off_state == untouched
+    kinds = {record.kind for record in summary.events.records()}
+    assert EventKind.STANDUP not in kinds and EventKind.STARTED not in kinds
+    assert all(record.timestamp is None for record in summary.events.records())
+    assert summary.events.count(EventKind.COMPLETED) == full.events.count(EventKind.COMPLETED)
+
+
+def test_off_rejects_a_sink():
+    with pytest.raises(ValueError):
+        SprintSimulator(build_team(), verbosity="off", sink=object())
@@ -0,0 +1,580 @@
+"""
+Streaming import of ServiceNow and Jira export files.
+
+``TicketImporter`` reads CSV, JSON or JSON Lines exports of any size in
+chunks of ``chunk_size`` records. Each record's columns are mapped onto the
+``Ticket`` fields (see ``FIELD_MAPS``), priorities and states are normalized,
+and the whole chunk is then validated in a single pydantic call against
+``TicketRecord``. Validated records are appended to a ``TicketStore`` or
+built as ``Ticket`` objects without validating them again.
+
+A background thread reads the file in blocks into a small bounded queue, so
+disk reads overlap with parsing and memory stays proportional to the chunk
+size. JSON documents are scanned element by element (a top-level array, or
+the ``records``/``result``/``issues`` array of a wrapper object) and never
+loaded whole. Gzipped files (``.gz``) are decompressed on the fly.
+
+Dependencies are read from "blocked by" links: Jira's inward ``Blocks``
+links and ServiceNow's ``u_depends_on`` column (comma-separated numbers).
+Keys that never appear in the file are reported in ``unresolved``; the
+simulator treats them as already done unless they are registered with
+``SprintSimulator.block_on_external``.
+
+Everything runs offline against local files::
+
+    store = import_tickets("jira_export.csv")
+    sim.sprint_backlog = store.views()
+"""
+
+import csv
+import gzip
+import io
+import itertools
+import json
+import queue
+import re
+import threading
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
+
+from pydantic import ValidationError
+from typing_extensions import TypedDict
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:  # pydantic 1.x
+    from pydantic import parse_obj_as
+
+    TypeAdapter = None
+
+
+SOURCES = {"servicenow": "ServiceNow", "jira": "Jira"}
+FORMATS = ("csv", "json", "jsonl")
+
+# Ticket field -> candidate export columns, first non-empty one wins
+FIELD_MAPS = {
+    "servicenow": {
+        "ticket_id": ("number",),
+        "priority": ("priority",),
+        "category": ("category", "subcategory", "assignment_group"),
+        "description": ("short_description", "description"),
+        "status": ("state", "incident_state"),
+        "assigned_to": ("assigned_to",),
+        "created_timestamp": ("opened_at", "sys_created_on"),
+        "completed_timestamp": ("closed_at", "resolved_at"),
+        "estimated_effort": ("u_story_points", "story_points", "u_estimated_effort"),
+        "dependencies": ("u_depends_on", "depends_on"),
+    },
+    "jira": {
+        "ticket_id": ("Issue key", "key"),
+        "priority": ("Priority",),
+        "category": ("Component/s", "Issue Type"),
+        "description": ("Summary",),
+        "status": ("Status",),
+        "assigned_to": ("Assignee",),
+        "created_timestamp": ("Created",),
+        "completed_timestamp": ("Resolved",),
+        "estimated_effort": ("Custom field (Story Points)", "Custom field (Story point estimate)", "Story Points"),
+        "dependencies": ("Inward issue link (Blocks)",),
+    },
+}
+
+PRIORITIES = {
+    "1": "Critical", "critical": "Critical", "highest": "Critical", "blocker": "Critical",
+    "2": "High", "high": "High", "major": "High",
+    "3": "Medium", "medium": "Medium", "moderate": "Medium",
+    "4": "Low", "low": "Low", "5": "Low", "planning": "Low", "lowest": "Low", "minor": "Low", "trivial": "Low",
+}
+CLOSED_STATES = frozenset(("closed", "resolved", "done", "canceled", "cancelled", "complete", "completed"))
+TIME_FORMATS = ("%d/%b/%y %I:%M %p", "%d/%b/%Y %I:%M %p", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M")
+# Jira Cloud and Server ids of the story points field in JSON exports
+JIRA_STORY_POINTS = ("customfield_10016", "customfield_10026", "customfield_10002")
+UNCATEGORIZED = "Uncategorized"
+
+_KEY_SPLIT = re.compile(r"[\s,;]+")
+_WRAPPERS = ("records", "result", "issues")
+
+
+class TicketRecord(TypedDict):
+    """Shape of one imported ticket, validated a chunk at a time."""
+
+    ticket_id: str
+    source: str
+    priority: Literal["Critical", "High", "Medium", "Low"]
+    category: str
+    description: str
+    estimated_effort: Optional[int]
+    status: Literal["Open", "Closed"]
+    assigned_to: Optional[str]
+    created_timestamp: Optional[datetime]
+    completed_timestamp: Optional[datetime]
+    dependencies: List[str]
+
+
+if TypeAdapter is not None:
+    _validate_chunk = TypeAdapter(List[TicketRecord]).validate_python
+else:
+    def _validate_chunk(records):
+        return parse_obj_as(List[TicketRecord], records)
+RECORD_FIELDS = tuple(TicketRecord.__annotations__)
+
+
+class _Prefetch(io.RawIOBase):
+    """Raw stream fed by a thread that reads the file ahead in blocks."""
+
+    def __init__(self, path, block_size, depth):
+        self._blocks = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._pending = b""
+        self._done = False
+        self._thread = threading.Thread(target=self._read, args=(path, block_size), daemon=True)
+        self._thread.start()
+
+    def _read(self, path, block_size):
+        opener = gzip.open if str(path).endswith(".gz") else open
+        try:
+            with opener(path, "rb") as f:
+                while not self._stop.is_set():
+                    block = f.read(block_size)
+                    self._put(block)
+                    if not block:
+                        return
+        except Exception as exc:  # Re-raised in the parsing thread
+            self._put(exc)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self._pending and not self._done:
+            block = self._blocks.get()
+            if isinstance(block, Exception):
+                raise block
+            self._pending = block
+            self._done = not block
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self):
+        self._stop.set()
+        super().close()
+
+
+def _text(path, block_size, depth):
+    return io.TextIOWrapper(
+        io.BufferedReader(_Prefetch(path, block_size, depth), block_size), encoding="utf-8-sig", newline=""
+    )
+
+
+def _scalar(value):
+    """Reduce a JSON export value (display dict, list, number) to text."""
+    if isinstance(value, dict):
+        value = value.get("display_value", value.get("name", value.get("value")))
+    elif isinstance(value, list):
+        value = next((v for v in map(_scalar, value) if v), None)
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _keys(value):
+    if isinstance(value, list):
+        return [key for item in value for key in _keys(item)]
+    return [key for key in _KEY_SPLIT.split(_scalar(value)) if key]
+
+
+def _timestamp(value):
+    """Parse export timestamps to naive UTC; unknown formats are left to validation."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        for fmt in TIME_FORMATS:
+            try:
+                parsed = datetime.strptime(value, fmt)
+                break
+            except ValueError:
+                pass
+        else:
+            return value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _each(func, values):
+    """Apply ``func`` once per distinct value of a column."""
+    mapped = {value: func(value) for value in set(values)}
+    return [mapped[value] for value in values]
+
+
+def _dependencies(links, ticket_id):
+    keys = dict.fromkeys(key for key in _KEY_SPLIT.split(links) if key)
+    keys.pop(ticket_id, None)
+    return list(keys)
+
+
+def _effort(value):
+    if not value:
+        return None
+    try:
+        points = float(value)
+    except ValueError:
+        return value
+    # Fractional points are left as text for validation to reject
+    return int(points) if points.is_integer() else value
+
+
+def _priority(value):
+    # ServiceNow priorities look like "2 - High"
+    head = value.split(" - ", 1)[0].strip().lower()
+    return PRIORITIES.get(head, PRIORITIES.get(value.strip().lower(), value))
+
+
+def _jira_issue(issue):
+    """Flatten a Jira REST issue into the column names of a Jira CSV export."""
+    fields = issue.get("fields", {})
+    points = next((fields[f] for f in JIRA_STORY_POINTS if fields.get(f) is not None), None)
+    blocked_by = [
+        link["inwardIssue"]["key"]
+        for link in fields.get("issuelinks") or ()
+        if link.get("type", {}).get("name") == "Blocks" and "inwardIssue" in link
+    ]
+    return {
+        "Issue key": issue.get("key"),
+        "Summary": fields.get("summary"),
+        "Priority": fields.get("priority"),
+        "Status": fields.get("status"),
+        "Assignee": (fields.get("assignee") or {}).get("displayName"),
+        "Created": fields.get("created"),
+        "Resolved": fields.get("resolutiondate"),
+        "Component/s": fields.get("components"),
+        "Issue Type": fields.get("issuetype"),
+        "Custom field (Story Points)": points,
+        "Inward issue link (Blocks)": blocked_by,
+    }
+
+
+def _iter_json_array(text, block_size):
+    """
+    Yield the elements of a top-level JSON array, or of the first
+    ``records``/``result``/``issues`` array of a top-level object, decoding
+    one element at a time.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill():
+        nonlocal buf, pos, eof
+        more = text.read(block_size)
+        eof = not more
+        buf, pos = buf[pos:] + more, 0
+
+    def skip(chars=" \t\r\n"):
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos] if pos < len(buf) else ""
+            fill()
+
+    def value():
+        # Only accept a decode that is followed by more input, so a number
+        # split across blocks is never cut short.
+        nonlocal pos
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+                if end < len(buf) or eof:
+                    pos = end
+                    return item
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+
+    def elements():
+        nonlocal pos
+        pos += 1  # [
+        if skip() == "]":
+            return
+        while True:
+            skip()
+            yield value()
+            char = skip()
+            pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Malformed JSON array near {buf[pos - 1:pos + 20]!r}")
+
+    char = skip()
+    if char == "[":
+        yield from elements()
+        return
+    if char != "{":
+        raise ValueError("Expected a JSON array or object")
+    pos += 1
+    while skip(" \t\r\n,") not in ("}", ""):
+        key = value()
+        if skip() != ":":
+            raise ValueError(f"Malformed JSON object near {buf[pos:pos + 20]!r}")
+        pos += 1
+        if key in _WRAPPERS and skip() == "[":
+            yield from elements()
+            return
+        skip()
+        value()
+
+
+class TicketImporter:
+    """Chunked reader of one ServiceNow or Jira export file."""
+
+    def __init__(
+        self,
+        path,
+        source=None,
+        fmt=None,
+        chunk_size=10000,
+        field_map=None,
+        errors="raise",
+        block_size=1 << 20,
+        prefetch=4,
+    ):
+        """
+        :param path: Export file (``.csv``, ``.json``, ``.jsonl``/``.ndjson``,
+            optionally ``.gz``).
+        :param source: ``"servicenow"`` or ``"jira"``; detected from the
+            columns or record shape when omitted.
+        :param fmt: ``"csv"``, ``"json"`` or ``"jsonl"``; taken from the file
+            extension when omitted.
+        :param chunk_size: Records mapped and validated per batch.
+        :param field_map: Overrides of ``FIELD_MAPS[source]``, mapping a
+            Ticket field to one column name or a tuple of candidates.
+        :param errors: ``"raise"`` stops at the first invalid chunk with a
+            ValueError listing its bad rows; ``"skip"`` drops invalid rows and
+            records ``(row, message)`` pairs in ``errors``.
+        :param block_size: Bytes per read of the background reader.
+        :param prefetch: Blocks the reader may run ahead of the parser.
+        """
+        if source is not None and source not in SOURCES:
+            raise ValueError(f"Unknown source {source!r}; expected one of {tuple(SOURCES)}")
+        if errors not in ("raise", "skip"):
+            raise ValueError("errors must be 'raise' or 'skip'")
+        self.path = path
+        self.source = source
+        self.fmt = fmt or self._format_of(str(path))
+        if self.fmt not in FORMATS:
+            raise ValueError(f"Unknown format {self.fmt!r}; expected one of {FORMATS}")
+        self.chunk_size = chunk_size
+        self.field_map = field_map or {}
+        self.on_error = errors
+        self.block_size = block_size
+        self.prefetch = prefetch
+        self.rows = 0
+        self.errors = []
+        self._seen = set()
+        self._referenced = set()
+
+    @staticmethod
+    def _format_of(path):
+        name = path[:-3] if path.endswith(".gz") else path
+        ext = name.rsplit(".", 1)[-1].lower()
+        return "jsonl" if ext == "ndjson" else ext
+
+    @property
+    def unresolved(self):
+        """Dependency keys referenced by imported tickets but not in the file."""
+        return self._referenced - self._seen
+
+    def _columns(self, source):
+        columns = dict(FIELD_MAPS[source])
+        for field, names in self.field_map.items():
+            columns[field] = (names,) if isinstance(names, str) else tuple(names)
+        return columns
+
+    def _rows(self, text):
+        """
+        Return ``(source, plan, rows)``: rows are lists of strings and
+        ``plan`` maps each Ticket field to the row positions to read, in
+        order of preference.
+        """
+        if self.fmt == "csv":
+            reader = csv.reader(text)
+            header = [name.strip() for name in next(reader, [])]
+            source = self.source or ("jira" if "Issue key" in header else "servicenow")
+            positions = {}
+            for i, name in enumerate(header):
+                positions.setdefault(name, []).append(i)
+            plan = {
+                field: [i for name in names for i in positions.get(name, ())]
+                for field, names in self._columns(source).items()
+            }
+            width = len(header)
+
+            def rows():
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+                    yield row
+
+            return source, plan, rows()
+
+        if self.fmt == "jsonl":
+            items = (json.loads(line) for line in text if line.strip())
+        else:
+            items = _iter_json_array(text, self.block_size)
+        first = next(items, None)
+        if first is None:
+            return self.source or "servicenow", {}, iter(())
+        source = self.source or ("jira" if "fields" in first else "servicenow")
+        columns = self._columns(source)
+        names = list(dict.fromkeys(name for candidates in columns.values() for name in candidates))
+        plan = {field: [names.index(name) for name in candidates] for field, candidates in columns.items()}
+        dependency_names = set(columns["dependencies"])
+
+        def rows():
+            for item in itertools.chain((first,), items):
+                if "fields" in item:
+                    item = _jira_issue(item)
+                yield [
+                    " ".join(_keys(item.get(name))) if name in dependency_names else _scalar(item.get(name))
+                    for name in names
+                ]
+
+        return source, plan, rows()
+
+    def _map(self, source, plan, rows):
+        """Map a chunk of rows onto Ticket fields, one column at a time."""
+
+        def column(field):
+            positions = plan.get(field) or ()
+            if not positions:
+                return [""] * len(rows)
+            values = [row[positions[0]] for row in rows]
+            for i in positions[1:]:
+                values = [value or row[i] for value, row in zip(values, rows)]
+            return values
+
+        ids = [value.strip() for value in column("ticket_id")]
+        positions = plan.get("dependencies") or ()
+        links = [" ".join(row[i] for i in positions) for row in rows] if len(positions) > 1 else column("dependencies")
+        dependencies = [_dependencies(value, ticket_id) if value else [] for value, ticket_id in zip(links, ids)]
+        for keys in dependencies:
+            if keys:
+                self._referenced.update(keys)
+
+        fields = zip(
+            ids,
+            itertools.repeat(SOURCES[source]),
+            _each(lambda v: _priority(v or "Medium"), column("priority")),
+            _each(lambda v: v.strip() or UNCATEGORIZED, column("category")),
+            _each(str.strip, column("description")),
+            _each(_effort, column("estimated_effort")),
+            _each(lambda v: "Closed" if v.strip().lower() in CLOSED_STATES else "Open", column("status")),
+            _each(lambda v: v.strip() or None, column("assigned_to")),
+            _each(_timestamp, column("created_timestamp")),
+            _each(_timestamp, column("completed_timestamp")),
+            dependencies,
+        )
+        return [dict(zip(RECORD_FIELDS, values)) for values in fields]
+
+    def _validate(self, records, first_row):
+        """Validate one chunk in a single call; return the valid records."""
+        bad = {}
+        ids = set()
+        for i, record in enumerate(records):
+            ticket_id = record["ticket_id"]
+            if not ticket_id:
+                bad[i] = "ticket_id: missing"
+            elif ticket_id in self._seen or ticket_id in ids:
+                bad[i] = f"ticket_id: duplicate {ticket_id!r}"
+            ids.add(ticket_id)
+        kept = [i for i in range(len(records)) if i not in bad]
+        try:
+            valid = _validate_chunk([records[i] for i in kept])
+        except ValidationError as exc:
+            for error in exc.errors():
+                index, *field = [part for part in error["loc"] if part != "__root__"]
+                bad.setdefault(kept[index], f"{'.'.join(map(str, field))}: {error['msg']}")
+            valid = []
+            if self.on_error == "skip":
+                # Everything left passed the first call; validate it again for the values
+                valid = _validate_chunk([records[i] for i in kept if i not in bad])
+        if bad:
+            problems = sorted((first_row + i, message) for i, message in bad.items())
+            if self.on_error == "raise":
+                listed = "; ".join(f"row {row}: {message}" for row, message in problems[:5])
+                raise ValueError(f"{len(problems)} invalid rows in {self.path}: {listed}")
+            self.errors.extend(problems)
+        self._seen.update(r["ticket_id"] for r in valid)
+        return valid
+
+    def iter_records(self):
+        """Yield validated ``TicketRecord`` dicts a chunk (list) at a time."""
+        text = _text(self.path, self.block_size, self.prefetch)
+        try:
+            source, plan, rows = self._rows(text)
+            while True:
+                chunk = list(itertools.islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                first_row = self.rows + 1
+                self.rows += len(chunk)
+                yield self._validate(self._map(source, plan, chunk), first_row)
+        finally:
+            text.close()
+
+    def iter_chunks(self, as_store=True):
+        """
+        Yield the file a chunk at a time.
+
+        :param as_store: Yield a TicketStore per chunk (default) or a list of
+            Ticket built without re-validation.
+        """
+        from ticket_store import TicketStore
+        from models import Ticket, construct
+
+        for records in self.iter_records():
+            if as_store:
+                store = TicketStore()
+                store.extend_records(records)
+                yield store
+            else:
+                yield [construct(Ticket, **record) for record in records]
+
+    def load(self, as_store=True):
+        """Import the whole file into one TicketStore or a list of Ticket."""
+        from ticket_store import TicketStore
+        from models import Ticket, construct
+
+        if not as_store:
+            return [construct(Ticket, **r) for records in self.iter_records() for r in records]
+        store = TicketStore()
+        for records in self.iter_records():
+            store.extend_records(records)
+        return store
+
+
+def import_tickets(path, as_store=True, **kwargs):
+    """
+    Import an export file in one call.
+
+    :param kwargs: TicketImporter options.
+    :return: TicketStore, or a list of Ticket with ``as_store=False``.
+    """
+    return TicketImporter(path, **kwargs).load(as_store=as_store)
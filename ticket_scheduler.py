@@ -0,0 +1,169 @@
+"""
+Dependency-aware ordering of ticket backlogs.
+
+``schedule_tickets`` orders a backlog so every ticket comes after the tickets
+it depends on, and otherwise by priority. It never recurses, so arbitrarily
+deep dependency chains are fine, and it runs in O((V + E) log V):
+
+1. An iterative Tarjan pass finds strongly connected components. Any
+   component with more than one ticket (or a ticket depending on itself) is a
+   dependency cycle and is reported; its tickets are kept together and
+   ordered by priority among themselves.
+2. Priorities are inherited along dependencies: a ticket needed by a Critical
+   ticket is scheduled as if it were Critical too.
+3. A Kahn pass over the component graph with a heap keyed by (inherited
+   priority, backlog position) produces the order, and each ticket gets a
+   depth level: 0 without dependencies, otherwise one more than its deepest
+   dependency.
+
+Dependencies on tickets outside the backlog are ignored. If several tickets
+share an id only the first is scheduled.
+"""
+
+import heapq
+from collections import namedtuple
+
+from sprint_planning import PRIORITY_ORDER
+
+
+TicketSchedule = namedtuple("TicketSchedule", "order levels cycles")
+TicketSchedule.__doc__ = """
+Result of ``schedule_tickets``.
+
+:param order: Tickets in dependency-respecting priority order.
+:param levels: Mapping of ticket id to depth level.
+:param cycles: One list of ticket ids per dependency cycle, in backlog order.
+"""
+
+
+def schedule_tickets(tickets):
+    """
+    Order ``tickets`` by dependencies and priority.
+
+    :param tickets: Backlog tickets (``Ticket``, ``TicketView`` or alike).
+    :return: TicketSchedule.
+    """
+    positions = {}
+    unique = []
+    for t in tickets:
+        if t.ticket_id not in positions:
+            positions[t.ticket_id] = len(unique)
+            unique.append(t)
+    n = len(unique)
+    deps = [
+        [positions[d] for d in t.dependencies if d in positions]
+        for t in unique
+    ]
+    rank = [PRIORITY_ORDER.get(t.priority, 5) for t in unique]
+
+    component, components = _strongly_connected(deps)
+    count = len(components)
+
+    # Tarjan emits components dependencies-first. Build the component graph,
+    # each component's own key and the cycles.
+    comp_deps = [None] * count
+    key = [None] * count
+    cycles = []
+    for c, members in enumerate(components):
+        if len(members) == 1:
+            i = members[0]
+            key[c] = (rank[i], i)
+            comp_deps[c] = [component[d] for d in deps[i] if d != i]
+            if len(comp_deps[c]) != len(deps[i]):
+                cycles.append([unique[i].ticket_id])
+            continue
+        members.sort()
+        key[c] = min((rank[i], i) for i in members)
+        comp_deps[c] = list({component[d] for i in members for d in deps[i]} - {c})
+        cycles.append([unique[i].ticket_id for i in members])
+
+    # Inherit priority from dependents (processed dependents-first)
+    effective = [k[0] for k in key]
+    for c in range(count - 1, -1, -1):
+        for d in comp_deps[c]:
+            if effective[c] < effective[d]:
+                effective[d] = effective[c]
+
+    dependents = [[] for _ in range(count)]
+    pending = [len(comp_deps[c]) for c in range(count)]
+    level = [0] * count
+    for c in range(count):
+        for d in comp_deps[c]:
+            dependents[d].append(c)
+
+    ready = [(effective[c], key[c][1], c) for c in range(count) if not pending[c]]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, _, c = heapq.heappop(ready)
+        members = components[c]
+        if len(members) > 1:
+            members.sort(key=lambda i: (rank[i], i))
+        order.extend(unique[i] for i in members)
+        for dependent in dependents[c]:
+            if level[dependent] <= level[c]:
+                level[dependent] = level[c] + 1
+            pending[dependent] -= 1
+            if not pending[dependent]:
+                heapq.heappush(ready, (effective[dependent], key[dependent][1], dependent))
+
+    levels = {unique[i].ticket_id: level[component[i]] for i in range(n)}
+    cycles.sort(key=lambda ids: positions[ids[0]])
+    return TicketSchedule(order, levels, cycles)
+
+
+def _strongly_connected(edges):
+    """
+    Iterative Tarjan's algorithm.
+
+    :param edges: Adjacency lists over nodes ``0..n-1``.
+    :return: ``(component, components)`` where ``component[i]`` is the index
+        of node ``i``'s component and ``components`` lists the members of
+        each, with every component listed after those it has edges to.
+    """
+    n = len(edges)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    component = [-1] * n
+    components = []
+    stack = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge = work.pop()
+            if edge == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            targets = edges[node]
+            while edge < len(targets):
+                target = targets[edge]
+                edge += 1
+                if index[target] == -1:
+                    work.append((node, edge))
+                    work.append((target, 0))
+                    break
+                if on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+            else:
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component[member] = len(components)
+                        members.append(member)
+                        if member == node:
+                            break
+                    components.append(members)
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+    return component, components
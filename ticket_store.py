@@ -0,0 +1,432 @@
+"""
+Compact column-wise storage for large ticket backlogs.
+
+A ``TicketStore`` keeps one typed array per ticket field, interns repeated
+strings (source, priority, category, description, status, assignee) as small
+integer codes and stores dependencies as a flat CSR-style array. It hands out
+``TicketView`` objects that expose the same attributes as ``Ticket``, so
+``sprint_planning``, ``DailyWorkSimulator`` and ``SprintSimulator`` can work on
+them directly. Pydantic ``Ticket`` objects are only built when converting at
+the edges with ``to_tickets()`` / ``TicketView.to_ticket()``.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+import math
+
+
+_NONE = -(2 ** 31)
+_EPOCH = datetime(1970, 1, 1)
+
+
+class _Interner:
+    """Bidirectional mapping between repeated strings and integer codes."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _as_list(values):
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _extend(column, values):
+    """Extend an ``array`` column from a list or a NumPy array."""
+    if hasattr(values, "astype"):
+        column.frombytes(values.astype(column.typecode).tobytes())
+    else:
+        column.extend(values)
+
+
+def _to_seconds(value):
+    return math.nan if value is None else (value - _EPOCH).total_seconds()
+
+
+def _from_seconds(value):
+    return None if math.isnan(value) else _EPOCH + timedelta(seconds=value)
+
+
+class TicketStore:
+    """Column-wise ticket container handing out lightweight views."""
+
+    def __init__(self):
+        self._ids = []
+        self._rows = {}
+        self._sources = _Interner()
+        self._priorities = _Interner()
+        self._categories = _Interner()
+        self._descriptions = _Interner()
+        self._statuses = _Interner()
+        self._assignees = _Interner()
+        self._dep_keys = _Interner()
+
+        self.source = array("H")
+        self.priority = array("B")
+        self.category = array("H")
+        self.description = array("I")
+        self.status = array("B")
+        self.assigned_to = array("i")
+        self.estimated_effort = array("i")
+        self.actual_effort = array("i")
+        self.created_timestamp = array("d")
+        self.completed_timestamp = array("d")
+        self.dep_offsets = array("q", [0])
+        self.dep_values = array("i")
+
+    @classmethod
+    def from_tickets(cls, tickets):
+        """Build a store from ``Ticket`` (or Ticket-like) objects."""
+        store = cls()
+        store.extend(tickets)
+        return store
+
+    def append(
+        self,
+        ticket_id,
+        source,
+        priority,
+        category,
+        description,
+        estimated_effort=None,
+        actual_effort=None,
+        status="Open",
+        assigned_to=None,
+        created_timestamp=None,
+        completed_timestamp=None,
+        dependencies=(),
+    ):
+        """Append one ticket and return its view."""
+        if ticket_id in self._rows:
+            raise ValueError(f"Duplicate ticket id {ticket_id!r}")
+        row = len(self._ids)
+        self._rows[ticket_id] = row
+        self._ids.append(ticket_id)
+        self.source.append(self._sources.code(source))
+        self.priority.append(self._priorities.code(priority))
+        self.category.append(self._categories.code(category))
+        self.description.append(self._descriptions.code(description))
+        self.status.append(self._statuses.code(status))
+        self.assigned_to.append(-1 if assigned_to is None else self._assignees.code(assigned_to))
+        self.estimated_effort.append(_NONE if estimated_effort is None else estimated_effort)
+        self.actual_effort.append(_NONE if actual_effort is None else actual_effort)
+        self.created_timestamp.append(_to_seconds(created_timestamp))
+        self.completed_timestamp.append(_to_seconds(completed_timestamp))
+        self.dep_values.extend(self._dep_keys.code(dep) for dep in dependencies)
+        self.dep_offsets.append(len(self.dep_values))
+        return TicketView(self, row)
+
+    def extend(self, tickets):
+        """Append every ticket in ``tickets``."""
+        for t in tickets:
+            self.append(
+                t.ticket_id,
+                t.source,
+                t.priority,
+                t.category,
+                t.description,
+                estimated_effort=t.estimated_effort,
+                actual_effort=t.actual_effort,
+                status=t.status,
+                assigned_to=t.assigned_to,
+                created_timestamp=t.created_timestamp,
+                completed_timestamp=t.completed_timestamp,
+                dependencies=t.dependencies,
+            )
+
+    def extend_records(self, records):
+        """
+        Bulk-append tickets given as dicts of ``append``'s keyword fields,
+        e.g. validated import records, filling one column at a time.
+        """
+        start = len(self._ids)
+        ids = [r["ticket_id"] for r in records]
+        for offset, ticket_id in enumerate(ids):
+            if self._rows.setdefault(ticket_id, start + offset) != start + offset:
+                raise ValueError(f"Duplicate ticket id {ticket_id!r}")
+        self._ids.extend(ids)
+
+        for column, table, field in (
+            (self.source, self._sources, "source"),
+            (self.priority, self._priorities, "priority"),
+            (self.category, self._categories, "category"),
+            (self.description, self._descriptions, "description"),
+        ):
+            code = table.code
+            column.extend([code(r[field]) for r in records])
+        code = self._statuses.code
+        self.status.extend([code(r.get("status", "Open")) for r in records])
+        code = self._assignees.code
+        self.assigned_to.extend([-1 if r.get("assigned_to") is None else code(r["assigned_to"]) for r in records])
+        for column, field in ((self.estimated_effort, "estimated_effort"), (self.actual_effort, "actual_effort")):
+            column.extend([_NONE if r.get(field) is None else r[field] for r in records])
+        for column, field in (
+            (self.created_timestamp, "created_timestamp"),
+            (self.completed_timestamp, "completed_timestamp"),
+        ):
+            column.extend([_to_seconds(r.get(field)) for r in records])
+
+        code = self._dep_keys.code
+        for r in records:
+            dependencies = r.get("dependencies")
+            if dependencies:
+                self.dep_values.extend([code(dep) for dep in dependencies])
+            self.dep_offsets.append(len(self.dep_values))
+
+    def extend_columns(
+        self,
+        ticket_ids,
+        source,
+        priority,
+        category,
+        description,
+        estimated_effort,
+        created_timestamp,
+        dep_offsets,
+        dep_ids,
+    ):
+        """
+        Bulk-append open, unassigned tickets from pre-coded columns.
+
+        String fields are given as ``(values, codes)`` pairs where ``codes``
+        index into ``values``; numeric columns and ``codes`` may be NumPy
+        arrays. Dependencies are a local CSR pair: ``dep_offsets`` (length
+        ``len(ticket_ids) + 1``, starting at 0) into the flat ``dep_ids``.
+        """
+        n = len(ticket_ids)
+        start = len(self._ids)
+        for offset, ticket_id in enumerate(ticket_ids):
+            if self._rows.setdefault(ticket_id, start + offset) != start + offset:
+                raise ValueError(f"Duplicate ticket id {ticket_id!r}")
+        self._ids.extend(ticket_ids)
+
+        for column, table, (values, codes) in (
+            (self.source, self._sources, source),
+            (self.priority, self._priorities, priority),
+            (self.category, self._categories, category),
+            (self.description, self._descriptions, description),
+        ):
+            mapping = [table.code(v) for v in values]
+            _extend(column, [mapping[c] for c in _as_list(codes)])
+
+        _extend(self.estimated_effort, estimated_effort)
+        _extend(self.created_timestamp, created_timestamp)
+        self.status.extend([self._statuses.code("Open")] * n)
+        self.assigned_to.extend([-1] * n)
+        self.actual_effort.extend([_NONE] * n)
+        self.completed_timestamp.extend([math.nan] * n)
+
+        base = len(self.dep_values)
+        self.dep_values.extend(self._dep_keys.code(dep) for dep in dep_ids)
+        _extend(self.dep_offsets, [base + o for o in _as_list(dep_offsets)[1:]])
+
+    COLUMNS = (
+        "source", "priority", "category", "description", "status", "assigned_to",
+        "estimated_effort", "actual_effort", "created_timestamp", "completed_timestamp",
+        "dep_offsets", "dep_values",
+    )
+    TABLES = (
+        "_sources", "_priorities", "_categories", "_descriptions", "_statuses",
+        "_assignees", "_dep_keys",
+    )
+
+    def state(self):
+        """
+        Return the store's raw state for serialization: ticket ids, the
+        interned string tables by name and the typed columns by name.
+        """
+        tables = {name: getattr(self, name).values for name in self.TABLES}
+        columns = {name: getattr(self, name) for name in self.COLUMNS}
+        return self._ids, tables, columns
+
+    @classmethod
+    def from_state(cls, ids, tables, columns):
+        """Rebuild a store from ``state()`` output; columns are copied."""
+        store = cls()
+        store._ids = list(ids)
+        store._rows = dict(zip(store._ids, range(len(store._ids))))
+        for name in cls.TABLES:
+            table = getattr(store, name)
+            table.values = list(tables[name])
+            table.codes = dict(zip(table.values, range(len(table.values))))
+        for name in cls.COLUMNS:
+            column = getattr(store, name)
+            del column[:]
+            column.frombytes(columns[name])
+        return store
+
+    def copy(self):
+        """Return an independent copy, e.g. to work one backlog in several simulations."""
+        ids, tables, columns = self.state()
+        return self.from_state(ids, tables, {name: column.tobytes() for name, column in columns.items()})
+
+    def to_tickets(self):
+        """Materialize every row as a pydantic ``Ticket``."""
+        return [TicketView(self, row).to_ticket() for row in range(len(self._ids))]
+
+    def views(self):
+        """Return a list of views, e.g. to use as a sprint backlog."""
+        return [TicketView(self, row) for row in range(len(self._ids))]
+
+    def get(self, ticket_id):
+        """Return the view for ``ticket_id`` or ``None``."""
+        row = self._rows.get(ticket_id)
+        return None if row is None else TicketView(self, row)
+
+    def dependencies_of(self, row):
+        """Return the dependency ids of ``row`` as a tuple."""
+        keys = self._dep_keys.values
+        return tuple(
+            keys[code] for code in self.dep_values[self.dep_offsets[row]:self.dep_offsets[row + 1]]
+        )
+
+    def nbytes(self):
+        """Approximate bytes held by the typed columns and string tables."""
+        columns = (
+            self.source, self.priority, self.category, self.description, self.status,
+            self.assigned_to, self.estimated_effort, self.actual_effort,
+            self.created_timestamp, self.completed_timestamp, self.dep_offsets, self.dep_values,
+        )
+        total = sum(col.itemsize * len(col) for col in columns)
+        tables = (
+            self._ids, self._sources.values, self._priorities.values, self._categories.values,
+            self._descriptions.values, self._statuses.values, self._assignees.values,
+            self._dep_keys.values,
+        )
+        return total + sum(len(s) for table in tables for s in table)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self._ids)
+        if not 0 <= row < len(self._ids):
+            raise IndexError(row)
+        return TicketView(self, row)
+
+    def __iter__(self):
+        return (TicketView(self, row) for row in range(len(self._ids)))
+
+    def __contains__(self, ticket_id):
+        return ticket_id in self._rows
+
+
+def _coded(column, table):
+    """Property reading/writing a string field stored as an interned code."""
+
+    def fget(self):
+        return getattr(self._store, table).values[getattr(self._store, column)[self._row]]
+
+    def fset(self, value):
+        getattr(self._store, column)[self._row] = getattr(self._store, table).code(value)
+
+    return property(fget, fset)
+
+
+def _optional_int(column):
+    def fget(self):
+        value = getattr(self._store, column)[self._row]
+        return None if value == _NONE else value
+
+    def fset(self, value):
+        getattr(self._store, column)[self._row] = _NONE if value is None else value
+
+    return property(fget, fset)
+
+
+def _timestamp(column):
+    def fget(self):
+        return _from_seconds(getattr(self._store, column)[self._row])
+
+    def fset(self, value):
+        getattr(self._store, column)[self._row] = _to_seconds(value)
+
+    return property(fget, fset)
+
+
+class TicketView:
+    """Ticket-compatible view of one row of a ``TicketStore``."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    @property
+    def ticket_id(self):
+        return self._store._ids[self._row]
+
+    @property
+    def store(self):
+        return self._store
+
+    @property
+    def row(self):
+        return self._row
+
+    source = _coded("source", "_sources")
+    priority = _coded("priority", "_priorities")
+    category = _coded("category", "_categories")
+    description = _coded("description", "_descriptions")
+    status = _coded("status", "_statuses")
+    estimated_effort = _optional_int("estimated_effort")
+    actual_effort = _optional_int("actual_effort")
+    created_timestamp = _timestamp("created_timestamp")
+    completed_timestamp = _timestamp("completed_timestamp")
+
+    @property
+    def assigned_to(self):
+        code = self._store.assigned_to[self._row]
+        return None if code < 0 else self._store._assignees.values[code]
+
+    @assigned_to.setter
+    def assigned_to(self, value):
+        self._store.assigned_to[self._row] = -1 if value is None else self._store._assignees.code(value)
+
+    @property
+    def dependencies(self):
+        return self._store.dependencies_of(self._row)
+
+    def to_ticket(self):
+        """Convert this row into a pydantic ``Ticket``."""
+        from models import Ticket, construct
+
+        return construct(
+            Ticket,
+            ticket_id=self.ticket_id,
+            source=self.source,
+            priority=self.priority,
+            category=self.category,
+            description=self.description,
+            estimated_effort=self.estimated_effort,
+            actual_effort=self.actual_effort,
+            status=self.status,
+            assigned_to=self.assigned_to,
+            created_timestamp=self.created_timestamp,
+            completed_timestamp=self.completed_timestamp,
+            dependencies=list(self.dependencies),
+        )
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, TicketView)
+            and other._store is self._store
+            and other._row == self._row
+        )
+
+    def __hash__(self):
+        return hash((id(self._store), self._row))
+
+    def __repr__(self):
+        return f"TicketView(ticket_id={self.ticket_id!r}, priority={self.priority!r}, status={self.status!r})"
@@ -1,28 +1,19 @@
 """
 Module defining Ticket model and TicketGenerator for sprint simulation.
+
+``Ticket`` lives in ``models`` and is only imported when first accessed, so
+importing the generator does not load pydantic.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional
 from datetime import datetime, timedelta
 import random
 
 
-class Ticket(BaseModel):
-    """
-    Representation of a work ticket.
-    """
-    ticket_id: str
-    source: str  # 'ServiceNow' or 'Jira'
-    priority: str  # 'Critical', 'High', 'Medium', 'Low'
-    category: str
-    description: str
-    estimated_effort: Optional[int] = None
-    actual_effort: Optional[int] = None
-    status: str = 'Open'
-    assigned_to: Optional[str] = None
-    created_timestamp: Optional[datetime] = None
-    completed_timestamp: Optional[datetime] = None
-    dependencies: List[str] = Field(default_factory=list)
+def __getattr__(name):
+    if name == "Ticket":
+        from models import Ticket
+
+        return Ticket
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class TicketGenerator:
@@ -66,14 +57,177 @@ class TicketGenerator:
     MIX_DISTRIBUTION = {'operations': 0.60, 'incidents': 0.25, 'projects': 0.15}
     PRIORITY_LEVELS = ['Critical', 'High', 'Medium', 'Low']
     PRIORITY_WEIGHTS = [0.10, 0.20, 0.50, 0.20]
+    # Base story points by kind, before the priority bump
+    EFFORT_RANGES = {'operations': (1, 3), 'incidents': (2, 5), 'projects': (3, 8)}
+    # Tickets per random block in generate_bulk
+    BULK_BLOCK = 8192
+
+    def __init__(self, rng=None):
+        """
+        :param rng: Optional ``random.Random`` instance; defaults to the global
+            ``random`` module so existing seeding keeps working.
+        """
+        self.rng = rng if rng is not None else random
 
-    def generate_realistic_tickets(self, count, ticket_types=None):
+    def generate_realistic_tickets(self, count, ticket_types=None, id_prefix=''):
         """
         Generate a set of realistic tickets with mixed categories and priorities.
 
         :param count: Number of tickets to generate.
         :param ticket_types: Optional dict overriding default templates.
-        :return: List of Ticket instances.
+        :param id_prefix: Prepended to every ticket id (and dependency), e.g.
+            to keep batches generated at different times apart.
+        :return: List of Ticket instances. The generated fields are valid by
+            construction, so the models are built without validation, unless
+            caller-supplied ``ticket_types`` provide categories and
+            descriptions.
+        """
+        from models import Ticket, construct
+
+        fields = self._draw_ticket_fields(count, ticket_types, id_prefix)
+        if ticket_types:
+            return [Ticket(**f) for f in fields]
+        return [construct(Ticket, **f) for f in fields]
+
+    def generate_ticket_store(self, count, ticket_types=None, id_prefix=''):
+        """
+        Generate the same tickets as ``generate_realistic_tickets`` straight
+        into a column-wise ``TicketStore``, skipping per-ticket pydantic models.
+
+        :param count: Number of tickets to generate.
+        :param ticket_types: Optional dict overriding default templates.
+        :param id_prefix: Prepended to every ticket id, as in
+            ``generate_realistic_tickets``.
+        :return: TicketStore holding the generated tickets.
+        """
+        from ticket_store import TicketStore
+
+        store = TicketStore()
+        for fields in self._draw_ticket_fields(count, ticket_types, id_prefix):
+            store.append(**fields)
+        return store
+
+    def generate_bulk(self, count, seed=None, ticket_types=None, as_store=True, epoch=None):
+        """
+        Generate a whole backlog with vectorized NumPy draws.
+
+        Priorities, templates, efforts, creation offsets and dependencies are
+        drawn per block of ``BULK_BLOCK`` tickets from a NumPy generator seeded
+        with ``(seed, block)``, so the output only depends on ``seed`` and
+        ``count`` and matches ``iter_ticket_chunks`` for any chunk size. The
+        ticket mix, id scheme, effort ranges and 10% dependency rate are the
+        same as ``generate_realistic_tickets``; dependencies may point at any
+        ticket in the backlog.
+
+        :param count: Number of tickets to generate.
+        :param seed: Integer seed; drawn from ``self.rng`` when omitted.
+        :param ticket_types: Optional dict overriding default templates.
+        :param as_store: Return a TicketStore (default) or a list of Ticket.
+        :param epoch: Base creation time (a datetime, or a date for its
+            midnight); defaults to now.
+        """
+        from ticket_store import TicketStore
+
+        store = TicketStore()
+        for chunk in self._iter_bulk_columns(count, count or 1, seed, ticket_types, epoch):
+            store.extend_columns(**chunk)
+        return store if as_store else store.to_tickets()
+
+    def iter_ticket_chunks(self, count, chunk_size=10000, seed=None, ticket_types=None, epoch=None):
+        """
+        Stream a ``count``-ticket backlog as TicketStore chunks.
+
+        Memory stays proportional to ``chunk_size`` however large ``count``
+        is. Concatenated, the chunks equal ``generate_bulk`` with the same
+        ``seed``.
+
+        :return: Iterator of TicketStore objects of up to ``chunk_size`` tickets.
+        """
+        from ticket_store import TicketStore
+
+        for chunk in self._iter_bulk_columns(count, chunk_size, seed, ticket_types, epoch):
+            store = TicketStore()
+            store.extend_columns(**chunk)
+            yield store
+
+    def _iter_bulk_columns(self, count, chunk_size, seed, ticket_types, epoch):
+        """Yield ``TicketStore.extend_columns`` keyword arguments per chunk."""
+        import numpy as np
+        from log_utils import to_seconds
+
+        if seed is None:
+            seed = self.rng.getrandbits(63)
+        base_seconds = to_seconds(epoch or datetime.now())
+        kinds = ('operations', 'incidents', 'projects')
+        defaults = (self.OPERATION_TEMPLATES, self.INCIDENT_TEMPLATES, self.PROJECT_TEMPLATES)
+        templates = [
+            (ticket_types or {}).get(kind, default) for kind, default in zip(kinds, defaults)
+        ]
+        # Flatten templates of all kinds into one table addressed by offset
+        template_offsets = np.cumsum([0] + [len(t) for t in templates])
+        flat = [tpl for group in templates for tpl in group]
+        categories = [tpl['category'] for tpl in flat]
+        descriptions = [tpl['description'] for tpl in flat]
+        low = np.array([self.EFFORT_RANGES[k][0] for k in kinds])
+        high = np.array([self.EFFORT_RANGES[k][1] for k in kinds])
+        bump = np.array([2, 1, 0, 0])  # Critical, High, Medium, Low
+        weights = np.array(self.PRIORITY_WEIGHTS) / sum(self.PRIORITY_WEIGHTS)
+
+        n_ops = int(count * self.MIX_DISTRIBUTION['operations'])
+        n_inc = int(count * self.MIX_DISTRIBUTION['incidents'])
+        n_snw = n_ops + n_inc
+
+        def ticket_ids(index):
+            return [
+                f'SNW-{1000 + i}' if i < n_snw else f'JIRA-{2000 + i - n_snw}' for i in index.tolist()
+            ]
+
+        def draw_block(block):
+            lo = block * self.BULK_BLOCK
+            index = np.arange(lo, min(lo + self.BULK_BLOCK, count))
+            n = len(index)
+            rng = np.random.default_rng((seed, block))
+            kind = (index >= n_ops).astype(np.int8) + (index >= n_snw)
+            sizes = np.diff(template_offsets)[kind]
+            template = template_offsets[kind] + (rng.random(n) * sizes).astype(np.int64)
+            priority = rng.choice(len(weights), size=n, p=weights)
+            effort = rng.integers(low[kind], high[kind] + 1) + bump[priority]
+            created = base_seconds + 60 * rng.integers(0, 121, size=n)
+            has_dep = rng.random(n) < 0.10
+            dep = rng.integers(0, count, size=n)
+            has_dep &= dep != index
+            return index, template, priority, effort, created, has_dep, dep
+
+        block_cache = {}
+        for start in range(0, count, chunk_size):
+            stop = min(start + chunk_size, count)
+            parts = []
+            for block in range(start // self.BULK_BLOCK, (stop - 1) // self.BULK_BLOCK + 1):
+                if block not in block_cache:
+                    block_cache.clear()
+                    block_cache[block] = draw_block(block)
+                columns = block_cache[block]
+                lo = block * self.BULK_BLOCK
+                sl = slice(max(start, lo) - lo, min(stop, lo + self.BULK_BLOCK) - lo)
+                parts.append([c[sl] for c in columns])
+            index, template, priority, effort, created, has_dep, dep = (
+                np.concatenate(c) for c in zip(*parts)
+            )
+            yield {
+                'ticket_ids': ticket_ids(index),
+                'source': (['ServiceNow', 'Jira'], (index >= n_snw).astype(np.int8)),
+                'priority': (self.PRIORITY_LEVELS, priority),
+                'category': (categories, template),
+                'description': (descriptions, template),
+                'estimated_effort': effort,
+                'created_timestamp': created.astype(np.float64),
+                'dep_offsets': np.concatenate(([0], np.cumsum(has_dep))),
+                'dep_ids': ticket_ids(dep[has_dep]),
+            }
+
+    def _draw_ticket_fields(self, count, ticket_types=None, id_prefix=''):
+        """
+        Draw the field values for a batch of tickets, dependencies included.
         """
         # Allow custom templates or use defaults
         ops_tpl = ticket_types.get('operations', self.OPERATION_TEMPLATES) if ticket_types else self.OPERATION_TEMPLATES
@@ -89,51 +243,50 @@ class TicketGenerator:
         # ID counters
         snw_id = 1000
         jira_id = 2000
+        now = datetime.now()
 
         def make_ticket(template, kind):
             nonlocal snw_id, jira_id
             if kind in ('operations', 'incidents'):
                 source = 'ServiceNow'
-                ticket_id = f'SNW-{snw_id}'
+                ticket_id = f'{id_prefix}SNW-{snw_id}'
                 snw_id += 1
             else:
                 source = 'Jira'
-                ticket_id = f'JIRA-{jira_id}'
+                ticket_id = f'{id_prefix}JIRA-{jira_id}'
                 jira_id += 1
 
-            priority = random.choices(self.PRIORITY_LEVELS, weights=self.PRIORITY_WEIGHTS, k=1)[0]
-            category = template['category']
-            description = template['description']
+            priority = self.rng.choices(self.PRIORITY_LEVELS, weights=self.PRIORITY_WEIGHTS, k=1)[0]
             est = self._estimate_effort(kind, priority)
 
-            t = Ticket(
-                ticket_id=ticket_id,
-                source=source,
-                priority=priority,
-                category=category,
-                description=description,
-                estimated_effort=est,
-            )
-            t.created_timestamp = datetime.now() + timedelta(minutes=random.randint(0, 120))
-            return t
+            return {
+                'ticket_id': ticket_id,
+                'source': source,
+                'priority': priority,
+                'category': template['category'],
+                'description': template['description'],
+                'estimated_effort': est,
+                'created_timestamp': now + timedelta(minutes=self.rng.randint(0, 120)),
+                'dependencies': [],
+            }
 
         # Generate each bucket
         for _ in range(n_ops):
-            tmpl = random.choice(ops_tpl)
+            tmpl = self.rng.choice(ops_tpl)
             tickets.append(make_ticket(tmpl, 'operations'))
         for _ in range(n_inc):
-            tmpl = random.choice(inc_tpl)
+            tmpl = self.rng.choice(inc_tpl)
             tickets.append(make_ticket(tmpl, 'incidents'))
         for _ in range(n_proj):
-            tmpl = random.choice(proj_tpl)
+            tmpl = self.rng.choice(proj_tpl)
             tickets.append(make_ticket(tmpl, 'projects'))
 
         # Assign random dependencies (10% chance)
         for t in tickets:
-            if random.random() < 0.10:
-                dep = random.choice(tickets)
-                if dep.ticket_id != t.ticket_id:
-                    t.dependencies.append(dep.ticket_id)
+            if self.rng.random() < 0.10:
+                dep = self.rng.choice(tickets)
+                if dep['ticket_id'] != t['ticket_id']:
+                    t['dependencies'].append(dep['ticket_id'])
 
         return tickets
 
@@ -141,13 +294,7 @@ class TicketGenerator:
         """
         Estimate story points based on ticket kind and priority.
         """
-        # Base ranges by type
-        if kind == 'operations':
-            base = random.randint(1, 3)
-        elif kind == 'incidents':
-            base = random.randint(2, 5)
-        else:
-            base = random.randint(3, 8)
+        base = self.rng.randint(*self.EFFORT_RANGES[kind])
 
         # Priority bump for urgent work
         if priority == 'Critical':
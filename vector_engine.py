@@ -0,0 +1,234 @@
+"""
+Vectorized NumPy engine for SprintSimulator.
+
+Ticket state (status, priority, category, estimated/actual effort, assignee)
+lives in parallel arrays, and each simulated day runs dependency checks,
+assignment, effort estimation and closing as batched array operations. The
+engine mirrors the object engine's rules exactly, so the resulting tickets,
+team workloads and ``generate_metrics_report()`` output are the same. Outcome
+events (blocks, completions, escalations, after-hours work) are appended to
+the shared EventLog in bulk; the intra-day planning/start/wrap-up timeline is
+not simulated.
+"""
+
+import numpy as np
+
+from daily_work_simulator import DailyWorkSimulator
+from events import EventKind, EventLog
+from sprint_planning import PRIORITY_ORDER
+
+
+OPEN, ASSIGNED, IN_PROGRESS, BLOCKED, CLOSED, OTHER = range(6)
+STATUS_CODES = {
+    "Open": OPEN,
+    "Assigned": ASSIGNED,
+    "In Progress": IN_PROGRESS,
+    "Blocked": BLOCKED,
+    "Closed": CLOSED,
+}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+
+class VectorSprintEngine:
+    """Array-backed day simulation for a fixed backlog and team."""
+
+    def __init__(
+        self, capabilities, backlog, completed_work=(), events=None, escalation_threshold=None, external=()
+    ):
+        """
+        :param capabilities: CapabilityIndex for the team working the backlog.
+        :param backlog: Tickets still in the sprint backlog.
+        :param completed_work: Tickets already moved out of the backlog.
+        :param events: EventLog receiving the engine's events.
+        :param escalation_threshold: Effort above which members with skill
+            below 6 escalate; defaults to DailyWorkSimulator's threshold.
+        :param external: Ids of open tickets owned elsewhere that block their
+            dependents until ``resolve_external`` is called.
+        """
+        if escalation_threshold is None:
+            escalation_threshold = DailyWorkSimulator.ESCALATION_THRESHOLD
+        if events is None:
+            events = EventLog()
+        self.events = events
+        self.tickets = list(backlog)
+        self.threshold = escalation_threshold
+        n = len(self.tickets)
+
+        index = {t.ticket_id: i for i, t in enumerate(self.tickets)}
+        lookup = {t.ticket_id: t for t in completed_work}
+        lookup.update((t.ticket_id, t) for t in self.tickets)
+
+        categories = {}
+        bases = {}
+        self.status = np.empty(n, dtype=np.int8)
+        self.category = np.empty(n, dtype=np.int32)
+        self.base = np.empty(n, dtype=np.int32)
+        self.rank = np.empty(n, dtype=np.int8)
+        self.has_deps = np.empty(n, dtype=bool)
+        self.external_open = np.zeros(n, dtype=np.int32)
+        self.actual = np.full(n, -1, dtype=np.int32)
+        self.assignee = np.full(n, -1, dtype=np.int32)
+        self.assignments = self.escalations = 0
+        self.ticket_codes = np.array(
+            [events.ticket_code(t.ticket_id) for t in self.tickets], dtype=np.int32
+        )
+        owners, targets = [], []
+        self._initially_blocked = []
+        self._external_owners = {}
+
+        for i, t in enumerate(self.tickets):
+            self.status[i] = STATUS_CODES.get(t.status, OTHER)
+            self.category[i] = categories.setdefault(t.category, len(categories))
+            self.base[i] = bases.setdefault(t.estimated_effort or 1, len(bases))
+            self.rank[i] = PRIORITY_ORDER.get(t.priority, 5)
+            self.has_deps[i] = bool(t.dependencies)
+            for dep in t.dependencies:
+                if dep in index:
+                    owners.append(i)
+                    targets.append(index[dep])
+                elif dep in lookup and lookup[dep].status != "Closed":
+                    self.external_open[i] += 1
+                elif dep not in lookup and dep in external:
+                    self.external_open[i] += 1
+                    self._external_owners.setdefault(dep, []).append(i)
+            if t.status != "Closed":
+                waiting_on = tuple(
+                    dep for dep in t.dependencies
+                    if (dep in lookup and lookup[dep].status != "Closed")
+                    or (dep not in lookup and dep in external)
+                )
+                if waiting_on:
+                    self._initially_blocked.append((t.ticket_id, waiting_on))
+
+        self.dep_owner = np.asarray(owners, dtype=np.intp)
+        self.dep_target = np.asarray(targets, dtype=np.intp)
+        self.moved = np.zeros(n, dtype=bool)
+
+        self.categories = list(categories)
+        self.bases = list(bases)
+        self.set_capabilities(capabilities)
+
+    def set_capabilities(self, capabilities):
+        """Load first capable member, first senior and member x effort tables."""
+        self.capabilities = capabilities
+        self.team = capabilities.team
+        self.member_codes = np.array(
+            [self.events.member_code(m.name) for m in self.team], dtype=np.int32
+        )
+
+        def first(category, senior):
+            member = capabilities.first_capable(category, senior=senior)
+            return -1 if member is None else capabilities.position(member)
+
+        self.first_capable = np.array([first(c, False) for c in self.categories], dtype=np.intp)
+        self.first_senior = np.array([first(c, True) for c in self.categories], dtype=np.intp)
+        self.effort = np.zeros((len(self.team), max(1, len(self.bases))), dtype=np.int32)
+        for b, base in enumerate(self.bases):
+            self.effort[:, b] = capabilities.efforts(base)
+        self.low_skill = np.array([m.skill_level < 6 for m in self.team], dtype=bool)
+
+    def resolve_external(self, ticket_ids):
+        """Record that external tickets closed; dependents unblock next day."""
+        for ticket_id in ticket_ids:
+            for i in self._external_owners.pop(ticket_id, ()):
+                self.external_open[i] -= 1
+
+    def simulate_day(self, day):
+        """
+        Advance every ticket by one day.
+
+        Afterwards ``assignments`` and ``escalations`` hold the day's counts.
+
+        :param day: Day index.
+        :return: Closed tickets not yet reported, in backlog order.
+        """
+        status = self.status
+        before = status.copy()
+        n = len(status)
+
+        # Tickets only become blocked when the engine is built; afterwards
+        # dependencies can only resolve.
+        for ticket_id, waiting_on in self._initially_blocked:
+            self.events.emit(day, EventKind.BLOCKED, ticket=ticket_id, detail=waiting_on)
+        self._initially_blocked = []
+
+        active = status != CLOSED
+        unresolved = self.external_open + np.bincount(
+            self.dep_owner, weights=status[self.dep_target] != CLOSED, minlength=n
+        ).astype(np.int32)
+        blocked = active & (unresolved > 0)
+        status[blocked] = BLOCKED
+        status[active & self.has_deps & ~blocked & (before == BLOCKED)] = OPEN
+
+        ready = np.flatnonzero(status == OPEN)
+        # Work ready tickets in priority order, backlog order breaking ties
+        ready = ready[np.argsort(self.rank[ready], kind="stable")]
+        member = self.first_capable[self.category[ready]]
+        assigned = member >= 0
+        ready, member = ready[assigned], member[assigned]
+        effort = self.effort[member, self.base[ready]]
+        escalate = self.low_skill[member] & (effort > self.threshold)
+
+        done, done_by, done_effort = ready[~escalate], member[~escalate], effort[~escalate]
+        escalated, escalated_from = ready[escalate], member[escalate]
+        self.assignments = len(ready)
+        self.escalations = len(escalated)
+        # Seniors work handoffs after everyone's own queue, grouped by who escalated
+        order = np.argsort(escalated_from, kind="stable")
+        escalated, escalated_from = escalated[order], escalated_from[order]
+        senior = self.first_senior[self.category[escalated]]
+        taken = senior >= 0
+        handoff = escalated[taken]
+        handoff_by = senior[taken]
+        handoff_effort = self.effort[handoff_by, self.base[handoff]]
+
+        status[escalated] = OPEN
+        self.assignee[escalated] = -1
+        for rows, by, eff in ((done, done_by, done_effort), (handoff, handoff_by, handoff_effort)):
+            status[rows] = CLOSED
+            self.actual[rows] = eff
+            self.assignee[rows] = by
+
+        self._emit(day, ready, member, done, done_by, escalated, escalated_from, handoff, handoff_by)
+        self._write_back(before, escalated, (done, done_by), (handoff, handoff_by))
+
+        closing = np.flatnonzero((status == CLOSED) & ~self.moved)
+        self.moved[closing] = True
+        return [self.tickets[i] for i in closing]
+
+    def _emit(self, day, ready, member, done, done_by, escalated, escalated_from, handoff, handoff_by):
+        """Append the day's outcome events in bulk."""
+        events, codes, members = self.events, self.ticket_codes, self.member_codes
+
+        order = np.argsort(done_by, kind="stable")
+        events.emit_batch(
+            day, EventKind.COMPLETED, members[done_by[order]], codes[done[order]], self.actual[done[order]]
+        )
+        events.emit_batch(day, EventKind.ESCALATED, members[escalated_from], codes[escalated])
+        # One after-hours response per member work pass that included critical tickets
+        for m in np.unique(member[self.rank[ready] == 1]):
+            events.emit(day, EventKind.AFTER_HOURS, member=self.team[m].name)
+
+        events.emit_batch(day, EventKind.COMPLETED, members[handoff_by], codes[handoff], self.actual[handoff])
+        for m in np.unique(handoff_by[self.rank[handoff] == 1]):
+            events.emit(day, EventKind.AFTER_HOURS, member=self.team[m].name)
+
+    def _write_back(self, before, escalated, *closed_batches):
+        """Copy changed array state onto the Ticket and TeamMember objects."""
+        tickets, team = self.tickets, self.team
+        for i in np.flatnonzero(self.status != before):
+            tickets[i].status = STATUS_NAMES[int(self.status[i])]
+        for i in escalated.tolist():
+            tickets[i].assigned_to = None
+
+        workload = np.zeros(len(team), dtype=np.int64)
+        for rows, by in closed_batches:
+            np.add.at(workload, by, self.actual[rows])
+            for i, m in zip(rows.tolist(), by.tolist()):
+                ticket = tickets[i]
+                ticket.actual_effort = int(self.actual[i])
+                ticket.assigned_to = team[m].name
+                team[m].completed_tickets.append(ticket.ticket_id)
+
+        for m in np.flatnonzero(workload):
+            team[m].current_workload += int(workload[m])